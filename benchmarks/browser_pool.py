@@ -0,0 +1,122 @@
+"""Compare one browser launch per page with the shared BrowserPool, on local fixtures.
+
+Run from the repository root (needs ``python -m playwright install chromium``)::
+
+    python -m benchmarks.browser_pool --pages 30 --max_pages 6
+
+A threaded HTTP server on localhost serves generated post pages (a caption
+and ``--comments`` comments each) for three fake platforms. The script reads
+the comments from every page twice: launching Chromium for each page, as the
+old ``open_session`` helpers did per platform, and through one
+:class:`BrowserPool` with pooled pages, then checks both read the same text.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+from playwright.async_api import Page, async_playwright
+
+from src.collectors.browser_pool import BrowserPool
+
+PLATFORMS = ("facebook", "instagram", "tiktok")
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serve ``/<platform>/<post>`` as a post page with ``comments`` list items."""
+
+    protocol_version = "HTTP/1.1"
+    comments = 20
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        platform, _, post = self.path.strip("/").partition("/")
+        items = "".join(
+            f'<li class="comment">{escape(platform)} fan {index}: Go Mavs! ({escape(post)})</li>'
+            for index in range(self.comments)
+        )
+        body = (
+            f"<html><body><article><p class='caption'>Maverick Stampede {escape(post)}</p>"
+            f"<ul>{items}</ul></article></body></html>"
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@contextmanager
+def fixture_server(comments: int) -> Iterator[str]:
+    FixtureHandler.comments = comments
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+async def read_comments(page: Page) -> list[str]:
+    return await page.locator("li.comment").all_inner_texts()
+
+
+async def launch_per_page(urls: dict[str, list[str]]) -> dict[str, list[list[str]]]:
+    results: dict[str, list[list[str]]] = {}
+    async with async_playwright() as playwright:
+        for platform, platform_urls in urls.items():
+            results[platform] = []
+            for url in platform_urls:
+                browser = await playwright.chromium.launch(headless=True)
+                context = await browser.new_context()
+                page = await context.new_page()
+                await page.goto(url)
+                results[platform].append(await read_comments(page))
+                await browser.close()
+    return results
+
+
+async def pooled(urls: dict[str, list[str]], max_pages: int, state_dir: str) -> dict[str, list[list[str]]]:
+    async with BrowserPool(state_dir=state_dir, max_pages=max_pages) as pool:
+        visits = [pool.visit(platform, platform_urls, read_comments) for platform, platform_urls in urls.items()]
+        return dict(zip(urls, await asyncio.gather(*visits)))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark BrowserPool against a browser per page")
+    parser.add_argument("--pages", type=int, default=30, help="Pages per run, split across the platforms")
+    parser.add_argument("--comments", type=int, default=20)
+    parser.add_argument("--max_pages", type=int, default=6)
+    args = parser.parse_args(argv)
+
+    with fixture_server(args.comments) as base, tempfile.TemporaryDirectory() as state_dir:
+        urls = {
+            platform: [f"{base}/{platform}/post-{index}" for index in range(args.pages // len(PLATFORMS))]
+            for platform in PLATFORMS
+        }
+        started = time.perf_counter()
+        expected = asyncio.run(launch_per_page(urls))
+        print(f"browser per page   {time.perf_counter() - started:6.2f}s")
+
+        started = time.perf_counter()
+        actual = asyncio.run(pooled(urls, args.max_pages, state_dir))
+        print(f"pooled ({args.max_pages} pages)   {time.perf_counter() - started:6.2f}s")
+
+    if actual != expected:
+        raise SystemExit("FAIL: the pooled run read different comments")
+
+
+if __name__ == "__main__":
+    main()
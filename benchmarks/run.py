@@ -0,0 +1,257 @@
+"""Time and memory-profile every pipeline stage on synthetic exports.
+
+Run from the repository root::
+
+    python -m benchmarks.run --sizes 10000 100000 1000000
+    python -m benchmarks.run --sizes 10000 --compare benchmarks/results/<older>.json
+
+Each stage runs per size in a scratch directory. Results (seconds and peak
+traced memory per stage, plus the size of the normalized and classified
+frames against plain object columns) are printed and written as JSON, by default to
+``benchmarks/results/<git commit>.json``, so runs can be compared across
+commits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from argparse import Namespace
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+import yaml
+
+from benchmarks.synthetic import HitRates, write_exports
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = REPO_ROOT / "benchmarks" / "results"
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+@contextmanager
+def _workspace():
+    """Scratch directory holding a config and keyword list, used as the cwd."""
+
+    previous = Path.cwd()
+    with tempfile.TemporaryDirectory(prefix="mavstampede-bench-") as tmp:
+        work = Path(tmp)
+        config_source = REPO_ROOT / "config.yaml"
+        if not config_source.exists():
+            config_source = REPO_ROOT / "config.example.yaml"
+        config = yaml.safe_load(config_source.read_text(encoding="utf-8")) or {}
+        keywords = REPO_ROOT / "data" / "samples" / "search_terms.txt"
+        (work / "data").mkdir()
+        shutil.copyfile(keywords, work / "data" / "search_terms.txt")
+        config["keywords_file"] = "data/search_terms.txt"
+        # Stages are timed uncached; the text cache has its own stages.
+        config.pop("text_cache", None)
+        (work / "config.yaml").write_text(yaml.safe_dump(config), encoding="utf-8")
+        os.chdir(work)
+        try:
+            yield work, config
+        finally:
+            os.chdir(previous)
+
+
+def measure(
+    stage: str, rows: int, func: Callable[[], object], results: list[dict], memory: bool = True
+) -> object:
+    """Time ``func`` and append its wall time and peak traced memory to ``results``.
+
+    Tracing allocations slows pandas-heavy code several times over, so the
+    timing comes from an untraced run and, with ``memory``, the peak from a
+    second, traced run.
+    """
+
+    start = time.perf_counter()
+    value = func()
+    seconds = time.perf_counter() - start
+
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        func()
+        peak_mb = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+        tracemalloc.stop()
+
+    results.append({"stage": stage, "rows": rows, "seconds": round(seconds, 4), "peak_mb": peak_mb})
+    print(f"{stage:<24} rows={rows:<9} {seconds:8.3f}s  peak={peak_mb if memory else '-'} MiB")
+    return value
+
+
+def measure_frame(name: str, rows: int, frame: pd.DataFrame, frame_sizes: list[dict]) -> None:
+    """Append ``frame``'s compact size and its object-column equivalent to ``frame_sizes``."""
+
+    from src.utils.dtypes import MemoryReport
+
+    report = MemoryReport()
+    report.add(frame)
+    frame_sizes.append(
+        {
+            "frame": name,
+            "rows": rows,
+            "object_mb": round(report.object_bytes / 2**20, 2),
+            "compact_mb": round(report.compact_bytes / 2**20, 2),
+        }
+    )
+    print(f"{name:<24} rows={rows:<9} {report.summary()}")
+
+
+def bench_size(rows: int, args: argparse.Namespace, results: list[dict], frame_sizes: list[dict]) -> None:
+    from src import cli
+    from src.classify.batch import classify_frame
+    from src.classify.themes import guess_themes
+    from src.filters.cmu_rules import compile_rules, score_text
+    from src.parsers.business_suite_csv_parser import normalize_df
+    from src.utils.dtypes import concat_frames
+    from src.utils.io_utils import iter_csvs, read_csvs
+    from src.webapp.pipeline import run_full_pipeline
+
+    with _workspace() as (work, config):
+        raw_dir = work / "raw"
+        rates = HitRates(args.positive_rate, args.negative_rate, args.neutral_rate, args.theme_rate)
+        write_exports(raw_dir, rows, files=args.files, rates=rates, rules=config.get("rules"))
+
+        memory = not args.no_memory
+        measure("read_csvs", rows, lambda: read_csvs(raw_dir), results, memory)
+        # normalize_df maps one export's header at a time, so time it per file.
+        frames = list(iter_csvs(raw_dir))
+        normalized = measure(
+            "normalize_df",
+            rows,
+            lambda: concat_frames([normalize_df(frame) for frame in frames]),
+            results,
+            memory,
+        )
+        normalized_path = work / "comments_raw.csv"
+        normalized.to_csv(normalized_path, index=False)
+        rules = config.get("rules", {})
+        measure_frame("normalized frame", rows, normalized, frame_sizes)
+        measure_frame("classified frame", rows, classify_frame(normalized, compile_rules(rules)), frame_sizes)
+
+        texts = normalized["comment_text"].head(args.per_row_limit).tolist()
+        measure("score_text", len(texts), lambda: [score_text(text, rules) for text in texts], results, memory)
+        measure("guess_themes", len(texts), lambda: [guess_themes(text) for text in texts], results, memory)
+        measure(
+            "cmd_classify",
+            rows,
+            lambda: cli.cmd_classify(
+                Namespace(in_=str(normalized_path), out=str(work / "comments_classified.csv"))
+            ),
+            results,
+            memory,
+        )
+        text_cache = work / "text_cache.sqlite"
+
+        def classify_cached(cold: bool) -> None:
+            # measure() runs each stage twice, so a cold stage clears the cache every time.
+            if cold:
+                for path in work.glob(f"{text_cache.name}*"):
+                    path.unlink()
+            cli.cmd_classify(
+                Namespace(
+                    in_=str(normalized_path),
+                    out=str(work / "comments_classified.csv"),
+                    text_cache=str(text_cache),
+                )
+            )
+
+        measure("classify cache cold", rows, partial(classify_cached, True), results, memory)
+        measure("classify cache warm", rows, partial(classify_cached, False), results, memory)
+        measure(
+            "run_full_pipeline",
+            rows,
+            lambda: run_full_pipeline(raw_dir, work / "webapp", work / "out", window="all"),
+            results,
+            memory,
+        )
+
+
+def compare(current: list[dict], baseline_path: Path) -> None:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    before = {(item["stage"], item["rows"]): item for item in baseline["results"]}
+    print(f"\nCompared with {baseline_path} ({baseline.get('commit', '?')}):")
+    for item in current:
+        old = before.get((item["stage"], item["rows"]))
+        if old and old["seconds"]:
+            print(
+                f"{item['stage']:<24} rows={item['rows']:<9} "
+                f"time x{item['seconds'] / old['seconds']:.2f}"
+                + (
+                    f"  memory x{item['peak_mb'] / max(old['peak_mb'], 0.01):.2f}"
+                    if item["peak_mb"] is not None and old.get("peak_mb") is not None
+                    else ""
+                )
+            )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline stages on synthetic exports")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000], help="Row counts to run")
+    parser.add_argument("--files", type=int, default=3, help="Exports to split each size across")
+    parser.add_argument(
+        "--per_row_limit",
+        type=int,
+        default=20_000,
+        help="Rows for the per-comment stages (score_text, guess_themes)",
+    )
+    parser.add_argument("--positive_rate", type=float, default=HitRates.positive)
+    parser.add_argument("--negative_rate", type=float, default=HitRates.negative)
+    parser.add_argument("--neutral_rate", type=float, default=HitRates.neutral)
+    parser.add_argument("--theme_rate", type=float, default=HitRates.theme)
+    parser.add_argument(
+        "--no_memory", action="store_true", help="Skip the traced second run that measures peak memory"
+    )
+    parser.add_argument("--out", default=None, help="Results JSON (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", default=None, help="Earlier results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    results: list[dict] = []
+    frame_sizes: list[dict] = []
+    for rows in args.sizes:
+        bench_size(rows, args, results, frame_sizes)
+
+    commit = _git_commit()
+    payload = {
+        "commit": commit,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "settings": {key: value for key, value in vars(args).items() if key not in {"out", "compare"}},
+        "results": results,
+        "frame_sizes": frame_sizes,
+    }
+    out_path = Path(args.out) if args.out else RESULTS_DIR / f"{commit}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(f"Results -> {out_path}")
+
+    if args.compare:
+        compare(results, Path(args.compare))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Compare the search runner with one blocking request per query, against a local stub.
+
+Run from the repository root::
+
+    python -m benchmarks.search_runner --queries 40 --latency_ms 200
+
+A threaded HTTP server on localhost answers every query with a small results
+page after ``--latency_ms``. The script times plain ``google_search`` calls
+(a new connection per query, no pause) against :class:`SearchRunner` with a
+pool of workers, then reruns the runner so every query is served from the
+cache, and reports how many connections the server saw for each.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+from urllib.parse import parse_qs, urlparse
+
+from src.collectors.google_dork import google_search
+from src.collectors.search_runner import SearchCache, SearchRunner
+
+
+class StubSearchHandler(BaseHTTPRequestHandler):
+    """Serve a results page with three ``div.g`` hits per query.
+
+    ``latency_for`` and ``status_for`` override the delay and HTTP status for
+    particular queries (the tests use them to reorder and fail requests).
+    """
+
+    protocol_version = "HTTP/1.1"  # keep-alive, so pooled connections are reused
+    latency = 0.0
+    latency_for: dict[str, float] = {}
+    status_for: dict[str, int] = {}
+    connections: set[int] = set()
+    requests = 0
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        with self.lock:
+            type(self).connections.add(self.client_address[1])
+            type(self).requests += 1
+        query = parse_qs(urlparse(self.path).query).get("q", [""])[0]
+        time.sleep(self.latency_for.get(query, self.latency))
+        status = self.status_for.get(query, 200)
+        if status != 200:
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        hits = "".join(
+            f'<div class="g"><a href="https://example.com/{rank}">{escape(query)} #{rank}</a></div>'
+            for rank in range(1, 4)
+        )
+        body = f"<html><body>{hits}</body></html>".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@contextmanager
+def stub_server(latency: float) -> Iterator[str]:
+    """Run the stub on a free localhost port and yield its search URL."""
+
+    StubSearchHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubSearchHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/search"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def reset_counts() -> None:
+    StubSearchHandler.connections = set()
+    StubSearchHandler.requests = 0
+
+
+def _report(label: str, seconds: float, results: int) -> None:
+    print(
+        f"{label:<22} {seconds:6.2f}s  results {results:4d}  "
+        f"requests {StubSearchHandler.requests:4d}  connections {len(StubSearchHandler.connections):3d}"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SearchRunner against a local stub server")
+    parser.add_argument("--queries", type=int, default=40)
+    parser.add_argument("--latency_ms", type=float, default=200)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=20, help="Runner requests per second")
+    args = parser.parse_args(argv)
+
+    queries = [(f"colorado mesa band {index}", "qdr:d" if index % 2 else None) for index in range(args.queries)]
+    with stub_server(args.latency_ms / 1000) as url, tempfile.TemporaryDirectory() as cache_dir:
+        reset_counts()
+        started = time.perf_counter()
+        results = sum(len(google_search(query, tbs=tbs, pause=None, base_url=url)) for query, tbs in queries)
+        _report("sequential", time.perf_counter() - started, results)
+
+        for label in ("runner (cold cache)", "runner (warm cache)"):
+            reset_counts()
+            cache = SearchCache(cache_dir, ttl=3600)
+            started = time.perf_counter()
+            with SearchRunner(workers=args.workers, rate=args.rate, burst=args.workers, cache=cache, base_url=url) as runner:
+                results = sum(len(outcome.results) for outcome in runner.run(queries))
+            _report(label, time.perf_counter() - started, results)
+            print(f"    {runner.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Report how long light CLI commands spend importing.
+
+Run from the repository root::
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --budget_ms 300
+
+Each command runs in a fresh interpreter under ``python -X importtime``. The
+script prints the total import time and the slowest top-level imports, and
+exits non-zero if a command went over ``--budget_ms``. That these commands
+import no pandas is checked by ``tests/test_startup.py``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.run import REPO_ROOT, _workspace
+
+# (label, CLI arguments)
+COMMANDS: list[tuple[str, list[str]]] = [
+    ("--help", ["--help"]),
+    ("pipeline --help", ["pipeline", "--help"]),
+    ("find", ["find", "--out", "candidates.csv"]),
+]
+
+
+def import_times(cli_args: list[str], cwd: Path) -> dict[str, int]:
+    """Run the CLI under ``-X importtime``; return cumulative microseconds per top-level import."""
+
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "src.cli", *cli_args],
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    modules: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # the header line
+        # Nested imports are indented further; only top-level ones add up to the total.
+        top_level = len(name) - len(name.lstrip(" ")) == 1
+        modules[name.strip()] = int(cumulative) if top_level else modules.get(name.strip(), 0)
+    return modules
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure CLI import time with -X importtime")
+    parser.add_argument(
+        "--budget_ms", type=float, default=None, help="Fail if any command's imports take longer than this"
+    )
+    parser.add_argument("--top", type=int, default=5, help="Slowest top-level imports to list per command")
+    args = parser.parse_args(argv)
+
+    failures: list[str] = []
+    with _workspace() as (work, _config):
+        for label, cli_args in COMMANDS:
+            modules = import_times(cli_args, work)
+            total_ms = sum(modules.values()) / 1000
+            print(f"{label:<18} imports {total_ms:7.1f} ms")
+            slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[: args.top]
+            for name, micros in slowest:
+                print(f"    {micros / 1000:7.1f} ms  {name}")
+
+            if args.budget_ms is not None and total_ms > args.budget_ms:
+                failures.append(f"{label} took {total_ms:.1f} ms (budget {args.budget_ms:g} ms)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Synthetic comment exports for benchmarking.
+
+Rows are modelled on ``data/samples/comments_sample.csv`` and written with the
+column names of the three export layouts the parser understands, so every
+run exercises header resolution as well. Comment text mixes filler words
+with the configured rule terms and theme keywords at chosen hit rates.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.classify.themes import DEFAULT_THEME_KEYWORDS
+
+SAMPLE_PATH = Path("data/samples/comments_sample.csv")
+
+# Export layout -> canonical field -> column name used in that layout.
+VARIANTS: dict[str, dict[str, str]] = {
+    "business_suite": {
+        "date_utc": "date",
+        "platform": "platform",
+        "post_url": "post_url",
+        "post_owner_handle": "post_owner",
+        "post_caption_excerpt": "post_caption",
+        "comment_id": "comment_id",
+        "commenter_handle": "commenter",
+        "comment_text": "comment_text",
+    },
+    "instagram": {
+        "date_utc": "timestamp",
+        "post_url": "url",
+        "post_owner_handle": "owner",
+        "post_caption_excerpt": "caption",
+        "comment_id": "cid",
+        "commenter_handle": "username",
+        "comment_text": "text",
+    },
+    "tiktok": {
+        "date_utc": "created_at",
+        "platform": "Platform",
+        "post_url": "link",
+        "post_owner_handle": "page",
+        "post_caption_excerpt": "caption",
+        "comment_id": "commentid",
+        "commenter_handle": "profile_name",
+        "comment_text": "body",
+    },
+}
+DATE_FORMATS: dict[str, str] = {
+    "business_suite": "%Y-%m-%d",
+    "instagram": "%Y-%m-%dT%H:%M:%SZ",
+    "tiktok": "%m/%d/%Y %H:%M",
+}
+FILLER = (
+    "so very proud of him what a show tonight the band sounded amazing "
+    "love this wow great halftime never miss it again can't wait"
+).split()
+DEFAULT_RULES: dict[str, list[str]] = {
+    "positive_terms": ["Colorado Mesa", "Maverick", "Mavs", "@cmubands", "Grand Junction"],
+    "negative_terms": ["Carnegie Mellon", "Central Michigan", "Pittsburgh"],
+    "neutral_terms": ["CMU band", "Mesa band"],
+}
+
+
+@dataclass(frozen=True)
+class HitRates:
+    """Share of comments that contain at least one term of each kind."""
+
+    positive: float = 0.3
+    negative: float = 0.1
+    neutral: float = 0.1
+    theme: float = 0.5
+
+
+def _sample_texts() -> list[str]:
+    if not SAMPLE_PATH.exists():
+        return []
+    sample = pd.read_csv(SAMPLE_PATH, dtype=str, keep_default_na=False)
+    return [text for text in sample.get("comment_text", pd.Series(dtype=str)) if text]
+
+
+def _comments(rows: int, rng: np.random.Generator, rules: dict, rates: HitRates) -> np.ndarray:
+    pool = np.array(FILLER + [word for text in _sample_texts() for word in text.split()], dtype=object)
+    lengths = rng.integers(3, 15, rows)
+    words = rng.choice(pool, lengths.sum())
+    cuts = np.cumsum(lengths)[:-1]
+    texts = np.array([" ".join(chunk) for chunk in np.split(words, cuts)], dtype=object)
+
+    keywords = [keyword for group in DEFAULT_THEME_KEYWORDS.values() for keyword in group]
+    extras = [
+        (rates.positive, rules.get("positive_terms") or []),
+        (rates.negative, rules.get("negative_terms") or []),
+        (rates.neutral, rules.get("neutral_terms") or []),
+        (rates.theme, keywords),
+    ]
+    for rate, terms in extras:
+        if not terms:
+            continue
+        chosen = rng.random(rows) < rate
+        picks = rng.choice(np.array(terms, dtype=object), chosen.sum())
+        texts[chosen] = texts[chosen] + " " + picks
+    return texts
+
+
+def generate_export(
+    rows: int,
+    variant: str = "business_suite",
+    *,
+    seed: int = 0,
+    rates: HitRates = HitRates(),
+    rules: dict | None = None,
+    first_id: int = 0,
+) -> pd.DataFrame:
+    """Return ``rows`` synthetic comments using the ``variant`` column names."""
+
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp("2025-08-01", tz="UTC")
+    dates = start + pd.to_timedelta(rng.integers(0, 120 * 86400, rows), unit="s")
+    platform = "facebook" if variant == "business_suite" else variant
+    posts = rng.integers(0, max(1, rows // 200), rows)
+
+    fields = {
+        "date_utc": dates.strftime(DATE_FORMATS[variant]),
+        "platform": np.full(rows, platform, dtype=object),
+        "post_url": np.char.add(f"https://{platform}.com/p/", posts.astype(str)),
+        "post_owner_handle": np.full(rows, "cmubands", dtype=object),
+        "post_caption_excerpt": np.char.add("Maverick Stampede at halftime #", posts.astype(str)),
+        "comment_id": np.arange(first_id, first_id + rows).astype(str),
+        "commenter_handle": np.char.add("@fan", rng.integers(0, 5000, rows).astype(str)),
+        "comment_text": _comments(rows, rng, rules or DEFAULT_RULES, rates),
+    }
+    columns = VARIANTS[variant]
+    return pd.DataFrame({columns[field]: values for field, values in fields.items() if field in columns})
+
+
+def write_exports(
+    out_dir: Path | str,
+    rows: int,
+    *,
+    files: int = 3,
+    seed: int = 0,
+    rates: HitRates = HitRates(),
+    rules: dict | None = None,
+) -> list[Path]:
+    """Write ``rows`` comments split over ``files`` exports, cycling through the layouts."""
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    variants = list(VARIANTS)
+    paths = []
+    per_file = -(-rows // files)
+    for number in range(files):
+        count = min(per_file, rows - number * per_file)
+        if count <= 0:
+            break
+        variant = variants[number % len(variants)]
+        frame = generate_export(
+            count, variant, seed=seed + number, rates=rates, rules=rules, first_id=number * per_file
+        )
+        path = out_dir / f"{variant}_{number:02d}.csv"
+        frame.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+__all__ = ["HitRates", "VARIANTS", "generate_export", "write_exports"]
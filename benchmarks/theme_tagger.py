@@ -0,0 +1,121 @@
+"""Compare the word-index theme tagger with the old substring scan.
+
+Run from the repository root::
+
+    python -m benchmarks.theme_tagger --rows 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from src.classify.themes import DEFAULT_THEME_KEYWORDS, FALLBACK_THEME, ThemeTagger
+from src.parsers.business_suite_csv_parser import normalize_df
+from src.utils.io_utils import read_export
+
+SAMPLE_PATH = Path("data/samples/comments_sample.csv")
+
+# Hand-labelled comments covering the substring false positives.
+LABELLED: list[tuple[str, set[str]]] = [
+    ("So very proud of him! Batman sousaphone!", {"shout-outs"}),
+    ("I'm upset they didn't place", {"shout-outs"}),
+    ("what a show, that was amazing", {"shout-outs"}),
+    ("such a pity about the rain", {"shout-outs"}),
+    ("Sometimes the best bands lose", {"shout-outs"}),
+    ("the pit was way too loud", {"sound"}),
+    ("that closing set!!", {"drill"}),
+    ("new uniforms and plumes look great", {"uniforms"}),
+    ("Thanks for the great job tonight", {"shout-outs"}),
+    ("shout-out to the drumline", {"sound", "shout-outs"}),
+    ("Go Mavs! Loved the fight song", {"spirit"}),
+    ("parking at the north gate was a mess", {"logistics"}),
+    ("what time is the arrival?", {"logistics"}),
+    ("Let's settle this at state", {"shout-outs"}),
+    ("the hype in the crowd was unreal", {"spirit"}),
+]
+
+_WORDS = (
+    "the band was great tonight so proud of the drumline what a show that set upset "
+    "parking gate crowd hype thanks mavs uniforms plume sometimes pity charts loud mix"
+).split()
+
+
+def substring_themes(text: str) -> list[str]:
+    """The previous ``guess_themes``: any keyword as a substring."""
+
+    lowered = (text or "").lower()
+    matches = [
+        theme
+        for theme, keywords in DEFAULT_THEME_KEYWORDS.items()
+        if any(keyword in lowered for keyword in keywords)
+    ]
+    return matches or [FALLBACK_THEME]
+
+
+def synthetic_comments(rows: int, seed: int = 7) -> pd.Series:
+    rng = random.Random(seed)
+    return pd.Series([" ".join(rng.choices(_WORDS, k=rng.randint(3, 14))) for _ in range(rows)])
+
+
+def _timed(func) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def accuracy(tag) -> dict:
+    exact = sum(set(tag(text)) == expected for text, expected in LABELLED)
+    return {"labelled": len(LABELLED), "exact": exact, "accuracy": round(exact / len(LABELLED), 3)}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Synthetic comments to tag")
+    parser.add_argument("--out", default=None, help="Also write the results as JSON here")
+    args = parser.parse_args(argv)
+
+    tagger = ThemeTagger()
+    comments = synthetic_comments(args.rows)
+    lowered = comments.str.lower()
+
+    substring_seconds, old = _timed(lambda: [substring_themes(text) for text in comments])
+    per_row_seconds, _ = _timed(lambda: [tagger.tag(text) for text in comments])
+    vector_seconds, new = _timed(lambda: tagger.column(lowered))
+
+    old_joined = pd.Series(["|".join(themes) for themes in old])
+    results = {
+        "rows": args.rows,
+        "seconds": {
+            "substring_scan": round(substring_seconds, 3),
+            "word_index_per_row": round(per_row_seconds, 3),
+            "word_index_vectorized": round(vector_seconds, 3),
+        },
+        "synthetic_rows_changed": int((old_joined != pd.Series(new)).sum()),
+        "logistics_rate": {
+            "substring_scan": round(old_joined.str.contains("logistics").mean(), 3),
+            "word_index": round(pd.Series(new).str.contains("logistics").mean(), 3),
+        },
+        "accuracy": {"substring_scan": accuracy(substring_themes), "word_index": accuracy(tagger.tag)},
+    }
+
+    frame = read_export(SAMPLE_PATH) if SAMPLE_PATH.exists() else None
+    if frame is not None:
+        sample = normalize_df(frame)["comment_text"].fillna("").astype(str)
+        results["sample"] = [
+            {"text": text, "substring_scan": substring_themes(text), "word_index": tagger.tag(text)}
+            for text in sample
+        ]
+
+    print(json.dumps(results, indent=2))
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Vectorized classification of a whole comment frame."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from src.classify.context import ContextWeights, PostContext
+from src.classify.themes import DEFAULT_TAGGER, ThemeTagger
+from src.filters.cmu_rules import RULE_BUCKETS, SCORE_BANDS, UNCERTAIN, CompiledRules, TermMatcher, compile_rules
+
+if TYPE_CHECKING:
+    from src.classify.text_cache import TextCache, TextColumns
+
+_NOTE_PREFIXES = {"positive_terms": "+", "negative_terms": "-", "neutral_terms": "~"}
+
+
+def classification_version(
+    rules: Mapping[str, Iterable[str]],
+    tagger: ThemeTagger | None = None,
+    weights: ContextWeights | None = None,
+) -> str:
+    """Return a short hash identifying ``rules``, the theme keywords and context weights.
+
+    Cached classification results are keyed on this so any rule, keyword or
+    weight edit invalidates them.
+    """
+
+    payload = json.dumps(
+        {
+            "rules": {bucket: list(rules.get(bucket, []) or []) for bucket in RULE_BUCKETS},
+            "themes": {theme: list(keywords) for theme, keywords in (tagger or DEFAULT_TAGGER).themes.items()},
+            "fallback_theme": (tagger or DEFAULT_TAGGER).fallback,
+            "theme_matching": "words+plural",
+            "context": (weights or ContextWeights()).to_dict(),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _join_hits(tokens: Iterable[tuple[str, np.ndarray]], size: int, sep: str) -> np.ndarray:
+    """Join ``token`` for every row where its mask is set, preserving order."""
+
+    joined = np.full(size, "", dtype=object)
+    for token, mask in tokens:
+        if not mask.any():
+            continue
+        current = joined[mask]
+        joined[mask] = np.where(current == "", token, current + sep + token)
+    return joined
+
+
+def _presence_matrix(lowered: pd.Series, matcher: TermMatcher) -> dict[str, np.ndarray]:
+    """Return one boolean column per matcher key, scanning every row once."""
+
+    size = len(lowered)
+    if matcher.pattern is None:
+        return {}
+
+    found = lowered.str.findall(matcher.pattern)
+    lengths = found.str.len().to_numpy(dtype=np.int64)
+    rows = np.repeat(np.arange(size), lengths)
+    cols = pd.Categorical(found.explode().dropna(), categories=matcher.keys).codes
+
+    longest = np.zeros((size, len(matcher.keys)), dtype=bool)
+    longest[rows, cols] = True
+
+    position = {key: index for index, key in enumerate(matcher.keys)}
+    containers: dict[str, list[int]] = {key: [] for key in matcher.keys}
+    for key, contained in matcher.implied.items():
+        for other in contained:
+            containers[other].append(position[key])
+
+    return {key: longest[:, indexes].any(axis=1) for key, indexes in containers.items()}
+
+
+def _broadcast(values: np.ndarray, codes: np.ndarray) -> pd.Categorical:
+    """Spread per-distinct-comment ``values`` to the rows as a categorical."""
+
+    value_codes, categories = pd.factorize(values)
+    return pd.Categorical.from_codes(value_codes[codes], categories)
+
+
+def _text_results(lowered: pd.Series, rules: CompiledRules, tagger: ThemeTagger) -> TextColumns:
+    """Return ``(net rule hits, rule notes, themes)`` per distinct lowercased text."""
+
+    distinct = len(lowered)
+    matrix = _presence_matrix(lowered, rules.matcher)
+    counts = {
+        bucket: sum(
+            (matrix[key].astype(np.int64) for _, key in rules.buckets[bucket]),
+            np.zeros(distinct, dtype=np.int64),
+        )
+        for bucket in RULE_BUCKETS
+    }
+    notes = _join_hits(
+        (
+            (f"{_NOTE_PREFIXES[bucket]}{term}", matrix[key])
+            for bucket in RULE_BUCKETS
+            for term, key in rules.buckets[bucket]
+        ),
+        distinct,
+        ";",
+    )
+    return counts["positive_terms"] - counts["negative_terms"], notes, tagger.column(lowered)
+
+
+def classify_frame(
+    df: pd.DataFrame,
+    rules: Mapping[str, Iterable[str]] | CompiledRules,
+    tagger: ThemeTagger | None = None,
+    context: PostContext | None = None,
+    text_cache: TextCache | None = None,
+) -> pd.DataFrame:
+    """Return ``df`` with ``sentiment``, ``themes``, ``confidence_cmumesa`` and ``notes``.
+
+    A comment's score is its own rule hits (as in
+    :func:`~src.filters.cmu_rules.score_text`) plus the prior its post gets
+    from ``context`` (by default :class:`~src.classify.context.PostContext`
+    with the default weights); themes match
+    :func:`~src.classify.themes.guess_themes`. The text is lowercased once,
+    each distinct comment is scanned once for every rule term and tokenized
+    once for themes, each distinct post is scored once, and the four columns
+    are derived per distinct comment/post pair before being broadcast back
+    to the rows. With ``text_cache`` only texts it has not seen are scanned.
+    The repetitive text columns are returned as categoricals.
+    """
+
+    compiled = rules if isinstance(rules, CompiledRules) else compile_rules(rules)
+    context = context or PostContext(compiled)
+    result = df.copy()
+    size = len(result)
+    if "comment_text" in result.columns:
+        text = result["comment_text"].fillna("")
+        if text.dtype == object:
+            text = text.astype(str)
+    else:
+        text = pd.Series([""] * size, index=result.index, dtype=object)
+    codes, uniques = pd.factorize(text.str.lower())
+    lowered = pd.Series(uniques, dtype=object)
+
+    def compute(texts: pd.Series) -> TextColumns:
+        return _text_results(texts, compiled, tagger or DEFAULT_TAGGER)
+
+    if text_cache is None:
+        net, comment_notes, themes = compute(lowered)
+    else:
+        rows = np.bincount(codes, minlength=len(lowered))
+        net, comment_notes, themes = text_cache.results(lowered, compute, rows)
+    comment_score = net * context.weights.comment
+
+    # Score each distinct (comment, post) pair once.
+    post_codes, post_points, post_notes = context.score_posts(result)
+    pair_codes, pairs = pd.factorize(codes.astype(np.int64) * len(post_points) + post_codes)
+    text_of_pair = pairs // len(post_points)
+    post_of_pair = pairs % len(post_points)
+
+    score = comment_score[text_of_pair] + post_points[post_of_pair]
+    bands = SCORE_BANDS + (UNCERTAIN,)
+    band_of_pair = np.select(
+        [band.contains(score) for band in SCORE_BANDS], np.arange(len(SCORE_BANDS)), len(SCORE_BANDS)
+    )
+    sentiment = np.array([band.sentiment for band in bands], dtype=object)[band_of_pair]
+    confidence = np.array([band.confidence for band in bands])[band_of_pair]
+    notes = np.array(
+        [";".join(filter(None, parts)) for parts in zip(comment_notes[text_of_pair], post_notes[post_of_pair])],
+        dtype=object,
+    )
+
+    result["sentiment"] = _broadcast(sentiment, pair_codes)
+    result["themes"] = _broadcast(themes, codes)
+    result["confidence_cmumesa"] = confidence[pair_codes]
+    result["notes"] = _broadcast(notes, pair_codes)
+    return result
+
+
+__all__ = ["classification_version", "classify_frame"]
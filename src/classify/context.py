@@ -0,0 +1,129 @@
+"""Post-level context for CMU relevance scoring.
+
+A comment such as "great job!" has no rule terms of its own, but on a post
+captioned "Colorado Mesa Maverick Stampede halftime" by ``cmubands`` it is
+almost certainly about the band. :class:`PostContext` scores each distinct
+caption/owner pair once with the same rules and adds that prior to the
+comment's own score, so the contextual part of classification grows with
+posts, not comments.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from src.filters.cmu_rules import CompiledRules
+
+# A caption adds at most this many net rule hits, so a keyword-stuffed
+# caption cannot outweigh a comment that names another school.
+CAPTION_HIT_CAP = 2
+
+
+@dataclass(frozen=True)
+class ContextWeights:
+    """Points per net rule hit in the comment, its post's caption and owner."""
+
+    comment: float = 2.0
+    caption: float = 1.0
+    owner: float = 1.0
+    trusted_owners: tuple[str, ...] = ()
+
+    @classmethod
+    def from_config(cls, config: Mapping | None) -> "ContextWeights":
+        """Read the optional ``context`` block of ``config.yaml``."""
+
+        block = (config or {}).get("context") or {}
+        return cls(
+            comment=float(block.get("comment_weight", cls.comment)),
+            caption=float(block.get("caption_weight", cls.caption)),
+            owner=float(block.get("owner_weight", cls.owner)),
+            trusted_owners=tuple(_handle(owner) for owner in block.get("trusted_owners", ()) or ()),
+        )
+
+    @property
+    def uses_context(self) -> bool:
+        return bool(self.caption or self.owner)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _handle(value: str) -> str:
+    return str(value or "").strip().lstrip("@").lower()
+
+
+def _net(hits: Mapping[str, Iterable[str]]) -> int:
+    return len(list(hits["positive_terms"])) - len(list(hits["negative_terms"]))
+
+
+class PostContext:
+    """Score posts by caption and owner, memoized per distinct pair."""
+
+    def __init__(self, rules: CompiledRules, weights: ContextWeights | None = None) -> None:
+        self.rules = rules
+        self.weights = weights or ContextWeights()
+        self._memo: dict[tuple[str, str], tuple[float, str]] = {}
+
+    @classmethod
+    def from_config(cls, config: Mapping | None, rules: CompiledRules) -> "PostContext":
+        return cls(rules, ContextWeights.from_config(config))
+
+    def prior(self, caption: str, owner: str) -> tuple[float, str]:
+        """Return ``(points, notes)`` a post adds to each of its comments."""
+
+        key = (caption or "", owner or "")
+        if key not in self._memo:
+            self._memo[key] = self._score(*key)
+        return self._memo[key]
+
+    def _score(self, caption: str, owner: str) -> tuple[float, str]:
+        weights = self.weights
+        points = 0.0
+        notes: list[str] = []
+
+        if weights.caption and caption:
+            hits = self.rules.hits(caption)
+            net = max(-CAPTION_HIT_CAP, min(CAPTION_HIT_CAP, _net(hits)))
+            points += weights.caption * net
+            notes += [f"caption:+{term}" for term in hits["positive_terms"]]
+            notes += [f"caption:-{term}" for term in hits["negative_terms"]]
+
+        handle = _handle(owner)
+        if weights.owner and handle:
+            if handle in weights.trusted_owners:
+                net, notes_for_owner = 1, [f"owner:+{handle}"]
+            else:
+                hits = self.rules.hits(f"@{handle}")
+                net = int(np.sign(_net(hits)))
+                notes_for_owner = [f"owner:{'+' if net > 0 else '-'}{handle}"] if net else []
+            points += weights.owner * net
+            notes += notes_for_owner
+        return points, ";".join(notes)
+
+    def score_posts(self, df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(post code per row, points per post, notes per post)`` for ``df``."""
+
+        size = len(df)
+        if not self.weights.uses_context or not size:
+            return np.zeros(size, dtype=np.int64), np.zeros(1), np.array([""], dtype=object)
+
+        columns = []
+        for column in ("post_caption_excerpt", "post_owner_handle"):
+            values = df[column] if column in df.columns else pd.Series("", index=df.index)
+            codes, uniques = pd.factorize(values)
+            # Shift by one so missing values (code -1) read as "".
+            columns.append((codes + 1, [""] + [str(value) for value in uniques]))
+
+        (caption_codes, captions), (owner_codes, owners) = columns
+        row_posts, pairs = pd.factorize(caption_codes * len(owners) + owner_codes)
+        scored = [self.prior(captions[pair // len(owners)], owners[pair % len(owners)]) for pair in pairs]
+        points = np.array([points for points, _ in scored], dtype=float)
+        notes = np.array([notes for _, notes in scored], dtype=object)
+        return row_posts, points, notes
+
+
+__all__ = ["CAPTION_HIT_CAP", "ContextWeights", "PostContext"]
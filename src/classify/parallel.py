@@ -0,0 +1,133 @@
+"""Classify large frames across processes.
+
+:class:`ParallelClassifier` splits a frame into contiguous row ranges and
+classifies them in a process pool whose workers each build the compiled
+rules, theme index and post context once, from a small picklable
+:class:`ClassifierSpec`. The parts come back in submission order, so the
+result matches :func:`~src.classify.batch.classify_frame` on the whole frame.
+Each worker keeps its own :class:`~src.classify.text_cache.TextCache` over
+the shared SQLite file, and the parent adds up their hit counts.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+from src.classify.batch import classification_version, classify_frame
+from src.classify.context import ContextWeights, PostContext
+from src.classify.text_cache import TextCache, TextCacheStats
+from src.classify.themes import DEFAULT_THEME_KEYWORDS, FALLBACK_THEME, ThemeTagger
+from src.filters.cmu_rules import compile_rules
+from src.utils.dtypes import concat_frames
+
+# Below this many rows starting the pool costs more than it saves.
+PARALLEL_MIN_ROWS = 50_000
+# Parts per worker, so one slow part does not leave the other workers idle.
+PARTS_PER_WORKER = 2
+
+
+@dataclass(frozen=True)
+class ClassifierSpec:
+    """Everything a worker needs to rebuild the classifier: the raw config values."""
+
+    rules: Mapping = field(default_factory=dict)
+    themes: Mapping = field(default_factory=lambda: dict(DEFAULT_THEME_KEYWORDS))
+    fallback_theme: str = FALLBACK_THEME
+    weights: ContextWeights = field(default_factory=ContextWeights)
+    text_cache: str | None = None
+
+    @classmethod
+    def from_config(cls, config: Mapping | None, text_cache: str | None = None) -> "ClassifierSpec":
+        tagger = ThemeTagger.from_config(config)
+        return cls(
+            rules=dict((config or {}).get("rules", {}) or {}),
+            themes=tagger.themes,
+            fallback_theme=tagger.fallback,
+            weights=ContextWeights.from_config(config),
+            text_cache=text_cache,
+        )
+
+    def build(self) -> tuple:
+        """Return ``(compiled rules, tagger, context, text cache)`` for :func:`classify_frame`.
+
+        The text cache is ``None`` unless ``text_cache`` names its SQLite file.
+        """
+
+        rules = compile_rules(self.rules)
+        tagger = ThemeTagger(self.themes, self.fallback_theme)
+        cache = TextCache(classification_version(self.rules, tagger), self.text_cache) if self.text_cache else None
+        return rules, tagger, PostContext(rules, self.weights), cache
+
+
+# Per worker process: the classifier built by ``_init_worker``.
+_WORKER_CLASSIFIER: tuple | None = None
+
+
+def _init_worker(spec: ClassifierSpec) -> None:
+    global _WORKER_CLASSIFIER
+    _WORKER_CLASSIFIER = spec.build()
+
+
+def _classify_part(df: pd.DataFrame) -> tuple[pd.DataFrame, TextCacheStats | None]:
+    cache = _WORKER_CLASSIFIER[-1]
+    if cache is not None:
+        cache.stats = TextCacheStats()
+    return classify_frame(df, *_WORKER_CLASSIFIER), cache.stats if cache is not None else None
+
+
+class ParallelClassifier:
+    """A lazily started pool of ``workers`` classifier processes.
+
+    Frames shorter than ``min_rows`` (or any frame with ``workers <= 1``)
+    are left to the caller, so small runs never pay for the pool.
+    """
+
+    def __init__(self, spec: ClassifierSpec, workers: int, min_rows: int = PARALLEL_MIN_ROWS) -> None:
+        self.spec = spec
+        self.workers = workers
+        self.min_rows = min_rows
+        self.text_stats = TextCacheStats()
+        self._pool: ProcessPoolExecutor | None = None
+
+    def splits(self, df: pd.DataFrame) -> bool:
+        """Whether ``df`` is large enough to classify in the pool."""
+
+        return self.workers > 1 and len(df) >= self.min_rows
+
+    def classify(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Classify ``df`` in the pool and reassemble the parts in row order."""
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=(self.spec,)
+            )
+        bounds = np.linspace(0, len(df), self.workers * PARTS_PER_WORKER + 1, dtype=np.int64)
+        parts = [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        classified = []
+        for part, stats in self._pool.map(_classify_part, parts):
+            classified.append(part)
+            if stats is not None:
+                self.text_stats.add(stats)
+        result = concat_frames(classified)
+        result.index = df.index
+        result.attrs = dict(df.attrs)
+        return result
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "ParallelClassifier":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+__all__ = ["ClassifierSpec", "PARALLEL_MIN_ROWS", "ParallelClassifier"]
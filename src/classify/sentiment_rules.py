@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
+from src.filters.cmu_rules import score_band
+
 
 def sentiment_from_score(score: int) -> str:
-    if score >= 2:
-        return "positive"
-    if score <= -2:
-        return "negative"
-    return "neutral"
+    return score_band(score).sentiment
 
 
 __all__ = ["sentiment_from_score"]
@@ -0,0 +1,243 @@
+"""Memoized comment-level classification, keyed on the normalized text.
+
+Band comments repeat across runs ("go mavs!", "so proud"), so
+:class:`TextCache` remembers what :func:`~src.classify.batch.classify_frame`
+derives from the text alone: the net rule hits, the rule notes and the
+themes. Entries are keyed on the lowercased text under a version of the rules
+and theme keywords, so editing either starts afresh while other versions'
+entries stay in the file. Lookups are vectorized against an in-memory frame
+of the ``capacity`` most recently used texts, loaded from an optional SQLite
+file at open. Newly classified texts are appended to the file as one batch
+per lookup, and :meth:`TextCache.close` compacts a version's batches to the
+in-memory set once they hold more than twice ``capacity`` texts. Sentiment
+and confidence also depend on the post (:mod:`src.classify.context`), so they
+are derived after the lookup.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Mapping
+
+import numpy as np
+import pandas as pd
+
+TextColumns = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+DEFAULT_CAPACITY = 200_000
+# Versions not opened for this long are dropped from the file.
+VERSION_TTL_DAYS = 30
+_COLUMNS = ["net", "notes", "themes"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS text_batches (
+    id INTEGER PRIMARY KEY,
+    version TEXT NOT NULL,
+    texts INTEGER NOT NULL,
+    entries TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS text_batches_version ON text_batches (version, id);
+CREATE TABLE IF NOT EXISTS text_versions (
+    version TEXT PRIMARY KEY,
+    used_at REAL NOT NULL
+);
+"""
+
+
+def _table(texts=(), net=(), notes=(), themes=()) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "net": np.asarray(net, dtype=np.int64),
+            "notes": np.asarray(notes, dtype=object),
+            "themes": np.asarray(themes, dtype=object),
+        },
+        index=pd.Index(texts, dtype=object),
+    )
+
+
+def _encode(entries: pd.DataFrame) -> str:
+    return json.dumps(
+        [entries.index.tolist(), entries["net"].tolist(), entries["notes"].tolist(), entries["themes"].tolist()]
+    )
+
+
+@dataclass
+class TextCacheStats:
+    rows: int = 0
+    rows_hit: int = 0
+    texts: int = 0
+    texts_hit: int = 0
+
+    def add(self, other: "TextCacheStats") -> None:
+        for name in ("rows", "rows_hit", "texts", "texts_hit"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    @property
+    def hit_rate(self) -> float:
+        return self.rows_hit / self.rows if self.rows else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.hit_rate:.1%} of {self.rows} rows from cache "
+            f"({self.texts_hit} of {self.texts} distinct texts known)"
+        )
+
+
+class TextCache:
+    """Comment-level results by normalized text: ``capacity`` texts in memory over SQLite at ``path``."""
+
+    def __init__(self, version: str, path: Path | str | None = None, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.version = version
+        self.path = Path(path) if path else None
+        self.capacity = capacity
+        self.stats = TextCacheStats()
+        self._memory = _table()
+        # When each in-memory text was last used, in lookups since open.
+        self._used = np.zeros(0, dtype=np.int64)
+        self._lookups = 0
+        self._db: sqlite3.Connection | None = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, timeout=30)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+            self._register_version()
+            self._preload()
+
+    @classmethod
+    def from_config(cls, config: Mapping | None, path: Path | str | None = None) -> "TextCache | None":
+        """Open the cache at ``path`` (else ``text_cache`` in ``config.yaml``) for the configured rules.
+
+        Returns ``None`` when neither names a file.
+        """
+
+        from src.classify.batch import classification_version
+        from src.classify.themes import ThemeTagger
+
+        config = config or {}
+        path = path or config.get("text_cache")
+        if not path:
+            return None
+        return cls(classification_version(config.get("rules", {}), ThemeTagger.from_config(config)), path)
+
+    def _register_version(self) -> None:
+        """Mark this version used and drop versions nobody opened for :data:`VERSION_TTL_DAYS`."""
+
+        now = time.time()
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO text_versions (version, used_at) VALUES (?, ?)", (self.version, now)
+            )
+            stale = [
+                row[0]
+                for row in self._db.execute(
+                    "SELECT version FROM text_versions WHERE used_at < ?", (now - VERSION_TTL_DAYS * 86400,)
+                )
+            ]
+            for version in stale:
+                self._db.execute("DELETE FROM text_batches WHERE version = ?", (version,))
+                self._db.execute("DELETE FROM text_versions WHERE version = ?", (version,))
+
+    def _preload(self) -> None:
+        """Load this version's batches, newest last, keeping the ``capacity`` most recent texts."""
+
+        batches = self._db.execute(
+            "SELECT entries FROM text_batches WHERE version = ? ORDER BY id", (self.version,)
+        )
+        frames = [_table(*json.loads(entries)) for (entries,) in batches]
+        if frames:
+            memory = pd.concat(frames)
+            memory = memory[~memory.index.duplicated(keep="last")]
+            self._memory = memory.iloc[-self.capacity :]
+            self._used = np.zeros(len(self._memory), dtype=np.int64)
+
+    def _insert(self, entries: pd.DataFrame) -> None:
+        self._db.execute(
+            "INSERT INTO text_batches (version, texts, entries) VALUES (?, ?, ?)",
+            (self.version, len(entries), _encode(entries)),
+        )
+
+    def _store(self, entries: pd.DataFrame) -> None:
+        if self._db is None or entries.empty:
+            return
+        with self._db:
+            self._insert(entries)
+
+    def compact(self) -> None:
+        """Replace this version's stored batches with the in-memory texts, most recently used last."""
+
+        if self._db is None:
+            return
+        with self._db:
+            self._db.execute("DELETE FROM text_batches WHERE version = ?", (self.version,))
+            if not self._memory.empty:
+                self._insert(self._memory.iloc[np.argsort(self._used, kind="stable")])
+
+    def results(
+        self,
+        texts: pd.Series,
+        compute: Callable[[pd.Series], TextColumns],
+        rows: np.ndarray | None = None,
+    ) -> TextColumns:
+        """Return ``(net, notes, themes)`` for the distinct ``texts``, computing only the misses.
+
+        ``compute`` classifies a Series of texts from scratch; ``rows`` (rows
+        per text) weights the hit rate.
+        """
+
+        keys = pd.Index(texts, dtype=object)
+        positions = self._memory.index.get_indexer(keys)
+        known = positions >= 0
+        remembered = self._memory.iloc[positions[known]]
+        computed = _table()
+        if not known.all():
+            missing = keys[~known]
+            net, notes, themes = compute(pd.Series(missing, dtype=object))
+            computed = _table(missing, net, notes, themes)
+            self._store(computed)
+
+        self._lookups += 1
+        self._used[positions[known]] = self._lookups
+        if not computed.empty:
+            self._memory = pd.concat([self._memory, computed])
+            self._used = np.concatenate([self._used, np.full(len(computed), self._lookups, dtype=np.int64)])
+        if len(self._memory) > self.capacity:
+            # Keep the most recently used texts, in their original order.
+            keep = np.sort(np.argsort(self._used, kind="stable")[-self.capacity :])
+            self._memory = self._memory.iloc[keep]
+            self._used = self._used[keep]
+
+        table = pd.concat([remembered, computed]).reindex(keys)
+        rows = np.ones(len(keys), dtype=np.int64) if rows is None else rows
+        self.stats.rows += int(rows.sum())
+        self.stats.rows_hit += int(rows[known].sum())
+        self.stats.texts += len(keys)
+        self.stats.texts_hit += int(known.sum())
+        return (
+            table["net"].to_numpy(dtype=np.int64),
+            table["notes"].to_numpy(dtype=object),
+            table["themes"].to_numpy(dtype=object),
+        )
+
+    def summary(self) -> str:
+        return self.stats.summary()
+
+    def close(self) -> None:
+        """Compact this version once it stores over twice ``capacity`` texts, then close the file."""
+
+        if self._db is not None:
+            (stored,) = self._db.execute(
+                "SELECT COALESCE(SUM(texts), 0) FROM text_batches WHERE version = ?", (self.version,)
+            ).fetchone()
+            if stored > 2 * self.capacity:
+                self.compact()
+            self._db.close()
+            self._db = None
+
+
+__all__ = ["DEFAULT_CAPACITY", "TextCache", "TextCacheStats", "VERSION_TTL_DAYS"]
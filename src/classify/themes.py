@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from typing import List
+import re
+from itertools import chain
+from typing import Iterable, List, Mapping
+
+import numpy as np
+import pandas as pd
 
 THEMES: list[str] = [
     "sound",
@@ -12,8 +17,9 @@ THEMES: list[str] = [
     "shout-outs",
     "logistics",
 ]
+FALLBACK_THEME = "shout-outs"
 
-_THEME_KEYWORDS: dict[str, tuple[str, ...]] = {
+DEFAULT_THEME_KEYWORDS: dict[str, tuple[str, ...]] = {
     "sound": ("sound", "loud", "mix", "audio", "drumline", "battery", "pit"),
     "drill": ("drill", "set", "forms", "formation", "charts", "pyware"),
     "uniforms": ("uniform", "plume", "gauntlet", "shako", "hat"),
@@ -22,17 +28,168 @@ _THEME_KEYWORDS: dict[str, tuple[str, ...]] = {
     "logistics": ("arrival", "parking", "gate", "schedule", "time", "logistics"),
 }
 
+TOKEN_PATTERN = re.compile(r"\w+")
+# Row separator for tokenizing a whole batch at once (ASCII unit separator).
+_ROW_END = "\x1f"
+_BATCH_TOKEN_PATTERN = re.compile(r"\w+|\x1f")
 
-def guess_themes(text: str) -> List[str]:
-    """Return a list of theme labels based on keyword matches."""
 
-    lowered = (text or "").lower()
-    matches: list[str] = []
-    for theme, keywords in _THEME_KEYWORDS.items():
-        if any(keyword in lowered for keyword in keywords):
-            matches.append(theme)
+def tokenize(text: str) -> list[str]:
+    """Lowercase ``text`` and split it into word tokens (punctuation dropped)."""
+
+    return TOKEN_PATTERN.findall((text or "").lower())
+
+
+_ES_ENDINGS = ("ss", "x", "z", "ch", "sh")
+
+
+def _inflections(tokens: list[str]) -> Iterable[str]:
+    # Whole words only, but let the last word take its plural: "uniform" also
+    # matches "uniforms" and "mix" matches "mixes". Words already ending in a
+    # single "s" ("props", "forms") are taken as plural already.
+    head, last = tokens[:-1], tokens[-1]
+    variants = [last]
+    if last.endswith(_ES_ENDINGS):
+        variants.append(last + "es")
+    elif not last.endswith("s"):
+        variants.append(last + "s")
+    for variant in variants:
+        yield " ".join(head + [variant])
+
+
+class ThemeTagger:
+    """Tag comments with themes by whole-word keyword lookups.
+
+    Keywords are tokenized the same way as comments and stored in a hash
+    index from word n-gram to a bitmask of themes, so each comment is
+    tokenized once and every n-gram costs one dictionary lookup. Unlike a
+    substring scan, "set" does not match "upset" and "hat" does not match
+    "that"; "shout-out" and "shout out" are the same keyword.
+    """
+
+    def __init__(
+        self,
+        themes: Mapping[str, Iterable[str]] | None = None,
+        fallback: str = FALLBACK_THEME,
+    ) -> None:
+        self.themes = {theme: tuple(keywords) for theme, keywords in (themes or DEFAULT_THEME_KEYWORDS).items()}
+        if len(self.themes) > 62:
+            raise ValueError("At most 62 themes are supported")
+        self.fallback = fallback
+        self.index: dict[str, int] = {}
+        self.max_ngram = 1
+        for bit, keywords in enumerate(self.themes.values()):
+            for keyword in keywords:
+                tokens = tokenize(keyword)
+                if not tokens:
+                    continue
+                self.max_ngram = max(self.max_ngram, len(tokens))
+                for gram in _inflections(tokens):
+                    self.index[gram] = self.index.get(gram, 0) | (1 << bit)
+
+        # The same index keyed on integers for the vectorized path: every
+        # keyword word gets an ID from 1, and an n-gram of IDs is packed into
+        # one integer in base ``len(words) + 1``.
+        words = sorted({word for gram in self.index for word in gram.split()})
+        self._word_ids = {word: number for number, word in enumerate(words, start=1)}
+        self._base = len(words) + 1
+        if self._base ** self.max_ngram >= 2**62:
+            raise ValueError("Too many distinct keyword words for the theme index")
+        packed = {self._pack(gram.split()): mask for gram, mask in self.index.items()}
+        self._gram_keys = np.array(sorted(packed), dtype=np.int64)
+        self._gram_masks = np.array([packed[key] for key in self._gram_keys], dtype=np.int64)
+
+    def _pack(self, words: list[str]) -> int:
+        key = 0
+        for word in words:
+            key = key * self._base + self._word_ids[word]
+        return key
+
+    @classmethod
+    def from_config(cls, config: Mapping | None) -> "ThemeTagger":
+        """Build a tagger from the optional ``themes`` block of ``config.yaml``."""
+
+        config = config or {}
+        return cls(config.get("themes"), config.get("fallback_theme", FALLBACK_THEME))
+
+    def _labels(self, mask: int) -> str:
+        labels = [theme for bit, theme in enumerate(self.themes) if mask >> bit & 1]
+        return "|".join(labels) if labels else self.fallback
 
-    return matches or ["shout-outs"]
+    def tag(self, text: str) -> List[str]:
+        """Return the theme labels for one comment."""
 
+        tokens = tokenize(text)
+        mask = 0
+        for size in range(1, self.max_ngram + 1):
+            for start in range(len(tokens) - size + 1):
+                mask |= self.index.get(" ".join(tokens[start : start + size]), 0)
+        return self._labels(mask).split("|")
 
-__all__ = ["THEMES", "guess_themes"]
+    def _token_rows(self, lowered: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(word IDs, row numbers)`` for every token, in order."""
+
+        joined = _ROW_END.join(lowered)
+        if joined.count(_ROW_END) == len(lowered) - 1:
+            # One regex pass over the whole batch, with separators marking row ends.
+            tokens = np.array(_BATCH_TOKEN_PATTERN.findall(joined), dtype=object)
+            ends = tokens == _ROW_END
+            rows = np.cumsum(ends)[~ends]
+            tokens = tokens[~ends]
+        else:
+            found = lowered.str.findall(TOKEN_PATTERN)
+            rows = np.repeat(np.arange(len(lowered)), found.str.len().to_numpy(dtype=np.int64))
+            tokens = np.array(list(chain.from_iterable(found)), dtype=object)
+
+        codes, vocabulary = pd.factorize(tokens)
+        ids = np.array([self._word_ids.get(word, 0) for word in vocabulary], dtype=np.int64)
+        return (ids[codes] if len(codes) else np.zeros(0, dtype=np.int64)), rows
+
+    def masks(self, lowered: pd.Series) -> np.ndarray:
+        """Return a theme bitmask per (already lowercased) text."""
+
+        ids, rows = self._token_rows(lowered)
+        masks = np.zeros(len(lowered), dtype=np.int64)
+        if not len(self._gram_keys):
+            return masks
+
+        for size in range(1, min(self.max_ngram, len(ids)) + 1):
+            count = len(ids) - size + 1
+            keys = ids[:count].copy()
+            valid = (keys > 0) & (rows[:count] == rows[size - 1 :])
+            for offset in range(1, size):
+                following = ids[offset : offset + count]
+                valid &= following > 0
+                keys = keys * self._base + following
+            starts = np.flatnonzero(valid)
+            slots = np.searchsorted(self._gram_keys, keys[starts]).clip(max=len(self._gram_keys) - 1)
+            hit = self._gram_keys[slots] == keys[starts]
+            np.bitwise_or.at(masks, rows[starts[hit]], self._gram_masks[slots[hit]])
+        return masks
+
+    def column(self, lowered: pd.Series) -> np.ndarray:
+        """Return the ``|``-joined theme labels per (already lowercased) text."""
+
+        masks = self.masks(lowered)
+        distinct, codes = np.unique(masks, return_inverse=True)
+        labels = np.array([self._labels(int(mask)) for mask in distinct], dtype=object)
+        return labels[codes.reshape(-1)]
+
+
+DEFAULT_TAGGER = ThemeTagger()
+
+
+def guess_themes(text: str, tagger: ThemeTagger | None = None) -> List[str]:
+    """Return a list of theme labels based on keyword matches."""
+
+    return (tagger or DEFAULT_TAGGER).tag(text)
+
+
+__all__ = [
+    "DEFAULT_THEME_KEYWORDS",
+    "FALLBACK_THEME",
+    "THEMES",
+    "ThemeTagger",
+    "guess_themes",
+    "tokenize",
+]
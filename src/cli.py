@@ -1,21 +1,46 @@
-"""Command line interface for the MavStampede Social Monitor."""
+"""Command line interface for the MavStampede Social Monitor.
+
+Only the standard library and the light path/metrics helpers are imported at
+module load. pandas and the pipeline stages are imported by the commands that
+use them, so ``--help`` and ``find`` start without paying for pandas
+(``python -m benchmarks.startup`` checks this).
+"""
 
 from __future__ import annotations
 
 import argparse
+import csv
 import shutil
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+from src.export.formats import (
+    ARTIFACT_SUFFIXES,
+    FrameWriter,
+    infer_format,
+    iter_frames,
+    load_frame,
+    locate,
+    with_format,
+)
+from src.utils.config import CONFIG_PATH, load_config
+from src.utils.metrics import Run, StageMeter, count_rows, record, record_files_read
 
-import pandas as pd
-import yaml
+if TYPE_CHECKING:
+    import pandas as pd
 
-from src.classify.sentiment_rules import sentiment_from_score
-from src.classify.themes import guess_themes
-from src.filters.cmu_rules import score_text
-from src.parsers.business_suite_csv_parser import normalize_df
-from src.utils.io_utils import read_csvs
+    from src.classify.context import PostContext
+    from src.classify.parallel import ParallelClassifier
+    from src.classify.text_cache import TextCache
+    from src.classify.themes import ThemeTagger
+    from src.filters.cmu_rules import CompiledRules
+    from src.filters.dedup import DedupIndex
+    from src.filters.window import WindowFilter
+    from src.parsers.business_suite_csv_parser import SchemaMapper
+    from src.utils.cache import ExportCache
+    from src.utils.dtypes import MemoryReport
 
-CONFIG_PATH = Path("config.yaml")
 SCHEMA_COLUMNS = [
     "date_utc",
     "platform",
@@ -32,15 +57,6 @@ SCHEMA_COLUMNS = [
 ]
 
 
-def load_config(path: Path = CONFIG_PATH) -> dict:
-    if not path.exists():
-        raise FileNotFoundError(
-            f"Config file '{path}' is missing. Copy config.example.yaml to {path}"
-        )
-    with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle)
-
-
 def ensure_schema(df: pd.DataFrame) -> pd.DataFrame:
     for column in SCHEMA_COLUMNS:
         if column not in df.columns:
@@ -49,91 +65,966 @@ def ensure_schema(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def cmd_find(args: argparse.Namespace) -> None:
+    from src.collectors.queries import QUERY_COLUMNS, expand_queries
+    from src.utils.time_utils import check_window
+
     config = load_config()
     keywords_path = Path(config["keywords_file"])
-    keywords = [line.strip() for line in keywords_path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    window = getattr(args, "window", None)
+    if not window:
+        try:
+            window = check_window(str(config.get("time_window") or "21d"))
+        except ValueError as exc:
+            raise SystemExit(f"{exc} (time_window in {CONFIG_PATH})") from None
     output_path = Path(args.out)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    pd.DataFrame({"query": keywords}).to_csv(output_path, index=False)
-    print(f"Wrote candidate queries -> {output_path}")
+    queries = 0
+    with keywords_path.open("r", encoding="utf-8") as keywords, output_path.open(
+        "w", encoding="utf-8", newline=""
+    ) as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(QUERY_COLUMNS)
+        for query in expand_queries(
+            keywords,
+            config.get("locations") or (),
+            config.get("platforms") or (),
+            window,
+            (config.get("rules") or {}).get("negative_terms") or (),
+        ):
+            writer.writerow(query.row())
+            queries += 1
+    record_files_read([keywords_path])
+    record(rows_out=queries, bytes_written=output_path.stat().st_size)
+    print(f"Wrote {queries} candidate queries -> {output_path}")
+
+    if getattr(args, "search", False):
+        results_path = Path(args.results) if getattr(args, "results", None) else search_results_path(output_path)
+        with output_path.open("r", encoding="utf-8", newline="") as handle:
+            pairs = ((row["query"], row["tbs"] or None) for row in csv.DictReader(handle))
+            run_searches(pairs, results_path, config)
+
+
+def search_results_path(queries_path: Path) -> Path:
+    return queries_path.with_name(f"{queries_path.stem}_results{queries_path.suffix}")
+
+
+def run_searches(queries: Iterable[tuple[str, str | None]], results_path: Path, config: dict | None) -> int:
+    """Run ``(query, tbs)`` pairs through a :class:`SearchRunner` and write one row per result.
+
+    Failed queries are reported and skipped; rerunning picks them up while
+    the successful ones are served from the search cache.
+    """
+
+    from src.collectors.search_runner import SearchRunner
+
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    rows = 0
+    with SearchRunner.from_config(config) as runner, results_path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(["query", "tbs", "rank", "title", "url", "cached"])
+        for outcome in runner.run(queries):
+            if outcome.error:
+                print(f"Search failed for {outcome.query!r}: {outcome.error}")
+                continue
+            for rank, result in enumerate(outcome.results, start=1):
+                writer.writerow(
+                    [outcome.query, outcome.tbs or "", rank, result["title"], result["url"], int(outcome.cached)]
+                )
+                rows += 1
+        if runner.cache is not None:
+            runner.cache.evict_expired()
+    record(bytes_written=results_path.stat().st_size)
+    print(f"Search: {runner.summary()}")
+    print(f"Search results: {rows} -> {results_path}")
+    return rows
+
+
+def tee_frames(
+    frames: Iterable[pd.DataFrame], output_path: Path | None, fmt: str | None = None
+) -> Iterator[pd.DataFrame]:
+    """Append each frame to ``output_path`` as it passes through.
+
+    Frames are written one batch at a time in ``fmt`` (inferred from the
+    suffix by default), so only one batch is ever held in memory. With
+    ``output_path=None`` the frames pass through untouched.
+    """
+
+    if output_path is None:
+        yield from frames
+        return
+
+    with FrameWriter(output_path, fmt) as writer:
+        for frame in frames:
+            writer.write(frame)
+            yield frame
+    if output_path.exists():
+        record(bytes_written=output_path.stat().st_size)
+
+
+def write_frames(frames: Iterable[pd.DataFrame], output_path: Path, fmt: str | None = None) -> int:
+    """Write ``frames`` to ``output_path`` and return how many were written."""
+
+    written = 0
+    for frame in tee_frames(frames, output_path, fmt):
+        record(rows_out=len(frame))
+        written += 1
+    return written
+
+
+def split_post_frames(
+    frames: Iterable[pd.DataFrame], posts_output: Path, fmt: str | None = None
+) -> Iterator[pd.DataFrame]:
+    """Write every post once to ``posts_output`` and yield each frame's comments table."""
+
+    from src.parsers.posts import split_posts
+
+    seen: set[str] = set()
+    with FrameWriter(posts_output, fmt) as writer:
+        for frame in frames:
+            posts, comments = split_posts(frame)
+            posts = posts[~posts["post_key"].isin(seen)]
+            if len(posts):
+                seen.update(posts["post_key"])
+                writer.write(posts)
+            yield comments
+    if posts_output.exists():
+        record(bytes_written=posts_output.stat().st_size)
+    print(f"Posts: {len(seen)} -> {posts_output}")
+
+
+def joined_frames(frames: Iterable[pd.DataFrame], source: Path) -> Iterator[pd.DataFrame]:
+    """Restore the post fields of a split comments artifact from its posts artifact."""
+
+    from src.parsers.posts import join_posts, posts_path
+
+    posts_source = posts_path(source)
+    posts = None
+    for frame in frames:
+        if "post_key" in frame.columns and "post_url" not in frame.columns and posts_source.exists():
+            if posts is None:
+                posts = load_frame(posts_source)
+                record_files_read([posts_source])
+            frame = join_posts(posts, frame)
+        yield frame
+
+
+def window_arg(text: str) -> str:
+    """``--window`` argument type: ``all`` or a lookback such as ``21d``."""
+
+    from src.utils.time_utils import check_window
+
+    try:
+        return check_window(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def moment_arg(text: str) -> str:
+    """``--since``/``--until`` argument type: a date such as ``2025-10-01``."""
+
+    from src.store.comment_store import check_moment
+
+    try:
+        return check_moment(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def artifact_format(args: argparse.Namespace) -> str | None:
+    """Return the intermediate artifact format from ``--format`` or ``config.yaml``."""
+
+    fmt = getattr(args, "format", None)
+    if fmt:
+        return fmt
+    if CONFIG_PATH.exists():
+        return (load_config() or {}).get("artifact_format")
+    return None
+
+
+def _cached_normalized_frames(
+    source_dir: Path, cache: ExportCache, mapper: SchemaMapper
+) -> Iterator[pd.DataFrame]:
+    from src.parsers.business_suite_csv_parser import normalize_df
+    from src.utils.io_utils import list_csvs, read_export
+
+    for csv_path in list_csvs(source_dir):
+        key = f"{cache.fingerprint(csv_path)}-{mapper.version}"
+
+        def build(csv_path: Path = csv_path) -> pd.DataFrame | None:
+            frame = read_export(csv_path)
+            return None if frame is None else normalize_df(frame, mapper)
+
+        frame = cache.load_or_build("normalized", key, build)
+        if frame is not None:
+            frame.attrs["cache_key"] = key
+            yield frame
+
+
+def _report_sources(frames: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    from src.parsers.business_suite_csv_parser import describe_sources
+
+    reported: set[str] = set()
+    for frame in frames:
+        source_file = frame.attrs.get("source_file")
+        if source_file and source_file not in reported:
+            reported.add(source_file)
+            print(f"Columns for {source_file}: {describe_sources(frame.attrs['column_sources'])}")
+        yield frame
+
+
+def schema_mapper() -> SchemaMapper:
+    """Return a :class:`SchemaMapper` using the alias config, if any."""
+
+    from src.parsers.business_suite_csv_parser import SchemaMapper
+
+    return SchemaMapper.from_config(load_config() if CONFIG_PATH.exists() else None)
+
+
+def normalized_frames(
+    source_dir: Path,
+    chunksize: int | None = None,
+    cache: ExportCache | None = None,
+    workers: int | None = None,
+    mapper: SchemaMapper | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield normalized comments from the exports in ``source_dir``.
+
+    Each export (or chunk of one) is normalized against its own header. With
+    ``chunksize`` the batches are streamed; with ``cache`` one frame per export
+    is yielded and unchanged exports are loaded from the cache instead of being
+    re-parsed; otherwise one combined frame is yielded, or nothing when no
+    exports were found. ``workers`` reads and normalizes whole exports in a
+    process pool. The column mapping of every freshly parsed export is printed.
+    """
+
+    from src.parsers.business_suite_csv_parser import normalize_df
+    from src.utils.dtypes import concat_frames
+    from src.utils.io_utils import iter_csvs
+
+    mapper = mapper or schema_mapper()
+    if cache is not None:
+        yield from _report_sources(_cached_normalized_frames(source_dir, cache, mapper))
+        return
+
+    frames = _report_sources(
+        iter_csvs(
+            source_dir,
+            chunksize=chunksize,
+            workers=workers,
+            transform=partial(normalize_df, mapper=mapper),
+        )
+    )
+    if chunksize:
+        yield from frames
+        return
+
+    collected = list(frames)
+    if collected:
+        yield concat_frames(collected)
+
+
+def windowed_frames(
+    frames: Iterable[pd.DataFrame], window: WindowFilter | None
+) -> Iterator[pd.DataFrame]:
+    """Drop comments dated outside ``window`` before they reach classification."""
+
+    for frame in frames:
+        yield frame if window is None else window.filter(frame)
+
+
+def deduped_frames(frames: Iterable[pd.DataFrame], index: DedupIndex | None) -> Iterator[pd.DataFrame]:
+    """Drop comments already seen in an earlier frame (or run) before classification."""
+
+    for frame in frames:
+        yield frame if index is None else index.filter(frame)
+
+
+def previous_output(output_path: Path, index: DedupIndex | None) -> list[pd.DataFrame]:
+    """Load what an earlier run wrote to ``output_path`` when ``index`` was loaded from disk.
+
+    Comments in a persistent index are dropped from later runs, so the
+    earlier output is carried over and the new comments are added to it. A
+    new (or deleted) index remembers nothing, so nothing is carried. The
+    output is read in full here, before the writer replaces the file.
+    """
+
+    if index is None or not index.loaded or not output_path.exists():
+        return []
+    return list(joined_frames(iter_frames(output_path, compact=True), output_path))
+
+
+def carried_frames(
+    previous: Iterable[pd.DataFrame], frames: Iterable[pd.DataFrame], index: DedupIndex | None
+) -> Iterator[pd.DataFrame]:
+    """Yield the ``previous`` output (its keys recorded in ``index``), then this run's ``frames``."""
+
+    for frame in previous:
+        yield frame if index is None else index.carry(frame)
+    yield from frames
+
+
+def classified_frames(
+    frames: Iterable[pd.DataFrame],
+    rules: CompiledRules,
+    cache: ExportCache | None = None,
+    version: str = "",
+    tagger: ThemeTagger | None = None,
+    context: PostContext | None = None,
+    pool: ParallelClassifier | None = None,
+    text_cache: TextCache | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Classify each normalized frame and order it by :data:`SCHEMA_COLUMNS`.
+
+    Frames produced by a cached :func:`normalized_frames` carry their export's
+    hash, and their classification is cached under that hash plus ``version``.
+    Frames large enough for ``pool`` are classified across its processes.
+    With ``text_cache`` comment texts classified before are looked up.
+    """
+
+    from src.classify.batch import classify_frame
+
+    def classify(frame: pd.DataFrame) -> pd.DataFrame:
+        if pool is not None and pool.splits(frame):
+            return ensure_schema(pool.classify(frame))
+        return ensure_schema(classify_frame(frame, rules, tagger, context, text_cache))
+
+    for frame in frames:
+        key = frame.attrs.get("cache_key")
+        if cache is None or not key:
+            yield classify(frame)
+            continue
+
+        yield cache.load_or_build("classified", key, partial(classify, frame), version=version)
+
+
+def _open_pool(
+    config: dict, workers: int | None, text_cache: TextCache | None = None
+) -> ParallelClassifier | None:
+    if not workers or workers <= 1:
+        return None
+    from src.classify.parallel import ClassifierSpec, ParallelClassifier
+
+    cache_path = str(text_cache.path) if text_cache is not None and text_cache.path else None
+    return ParallelClassifier(ClassifierSpec.from_config(config, cache_path), workers)
+
+
+def _close_pool(pool: ParallelClassifier | None, text_cache: TextCache | None = None) -> None:
+    if pool is not None:
+        pool.close()
+        if text_cache is not None:
+            text_cache.stats.add(pool.text_stats)
+
+
+def _open_text_cache(args: argparse.Namespace, config: dict) -> TextCache | None:
+    from src.classify.text_cache import TextCache
+
+    return TextCache.from_config(config, getattr(args, "text_cache", None))
+
+
+def _close_text_cache(text_cache: TextCache | None) -> None:
+    if text_cache is not None:
+        text_cache.close()
+        print(f"Text cache: {text_cache.summary()} -> {text_cache.path}")
+
+
+def measured_frames(frames: Iterable[pd.DataFrame], report: MemoryReport | None) -> Iterator[pd.DataFrame]:
+    """Add each frame's compact and object-dtype memory to ``report``, if any."""
+
+    for frame in frames:
+        if report is not None:
+            report.add(frame)
+        yield frame
+
+
+def _open_memory(args: argparse.Namespace) -> MemoryReport | None:
+    if not getattr(args, "memory_report", False):
+        return None
+    from src.utils.dtypes import MemoryReport
+
+    return MemoryReport()
+
+
+def _close_memory(memory: MemoryReport | None) -> None:
+    if memory is not None:
+        print(f"Memory: {memory.summary()}")
+
+
+def _open_dedup(args: argparse.Namespace) -> DedupIndex | None:
+    index_path = getattr(args, "dedup_index", None)
+    if index_path or getattr(args, "dedup", False):
+        from src.filters.dedup import DedupIndex
+
+        return DedupIndex(index_path)
+    return None
+
+
+def _close_dedup(index: DedupIndex | None) -> None:
+    if index is not None:
+        index.save()
+        print(f"Dedup: {index.stats.summary()}")
+
+
+def _open_window(args: argparse.Namespace) -> WindowFilter | None:
+    from src.filters.window import WindowFilter
+
+    return WindowFilter.from_spec(getattr(args, "window", None))
+
+
+def _close_window(window: WindowFilter | None) -> None:
+    if window is not None:
+        print(f"Window {window.describe()}: {window.stats.summary()}")
+
+
+def _open_cache(args: argparse.Namespace) -> ExportCache | None:
+    cache_dir = getattr(args, "cache_dir", None)
+    if not cache_dir:
+        return None
+    from src.utils.cache import ExportCache
+
+    return ExportCache(cache_dir)
+
+
+def _close_cache(cache: ExportCache | None) -> None:
+    if cache is not None:
+        cache.save()
+        print(f"Cache: {cache.summary()}")
 
 
 def cmd_parse_exports(args: argparse.Namespace) -> None:
+    from src.utils.io_utils import list_csvs
+
     source_dir = Path(args.in_dir)
-    combined = read_csvs(source_dir)
-    if combined.empty:
+    output_path = with_format(args.out, artifact_format(args))
+    cache = _open_cache(args)
+    dedup = _open_dedup(args)
+    window = _open_window(args)
+    memory = _open_memory(args)
+
+    record_files_read(list_csvs(source_dir))
+    previous = previous_output(output_path, dedup)
+    frames = count_rows(
+        normalized_frames(source_dir, getattr(args, "chunksize", None), cache, getattr(args, "workers", None))
+    )
+    frames = deduped_frames(windowed_frames(frames, window), dedup)
+    frames = measured_frames(carried_frames(windowed_frames(previous, window), frames, dedup), memory)
+    if getattr(args, "split_posts", False):
+        from src.parsers.posts import posts_path
+
+        frames = split_post_frames(frames, posts_path(output_path))
+    if not write_frames(frames, output_path):
         print(f"No CSVs found in {source_dir}")
         raise SystemExit(1)
 
-    normalized = normalize_df(combined)
-    output_path = Path(args.out)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    normalized.to_csv(output_path, index=False)
+    _close_cache(cache)
+    _close_window(window)
+    _close_dedup(dedup)
+    _close_memory(memory)
     print(f"Normalized -> {output_path}")
 
 
 def cmd_classify(args: argparse.Namespace) -> None:
-    config = load_config()
-    rules = config.get("rules", {})
+    import pandas as pd
 
-    input_path = Path(args.in_)
-    df = pd.read_csv(input_path)
+    from src.classify.context import PostContext
+    from src.classify.themes import ThemeTagger
+    from src.filters.cmu_rules import compile_rules
 
-    scores = df["comment_text"].fillna("").apply(lambda text: score_text(text, rules))
-    df["sentiment"] = scores.apply(lambda item: sentiment_from_score(item.score))
-    df["themes"] = df["comment_text"].fillna("").apply(lambda text: "|".join(guess_themes(text)))
-    df["confidence_cmumesa"] = scores.apply(lambda item: item.confidence)
-    df["notes"] = scores.apply(lambda item: item.notes)
+    config = load_config()
+    rules = compile_rules(config.get("rules", {}))
+    tagger = ThemeTagger.from_config(config)
+    context = PostContext.from_config(config, rules)
 
-    ordered = ensure_schema(df)
+    fmt = artifact_format(args)
+    input_path = locate(args.in_, fmt)
+    output_path = with_format(args.out, fmt)
+    window = _open_window(args)
+    memory = _open_memory(args)
+    text_cache = _open_text_cache(args, config)
+    pool = _open_pool(config, getattr(args, "workers", None), text_cache)
+    record_files_read([input_path])
+    frames = count_rows(iter_frames(input_path, chunksize=getattr(args, "chunksize", None), compact=True))
+    frames = windowed_frames(joined_frames(frames, input_path), window)
+    frames = classified_frames(
+        frames, rules, tagger=tagger, context=context, pool=pool, text_cache=text_cache
+    )
 
-    output_path = Path(args.out)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    ordered.to_csv(output_path, index=False)
+    try:
+        if not write_frames(measured_frames(frames, memory), output_path):
+            write_frames([ensure_schema(pd.DataFrame())], output_path)
+    finally:
+        _close_pool(pool, text_cache)
+    _close_text_cache(text_cache)
+    _close_window(window)
+    _close_memory(memory)
     print(f"Classified -> {output_path}")
 
 
+def run_pipeline(
+    source_dir: Path,
+    output_path: Path,
+    *,
+    work_dir: Path | None = None,
+    chunksize: int | None = None,
+    cache: ExportCache | None = None,
+    workers: int | None = None,
+    fmt: str | None = None,
+    dedup: DedupIndex | None = None,
+    window: WindowFilter | None = None,
+    memory: MemoryReport | None = None,
+    text_cache: TextCache | None = None,
+    on_step: Callable[[str, Path], None] | None = None,
+) -> Path:
+    """Normalize, classify and export in one pass without re-reading CSVs.
+
+    Frames flow between the stages in memory. When ``work_dir`` is given the
+    intermediate ``comments_raw.csv`` and ``comments_classified.csv`` are
+    written there as well (in ``fmt``), which is only needed for debugging. The
+    final report's format follows ``output_path``'s suffix. With ``cache``
+    only new or changed exports are parsed, and only exports whose rules
+    version changed are re-classified. With ``window`` comments dated outside
+    it, and with ``dedup`` repeated comments, are dropped before
+    classification. ``workers`` reads and normalizes exports, and classifies
+    large frames, in that many processes. ``memory`` measures the classified
+    frames. With ``text_cache`` comment texts classified in earlier frames or
+    runs are looked up instead of re-scanned. With a ``dedup`` index loaded
+    from disk the earlier report is kept (re-classified and windowed) and
+    this run's new comments are added.
+    """
+
+    from src.classify.batch import classification_version
+    from src.classify.context import PostContext
+    from src.classify.themes import ThemeTagger
+    from src.filters.cmu_rules import compile_rules
+    from src.utils.io_utils import list_csvs
+
+    config = load_config()
+    raw_rules = config.get("rules", {})
+    rules = compile_rules(raw_rules)
+    tagger = ThemeTagger.from_config(config)
+    context = PostContext.from_config(config, rules)
+    version = classification_version(raw_rules, tagger, context.weights)
+    previous = previous_output(output_path, dedup)
+    pool = _open_pool(config, workers, text_cache)
+
+    normalized_path = with_format(work_dir / "comments_raw.csv", fmt) if work_dir else None
+    classified_path = with_format(work_dir / "comments_classified.csv", fmt) if work_dir else None
+
+    normalize = StageMeter("normalize")
+    classify = StageMeter("classify", upstream=normalize)
+    export = StageMeter("export", upstream=classify)
+    normalize.metrics.bytes_read = sum(path.stat().st_size for path in list_csvs(source_dir))
+
+    frames = count_rows(normalized_frames(source_dir, chunksize, cache, workers))
+    frames = normalize.wrap(tee_frames(deduped_frames(windowed_frames(frames, window), dedup), normalized_path))
+    # The carried report is re-classified, so it follows the current rules.
+    frames = carried_frames(windowed_frames(previous, window), frames, dedup)
+    frames = classify.wrap(
+        tee_frames(
+            classified_frames(frames, rules, cache, version, tagger, context, pool, text_cache),
+            classified_path,
+        )
+    )
+    frames = measured_frames(frames, memory)
+    try:
+        with export:
+            written = write_frames(frames, output_path)
+    finally:
+        _close_pool(pool, text_cache)
+    if not written:
+        print(f"No CSVs found in {source_dir}")
+        raise SystemExit(1)
+    if cache is not None:
+        cache.save()
+    if dedup is not None:
+        dedup.save()
+
+    if on_step:
+        if normalized_path and classified_path:
+            on_step("Normalized", normalized_path)
+            on_step("Classified", classified_path)
+        on_step("Exported", output_path)
+    return output_path
+
+
+def cmd_pipeline(args: argparse.Namespace) -> None:
+    work_dir = Path(args.work_dir) if args.work_dir else None
+    cache = _open_cache(args)
+    dedup = _open_dedup(args)
+    window = _open_window(args)
+    memory = _open_memory(args)
+    text_cache = _open_text_cache(args, load_config())
+    output_path = run_pipeline(
+        Path(args.in_dir),
+        Path(args.out),
+        work_dir=work_dir,
+        chunksize=args.chunksize,
+        cache=cache,
+        workers=args.workers,
+        fmt=artifact_format(args),
+        dedup=dedup,
+        window=window,
+        memory=memory,
+        text_cache=text_cache,
+        on_step=lambda name, path: print(f"{name} -> {path}"),
+    )
+    if cache is not None:
+        print(f"Cache: {cache.summary()}")
+    _close_text_cache(text_cache)
+    _close_window(window)
+    _close_memory(memory)
+    if dedup is not None:
+        print(f"Dedup: {dedup.stats.summary()}")
+    print(f"Pipeline complete -> {output_path}")
+
+
+def store_filters(args: argparse.Namespace) -> dict:
+    """Collect the ``--days``/``--since``/... query flags into store filters."""
+
+    return {
+        "days": args.days,
+        "since": args.since,
+        "until": args.until,
+        "platform": args.platform,
+        "sentiment": args.sentiment,
+        "theme": args.theme,
+        "min_confidence": args.min_confidence,
+    }
+
+
+def cmd_store_load(args: argparse.Namespace) -> None:
+    from src.store.comment_store import CommentStore
+
+    total = 0
+    with CommentStore(args.db) as store:
+        for path in args.in_:
+            source = locate(path, artifact_format(args))
+            record_files_read([source])
+            for frame in joined_frames(count_rows(iter_frames(source, chunksize=args.chunksize)), source):
+                total += store.upsert(frame)
+        stored = store.count()
+    print(f"Upserted {total} comments ({stored} stored) -> {args.db}")
+
+
+def cmd_store_query(args: argparse.Namespace) -> None:
+    import pandas as pd
+
+    from src.store.comment_store import CommentStore
+
+    with CommentStore(args.db) as store:
+        frames = store.iter_query(limit=args.limit, **store_filters(args))
+        if args.out:
+            output_path = Path(args.out)
+            rows = write_frames(frames, output_path)
+            if not rows:
+                write_frames([ensure_schema(pd.DataFrame())], output_path)
+            print(f"Queried {store.count(**store_filters(args))} comments -> {output_path}")
+        else:
+            for frame in frames:
+                print(frame.to_string(index=False))
+            print(f"{store.count(**store_filters(args))} matching comments in {args.db}")
+
+
 def cmd_export(args: argparse.Namespace) -> None:
-    input_path = Path(args.in_)
     output_path = Path(args.out)
+    export_format = getattr(args, "to", None) or infer_format(output_path)
+    output_path = with_format(output_path, export_format)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copyfile(input_path, output_path)
+
+    if getattr(args, "db", None):
+        import pandas as pd
+
+        from src.store.comment_store import CommentStore
+
+        with CommentStore(args.db) as store:
+            if not write_frames(store.iter_query(**store_filters(args)), output_path, export_format):
+                write_frames([ensure_schema(pd.DataFrame())], output_path, export_format)
+        print(f"Exported -> {output_path}")
+        return
+
+    if not args.in_:
+        raise SystemExit("export needs --in or --db")
+    input_path = locate(args.in_, artifact_format(args))
+    record_files_read([input_path])
+    if infer_format(input_path) == export_format:
+        shutil.copyfile(input_path, output_path)
+        record(bytes_written=output_path.stat().st_size)
+    else:
+        write_frames(iter_frames(input_path), output_path, export_format)
     print(f"Exported -> {output_path}")
 
 
+def add_store_filters(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--days", type=int, default=None, help="Only comments from the last N days")
+    parser.add_argument(
+        "--since", type=moment_arg, default=None, help="Only comments on or after this date (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        "--until", type=moment_arg, default=None, help="Only comments on or before this date (YYYY-MM-DD)"
+    )
+    parser.add_argument("--platform", default=None, help="Only comments from this platform")
+    parser.add_argument("--sentiment", default=None, help="Only comments with this sentiment")
+    parser.add_argument("--theme", default=None, help="Only comments tagged with this theme")
+    parser.add_argument(
+        "--min_confidence", type=float, default=None, help="Only comments at or above this confidence"
+    )
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--run_log", default=None, help="Append per-stage metrics as JSON lines here (default: run_log in config)"
+    )
+    parser.add_argument(
+        "--profile", default=None, help="Run the command under cProfile and dump the stats to this file"
+    )
     subparsers = parser.add_subparsers(dest="command")
 
     find_parser = subparsers.add_parser("find", help="Generate search queries")
     find_parser.set_defaults(func=cmd_find)
-    find_parser.add_argument("--window", default="21d", help="Lookback window (unused placeholder)")
+    find_parser.add_argument(
+        "--window",
+        type=window_arg,
+        default=None,
+        help="Restrict queries to this lookback, e.g. 21d, 6w or 48h; all for no date limit "
+        "(default: time_window in config.yaml, else 21d)",
+    )
     find_parser.add_argument("--out", required=True, help="Output CSV path")
+    find_parser.add_argument(
+        "--search",
+        action="store_true",
+        help="Also run the queries (pooled, rate-limited and cached; see search in config.yaml)",
+    )
+    find_parser.add_argument(
+        "--results", default=None, help="Search results CSV path (default: <out>_results.csv)"
+    )
 
     parse_parser = subparsers.add_parser("parse-exports", help="Normalize CSV exports")
     parse_parser.set_defaults(func=cmd_parse_exports)
     parse_parser.add_argument("--in_dir", required=True, help="Directory containing CSV exports")
     parse_parser.add_argument("--out", required=True, help="Normalized CSV output path")
+    parse_parser.add_argument(
+        "--window",
+        type=window_arg,
+        default=None,
+        help="Only keep comments from this lookback window, e.g. 21d, 6w or 48h (default: all)",
+    )
+    parse_parser.add_argument(
+        "--chunksize", type=int, default=None, help="Stream exports in batches of this many rows"
+    )
+    parse_parser.add_argument(
+        "--format",
+        choices=sorted(ARTIFACT_SUFFIXES),
+        default=None,
+        help="Artifact format (default: artifact_format in config.yaml, else csv)",
+    )
+    parse_parser.add_argument(
+        "--split_posts",
+        action="store_true",
+        help="Store each post once in <out>_posts and key comments to it (classify joins them back)",
+    )
+    parse_parser.add_argument(
+        "--memory_report",
+        action="store_true",
+        help="Report frame memory against plain object columns (slower: measures every string)",
+    )
+    parse_parser.add_argument(
+        "--workers", type=int, default=None, help="Read and normalize exports in this many processes"
+    )
+    parse_parser.add_argument(
+        "--cache_dir", default=None, help="Reuse per-export results cached here across runs"
+    )
+    parse_parser.add_argument(
+        "--dedup", action="store_true", help="Drop comments repeated across overlapping exports"
+    )
+    parse_parser.add_argument(
+        "--dedup_index",
+        default=None,
+        help="Persistent seen-set (.npy); comments seen in earlier runs are dropped too",
+    )
 
     classify_parser = subparsers.add_parser("classify", help="Classify normalized comments")
     classify_parser.set_defaults(func=cmd_classify)
     classify_parser.add_argument("--in", dest="in_", required=True, help="Input CSV path")
     classify_parser.add_argument("--out", required=True, help="Output CSV path")
+    classify_parser.add_argument(
+        "--window",
+        type=window_arg,
+        default=None,
+        help="Only keep comments from this lookback window, e.g. 21d, 6w or 48h (default: all)",
+    )
+    classify_parser.add_argument(
+        "--chunksize", type=int, default=None, help="Classify in batches of this many rows"
+    )
+    classify_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Classify frames of at least 50,000 rows in this many processes",
+    )
+    classify_parser.add_argument(
+        "--text_cache",
+        default=None,
+        help="SQLite cache of results per comment text (default: text_cache in config.yaml)",
+    )
+    classify_parser.add_argument(
+        "--format",
+        choices=sorted(ARTIFACT_SUFFIXES),
+        default=None,
+        help="Artifact format (default: artifact_format in config.yaml, else csv)",
+    )
+    classify_parser.add_argument(
+        "--memory_report",
+        action="store_true",
+        help="Report frame memory against plain object columns (slower: measures every string)",
+    )
 
     export_parser = subparsers.add_parser("export", help="Copy final CSV to destination")
     export_parser.set_defaults(func=cmd_export)
-    export_parser.add_argument("--in", dest="in_", required=True, help="Input CSV path")
+    export_parser.add_argument("--in", dest="in_", default=None, help="Input CSV path")
     export_parser.add_argument("--out", required=True, help="Output CSV path")
+    export_parser.add_argument(
+        "--db", default=None, help="Export comments from this SQLite store instead of --in"
+    )
+    add_store_filters(export_parser)
+    export_parser.add_argument(
+        "--format",
+        choices=sorted(ARTIFACT_SUFFIXES),
+        default=None,
+        help="Format of the input artifact (default: artifact_format in config.yaml)",
+    )
+    export_parser.add_argument(
+        "--to",
+        choices=sorted(ARTIFACT_SUFFIXES),
+        default=None,
+        help="Report format (default: from the --out suffix, csv if unknown)",
+    )
+
+    pipeline_parser = subparsers.add_parser(
+        "pipeline", help="Normalize, classify and export in one pass"
+    )
+    pipeline_parser.set_defaults(func=cmd_pipeline)
+    pipeline_parser.add_argument("--in_dir", required=True, help="Directory containing CSV exports")
+    pipeline_parser.add_argument("--out", required=True, help="Final report CSV path")
+    pipeline_parser.add_argument(
+        "--work_dir", default=None, help="Also write intermediate CSVs here (for debugging)"
+    )
+    pipeline_parser.add_argument(
+        "--window",
+        type=window_arg,
+        default=None,
+        help="Only keep comments from this lookback window, e.g. 21d, 6w or 48h (default: all)",
+    )
+    pipeline_parser.add_argument(
+        "--chunksize", type=int, default=None, help="Stream exports in batches of this many rows"
+    )
+    pipeline_parser.add_argument(
+        "--format",
+        choices=sorted(ARTIFACT_SUFFIXES),
+        default=None,
+        help="Format of the --work_dir intermediates",
+    )
+    pipeline_parser.add_argument(
+        "--memory_report",
+        action="store_true",
+        help="Report frame memory against plain object columns (slower: measures every string)",
+    )
+    pipeline_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Read and normalize exports, and classify large frames, in this many processes",
+    )
+    pipeline_parser.add_argument(
+        "--text_cache",
+        default=None,
+        help="SQLite cache of results per comment text (default: text_cache in config.yaml)",
+    )
+    pipeline_parser.add_argument(
+        "--cache_dir", default=None, help="Reuse per-export results cached here across runs"
+    )
+    pipeline_parser.add_argument(
+        "--dedup", action="store_true", help="Drop comments repeated across overlapping exports"
+    )
+    pipeline_parser.add_argument(
+        "--dedup_index",
+        default=None,
+        help="Persistent seen-set (.npy); comments seen in earlier runs are dropped too",
+    )
+
+    store_load_parser = subparsers.add_parser(
+        "store-load", help="Upsert normalized or classified comments into a SQLite store"
+    )
+    store_load_parser.set_defaults(func=cmd_store_load)
+    store_load_parser.add_argument("--db", required=True, help="SQLite database path")
+    store_load_parser.add_argument(
+        "--in", dest="in_", nargs="+", required=True, help="Normalized or classified artifacts"
+    )
+    store_load_parser.add_argument(
+        "--chunksize", type=int, default=50_000, help="Upsert in batches of this many rows"
+    )
+    store_load_parser.add_argument(
+        "--format",
+        choices=sorted(ARTIFACT_SUFFIXES),
+        default=None,
+        help="Format of the input artifacts (default: artifact_format in config.yaml)",
+    )
+
+    store_query_parser = subparsers.add_parser("store-query", help="Query the SQLite comment store")
+    store_query_parser.set_defaults(func=cmd_store_query)
+    store_query_parser.add_argument("--db", required=True, help="SQLite database path")
+    store_query_parser.add_argument("--out", default=None, help="Write matches here instead of printing")
+    store_query_parser.add_argument("--limit", type=int, default=None, help="Return at most N comments")
+    add_store_filters(store_query_parser)
 
     return parser
 
 
+def run_log_path(args: argparse.Namespace) -> Path | None:
+    """Return the run log from ``--run_log`` or ``run_log`` in ``config.yaml``."""
+
+    if getattr(args, "run_log", None):
+        return Path(args.run_log)
+    if CONFIG_PATH.exists():
+        configured = (load_config() or {}).get("run_log")
+        return Path(configured) if configured else None
+    return None
+
+
+def run_command(args: argparse.Namespace) -> None:
+    """Run ``args.func`` as an instrumented run, under cProfile with ``--profile``."""
+
+    log_path = run_log_path(args)
+    with Run(args.command, log_path) as run:
+        if getattr(args, "profile", None):
+            import cProfile
+            import pstats
+
+            profiler = cProfile.Profile()
+            try:
+                profiler.runcall(args.func, args)
+            finally:
+                profiler.dump_stats(args.profile)
+                pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+                print(f"Profile -> {args.profile}")
+        else:
+            args.func(args)
+
+    stages = run.stages or [run.metrics]
+    for stage in stages:
+        print(
+            f"Stage {stage.stage}: {stage.wall_seconds:.2f}s wall, {stage.cpu_seconds:.2f}s cpu, "
+            f"rows {stage.rows_in}->{stage.rows_out}, peak RSS {stage.peak_rss_mb:.0f} MiB"
+        )
+    if log_path is not None:
+        print(f"Run log -> {log_path}")
+
+
 def main(argv: list[str] | None = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
     if hasattr(args, "func"):
-        args.func(args)
+        run_command(args)
     else:
         parser.print_help()
 
@@ -0,0 +1,291 @@
+"""One shared browser for every collector, with saved logins per platform.
+
+:class:`BrowserPool` launches Chromium once and keeps one browser context
+per platform, created from that platform's saved ``storage_state`` (cookies
+and local storage) so a login done once is reused on later runs. Pages are
+pooled: :meth:`BrowserPool.page` hands out an idle page or opens a new one,
+up to ``max_pages`` at a time, and :meth:`BrowserPool.visit` loads many URLs
+concurrently on them. Playwright's sync API is tied to one thread, so the
+pool uses the async API; :class:`BrowserRunner` drives a pool from
+synchronous code and keeps its browser open until the runner is closed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping, TypeVar
+
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
+
+DEFAULT_STATE_DIR = Path("data/browser_state")
+LOGIN_URLS = {
+    "facebook": "https://www.facebook.com/login",
+    "instagram": "https://www.instagram.com/accounts/login/",
+    "tiktok": "https://www.tiktok.com/login",
+}
+
+T = TypeVar("T")
+
+
+def state_path(platform: str, state_dir: Path | str = DEFAULT_STATE_DIR) -> Path:
+    """Return where ``platform``'s login (Playwright ``storage_state``) is saved."""
+
+    return Path(state_dir) / f"{platform.strip().lower()}.json"
+
+
+async def _prompt_login(platform: str) -> None:
+    await asyncio.to_thread(input, f"Complete the {platform} login in the browser and press ENTER to continue...")
+
+
+class BrowserPool:
+    """A single Chromium process with a pooled context and pages per platform."""
+
+    def __init__(
+        self,
+        *,
+        headless: bool = True,
+        state_dir: Path | str = DEFAULT_STATE_DIR,
+        max_pages: int = 4,
+        timeout_ms: float = 30_000,
+        executable_path: str | None = None,
+    ) -> None:
+        self.headless = headless
+        self.state_dir = Path(state_dir)
+        self.max_pages = max(1, max_pages)
+        self.timeout_ms = timeout_ms
+        self.executable_path = executable_path
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._contexts: dict[str, BrowserContext] = {}
+        self._idle: dict[str, list[Page]] = {}
+        self._logged_in: set[str] = set()
+        self._slots = asyncio.Semaphore(self.max_pages)
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_config(cls, config: Mapping | None, **overrides) -> "BrowserPool":
+        """Build a pool from the optional ``collectors`` block of ``config.yaml``."""
+
+        block = (config or {}).get("collectors") or {}
+        options = {
+            "headless": bool(block.get("headless", True)),
+            "state_dir": block.get("state_dir", DEFAULT_STATE_DIR),
+            "max_pages": int(block.get("max_pages", 4)),
+            "executable_path": block.get("executable_path"),
+            **overrides,
+        }
+        return cls(**options)
+
+    async def start(self) -> "BrowserPool":
+        if self._browser is None:
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.headless, executable_path=self.executable_path
+            )
+        return self
+
+    async def close(self) -> None:
+        """Save the refreshed logins, then close the pages, contexts and browser."""
+
+        for platform, context in self._contexts.items():
+            if platform in self._logged_in:
+                await self.save_state(platform)
+            await context.close()
+        self._contexts.clear()
+        self._idle.clear()
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self) -> "BrowserPool":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def browser(self) -> Browser | None:
+        return self._browser
+
+    def has_login(self, platform: str) -> bool:
+        return state_path(platform, self.state_dir).exists()
+
+    async def context(self, platform: str) -> BrowserContext:
+        """Return ``platform``'s context, created on first use from its saved login."""
+
+        async with self._lock:
+            if platform not in self._contexts:
+                await self.start()
+                saved = state_path(platform, self.state_dir)
+                if saved.exists():
+                    self._logged_in.add(platform)
+                context = await self._browser.new_context(storage_state=saved if saved.exists() else None)
+                context.set_default_timeout(self.timeout_ms)
+                self._contexts[platform] = context
+                self._idle[platform] = []
+            return self._contexts[platform]
+
+    async def save_state(self, platform: str) -> Path:
+        """Write ``platform``'s cookies and local storage so later runs skip the login."""
+
+        path = state_path(platform, self.state_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        await self._contexts[platform].storage_state(path=path)
+        return path
+
+    async def ensure_login(
+        self,
+        platform: str,
+        login_url: str | None = None,
+        wait_for_login: Callable[[str], Awaitable[None]] = _prompt_login,
+    ) -> None:
+        """Log in to ``platform`` by hand once, unless a saved login exists.
+
+        The login page opens in the browser and ``wait_for_login`` (by default
+        a prompt to press ENTER) waits for the operator; the session is then
+        saved. This needs a visible browser, so a headless pool without a
+        saved login raises ``RuntimeError``.
+        """
+
+        if self.has_login(platform):
+            return
+        if self.headless:
+            raise RuntimeError(
+                f"No saved {platform} login in {self.state_dir}; log in once with headless: false"
+            )
+        async with self.page(platform) as page:
+            await page.goto(login_url or LOGIN_URLS.get(platform, "about:blank"))
+            await wait_for_login(platform)
+        self._logged_in.add(platform)
+        await self.save_state(platform)
+
+    @asynccontextmanager
+    async def page(self, platform: str) -> AsyncIterator[Page]:
+        """Lend a page in ``platform``'s context, waiting while ``max_pages`` are in use."""
+
+        async with self._slots:
+            context = await self.context(platform)
+            idle = self._idle[platform]
+            page = idle.pop() if idle else await context.new_page()
+            try:
+                yield page
+            finally:
+                if not page.is_closed():
+                    idle.append(page)
+
+    async def visit(
+        self, platform: str, urls: Iterable[str], extract: Callable[[Page], Awaitable[T]]
+    ) -> list[T]:
+        """Load each URL on a pooled page and return ``extract(page)`` for each, in order."""
+
+        async def visit_one(url: str) -> T:
+            async with self.page(platform) as page:
+                await page.goto(url)
+                return await extract(page)
+
+        return list(await asyncio.gather(*(visit_one(url) for url in urls)))
+
+
+class _Synced:
+    """An async Playwright object whose methods are run to completion by a :class:`BrowserRunner`."""
+
+    def __init__(self, target: Any, runner: "BrowserRunner") -> None:
+        self._target = target
+        self._runner = runner
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        if not callable(value):
+            return self._runner.synced(value)
+
+        def call(*args, **kwargs):
+            result = value(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = self._runner.run(result)
+            return self._runner.synced(result)
+
+        return call
+
+    def __repr__(self) -> str:
+        return f"<synced {self._target!r}>"
+
+
+class BrowserRunner:
+    """Drive a :class:`BrowserPool` from synchronous code for the runner's whole life.
+
+    The pool's browser, contexts and pages belong to one event loop, which
+    the runner keeps running on a background thread, so every
+    :meth:`collect` and :meth:`session` reuses the same browser. Close the
+    runner (or leave its ``with`` block) to save the logins and shut the
+    browser down.
+    """
+
+    def __init__(self, pool: BrowserPool | None = None) -> None:
+        self.pool = pool or BrowserPool()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="browser-pool", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "BrowserRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def run(self, awaitable: Awaitable[T]) -> T:
+        """Wait for ``awaitable`` on the pool's event loop and return its result."""
+
+        if self._loop.is_closed():
+            raise RuntimeError("BrowserRunner is closed")
+
+        async def wait() -> T:
+            return await awaitable
+
+        return asyncio.run_coroutine_threadsafe(wait(), self._loop).result()
+
+    def synced(self, value: Any) -> Any:
+        """Wrap Playwright objects in ``value`` so their async methods can be called synchronously."""
+
+        if isinstance(value, list):
+            return [self.synced(item) for item in value]
+        if type(value).__module__.startswith("playwright."):
+            return _Synced(value, self)
+        return value
+
+    def collect(self, platform: str, urls: Iterable[str], extract: Callable[[Page], Awaitable[T]]) -> list[T]:
+        """Run :meth:`BrowserPool.visit` and return its results, leaving the browser open."""
+
+        return self.run(self.pool.visit(platform, urls, extract))
+
+    @contextmanager
+    def session(self, platform: str) -> Iterator[Any]:
+        """Lend a pooled page in ``platform``'s context, with methods callable synchronously."""
+
+        lease = self.pool.page(platform)
+        page = self.run(lease.__aenter__())
+        try:
+            yield self.synced(page)
+        finally:
+            self.run(lease.__aexit__(None, None, None))
+
+    def close(self) -> None:
+        """Close the pool, then stop the event loop."""
+
+        if self._loop.is_closed():
+            return
+        try:
+            self.run(self.pool.close())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+
+__all__ = ["BrowserPool", "BrowserRunner", "DEFAULT_STATE_DIR", "LOGIN_URLS", "state_path"]
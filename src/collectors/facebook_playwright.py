@@ -3,32 +3,44 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from pathlib import Path
 from typing import Iterator
 
-from playwright.sync_api import sync_playwright
+from .browser_pool import DEFAULT_STATE_DIR, LOGIN_URLS, BrowserPool, BrowserRunner
 
 
 @contextmanager
-def open_session(start_url: str) -> Iterator[tuple]:
-    """Launch Chromium and yield (browser, context, page).
-
-    The caller is responsible for closing the browser. This helper is purposely
-    minimal and expects the human operator to perform any authentication.
+def open_session(
+    start_url: str,
+    platform: str = "facebook",
+    *,
+    state_dir: Path | str = DEFAULT_STATE_DIR,
+    headless: bool = False,
+    runner: BrowserRunner | None = None,
+) -> Iterator[tuple]:
+    """Open ``start_url`` on a pooled page and yield (browser, context, page).
+
+    The session comes from ``runner``'s :class:`~src.collectors.browser_pool.BrowserPool`,
+    so several sessions share one browser and the runner's owner closes it;
+    without a ``runner`` a pool is started for this session alone. The
+    context starts from ``platform``'s saved login. Only when there is none
+    does the helper wait for the human operator to log in, and it then saves
+    the session so later runs skip that step. The yielded objects are the
+    pool's async Playwright objects with their methods made synchronous.
     """
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-        page.goto(start_url)
-        print("Complete login and press ENTER to continue...")
-        input()
-        try:
-            yield browser, context, page
-        finally:
-            page.close()
-            context.close()
-            browser.close()
+    owned = runner is None
+    if owned:
+        runner = BrowserRunner(BrowserPool(headless=headless, state_dir=state_dir))
+    try:
+        runner.run(runner.pool.ensure_login(platform, LOGIN_URLS.get(platform, start_url)))
+        context = runner.run(runner.pool.context(platform))
+        with runner.session(platform) as page:
+            page.goto(start_url)
+            yield runner.synced(runner.pool.browser), runner.synced(context), page
+    finally:
+        if owned:
+            runner.close()
 
 
 __all__ = ["open_session"]
@@ -15,21 +15,22 @@ HEADERS = {
         "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36"
     )
 }
+SEARCH_URL = "https://www.google.com/search"
 
 
-def google_search(query: str, *, tbs: str | None = None, pause: tuple[float, float] = (3, 6)) -> list[dict[str, str]]:
-    """Perform a lightweight Google search and parse the first page of results."""
+def search_url(query: str, tbs: str | None = None, base_url: str = SEARCH_URL) -> str:
+    """Return the results-page URL for ``query`` with the optional ``tbs`` restriction."""
 
-    url = f"https://www.google.com/search?q={quote_plus(query)}"
+    url = f"{base_url}?q={quote_plus(query)}"
     if tbs:
         url += f"&tbs={tbs}"
+    return url
 
-    response = requests.get(url, headers=HEADERS, timeout=20)
-    response.raise_for_status()
 
-    time.sleep(random.uniform(*pause))
+def parse_results(html: str) -> list[dict[str, str]]:
+    """Return ``{"title", "url"}`` for every organic result on a results page."""
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(html, "html.parser")
     results: list[dict[str, str]] = []
 
     for result in soup.select("div.g"):
@@ -43,4 +44,29 @@ def google_search(query: str, *, tbs: str | None = None, pause: tuple[float, flo
     return results
 
 
-__all__ = ["google_search", "HEADERS"]
+def google_search(
+    query: str,
+    *,
+    tbs: str | None = None,
+    pause: tuple[float, float] | None = (3, 6),
+    session: requests.Session | None = None,
+    base_url: str = SEARCH_URL,
+    timeout: float = 20,
+) -> list[dict[str, str]]:
+    """Perform a lightweight Google search and parse the first page of results.
+
+    ``session`` reuses its pooled connections instead of opening a new one.
+    ``pause=None`` skips the politeness sleep, for callers that rate-limit
+    themselves (see :class:`~src.collectors.search_runner.SearchRunner`).
+    """
+
+    response = (session or requests).get(search_url(query, tbs, base_url), headers=HEADERS, timeout=timeout)
+    response.raise_for_status()
+
+    if pause:
+        time.sleep(random.uniform(*pause))
+
+    return parse_results(response.text)
+
+
+__all__ = ["HEADERS", "SEARCH_URL", "google_search", "parse_results", "search_url"]
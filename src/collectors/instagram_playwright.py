@@ -9,8 +9,8 @@ from .facebook_playwright import open_session as facebook_open_session
 
 
 @contextmanager
-def open_session(start_url: str) -> Iterator[tuple]:
-    with facebook_open_session(start_url) as session:
+def open_session(start_url: str, **options) -> Iterator[tuple]:
+    with facebook_open_session(start_url, "instagram", **options) as session:
         yield session
 
 
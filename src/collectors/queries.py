@@ -0,0 +1,120 @@
+"""Expand search keywords into location-, site- and date-restricted queries.
+
+:func:`expand_queries` crosses every keyword with the configured locations,
+a ``site:`` filter per platform and the ``--window`` date restriction. A
+combination that mentions one of the rules' negative terms is dropped, as is
+one whose words (case, punctuation and order aside) were already queried,
+and queries are yielded as they are built, so the keyword list is read once
+and never held in memory.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import astuple, dataclass
+from datetime import datetime
+from typing import Iterable, Iterator
+
+from src.utils.time_utils import parse_window
+
+PLATFORM_SITES = {"facebook": "facebook.com", "instagram": "instagram.com", "tiktok": "tiktok.com"}
+QUERY_COLUMNS = ["query", "keyword", "location", "platform", "tbs"]
+
+_WORD = re.compile(r"[\w@#]+")
+
+
+@dataclass(frozen=True)
+class Query:
+    """One search query and the combination it was built from."""
+
+    query: str
+    keyword: str
+    location: str = ""
+    platform: str = ""
+    tbs: str = ""
+
+    def row(self) -> tuple[str, ...]:
+        return astuple(self)
+
+
+def window_tbs(window: str | None, *, now: datetime | None = None) -> str:
+    """Return Google's ``tbs`` date range for a ``21d``-style window, ``""`` for ``None``/``"all"``."""
+
+    if not window or window.strip().lower() == "all":
+        return ""
+    start, end = parse_window(window, now=now)
+    return f"cdr:1,cd_min:{start.month}/{start.day}/{start.year},cd_max:{end.month}/{end.day}/{end.year}"
+
+
+def platform_site(platform: str) -> str:
+    """Return the domain for a ``site:`` filter (``"tiktok"`` -> ``"tiktok.com"``)."""
+
+    name = platform.strip().lower()
+    return PLATFORM_SITES.get(name) or (name if "." in name else f"{name}.com")
+
+
+def _words(text: str) -> frozenset[str]:
+    return frozenset(_WORD.findall(text.casefold()))
+
+
+def _phrase(text: str) -> str:
+    return f'"{text}"' if " " in text else text
+
+
+def _negative_pattern(terms: Iterable[str]) -> re.Pattern | None:
+    terms = sorted({term.strip().casefold() for term in terms if term and term.strip()}, key=len, reverse=True)
+    if not terms:
+        return None
+    return re.compile(r"(?<!\w)(?:" + "|".join(re.escape(term) for term in terms) + r")(?!\w)")
+
+
+def expand_queries(
+    keywords: Iterable[str],
+    locations: Iterable[str] = (),
+    platforms: Iterable[str] = (),
+    window: str | None = None,
+    negative_terms: Iterable[str] = (),
+    *,
+    now: datetime | None = None,
+) -> Iterator[Query]:
+    """Yield the distinct queries for ``keywords`` x ``locations`` x ``platforms``.
+
+    ``keywords`` may be a file object; blank lines are skipped. A location
+    is left out for keywords that already name it ("band Grand Junction"
+    with "Grand Junction, CO"), and empty ``locations`` or ``platforms``
+    leave out that part of the query.
+    """
+
+    negative = _negative_pattern(negative_terms)
+
+    def usable(text: str) -> bool:
+        return negative is None or not negative.search(text.casefold())
+
+    places = [
+        (location, _words(location), _words(location.split(",")[0]))
+        for location in (text.strip() for text in locations)
+        if location and usable(location)
+    ] or [("", frozenset(), frozenset())]
+    sites = [(platform.strip(), platform_site(platform)) for platform in platforms if platform.strip()] or [("", "")]
+    tbs = window_tbs(window, now=now)
+
+    seen: set[frozenset[str]] = set()
+    for line in keywords:
+        keyword = line.strip()
+        if not keyword or not usable(keyword):
+            continue
+        keyword_words = _words(keyword)
+        for location, location_words, place_words in places:
+            if place_words and place_words <= keyword_words:
+                location, location_words = "", frozenset()
+            words = keyword_words | location_words
+            if words in seen:
+                continue
+            seen.add(words)
+            terms = [_phrase(keyword)] + ([_phrase(location)] if location else [])
+            for platform, site in sites:
+                query = " ".join(terms + ([f"site:{site}"] if site else []))
+                yield Query(query, keyword, location, platform, tbs)
+
+
+__all__ = ["PLATFORM_SITES", "QUERY_COLUMNS", "Query", "expand_queries", "platform_site", "window_tbs"]
@@ -0,0 +1,233 @@
+"""Run many search queries concurrently, politely and only once per window.
+
+:func:`~src.collectors.google_dork.google_search` fetches one page per call.
+:class:`SearchRunner` drives it from a thread pool that shares one pooled
+``requests`` session, spaces requests with a :class:`TokenBucket` instead of
+sleeping after each one, and keeps answers in a :class:`SearchCache` on disk
+so a rerun inside the cache TTL makes no requests at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Mapping
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.collectors.google_dork import HEADERS, SEARCH_URL, google_search
+
+DEFAULT_CACHE_DIR = Path("data/cache/search")
+
+
+class TokenBucket:
+    """Allow ``rate`` acquisitions per second on average, in bursts of up to ``burst``.
+
+    Safe to share between threads: each caller reserves its slot under the
+    lock and sleeps outside it, so waiting callers are served in order.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available; return the seconds waited."""
+
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            self._sleep(wait)
+        return wait
+
+
+class SearchCache:
+    """Search results on disk, one JSON file per ``(query, tbs)``, expiring after ``ttl`` seconds."""
+
+    def __init__(self, directory: Path | str = DEFAULT_CACHE_DIR, ttl: float = 24 * 3600) -> None:
+        self.root = Path(directory)
+        self.ttl = ttl
+
+    @staticmethod
+    def key(query: str, tbs: str | None) -> str:
+        return hashlib.sha256(json.dumps([query, tbs or ""]).encode("utf-8")).hexdigest()
+
+    def _path(self, query: str, tbs: str | None) -> Path:
+        return self.root / f"{self.key(query, tbs)}.json"
+
+    def _expired(self, entry: Mapping, now: float) -> bool:
+        return now - float(entry.get("fetched_at", 0)) > self.ttl
+
+    def get(self, query: str, tbs: str | None) -> list[dict[str, str]] | None:
+        """Return the cached results, or ``None`` when missing or expired."""
+
+        path = self._path(query, tbs)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if self._expired(entry, time.time()):
+            path.unlink(missing_ok=True)
+            return None
+        return entry["results"]
+
+    def put(self, query: str, tbs: str | None, results: list[dict[str, str]]) -> None:
+        path = self._path(query, tbs)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"query": query, "tbs": tbs or "", "fetched_at": time.time(), "results": results}
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+        tmp_path.replace(path)
+
+    def evict_expired(self) -> int:
+        """Delete expired or unreadable entries and return how many were removed."""
+
+        now = time.time()
+        removed = 0
+        for path in self.root.glob("*.json"):
+            try:
+                expired = self._expired(json.loads(path.read_text(encoding="utf-8")), now)
+            except (OSError, ValueError):
+                expired = True
+            if expired:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+@dataclass
+class SearchOutcome:
+    """Results of one query; ``error`` is set instead of raising when the request failed."""
+
+    query: str
+    tbs: str | None = None
+    results: list[dict[str, str]] = field(default_factory=list)
+    cached: bool = False
+    error: str = ""
+
+
+class SearchRunner:
+    """Run queries on ``workers`` threads over one pooled session, at most ``rate`` requests per second."""
+
+    def __init__(
+        self,
+        *,
+        workers: int = 4,
+        rate: float = 0.25,
+        burst: int = 1,
+        cache: SearchCache | None = None,
+        base_url: str = SEARCH_URL,
+        timeout: float = 20,
+    ) -> None:
+        self.workers = max(1, workers)
+        self.bucket = TokenBucket(rate, burst)
+        self.cache = cache
+        self.base_url = base_url
+        self.timeout = timeout
+        self.stats: Counter[str] = Counter()
+        self._stats_lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @classmethod
+    def from_config(cls, config: Mapping | None, **overrides) -> "SearchRunner":
+        """Build a runner from the optional ``search`` block of ``config.yaml``."""
+
+        block = (config or {}).get("search") or {}
+        ttl_hours = float(block.get("cache_ttl_hours", 24))
+        cache = SearchCache(block.get("cache_dir", DEFAULT_CACHE_DIR), ttl_hours * 3600) if ttl_hours > 0 else None
+        options = {
+            "workers": int(block.get("workers", 4)),
+            "rate": float(block.get("requests_per_minute", 15)) / 60,
+            "burst": int(block.get("burst", 1)),
+            "cache": cache,
+            "base_url": block.get("base_url", SEARCH_URL),
+            **overrides,
+        }
+        return cls(**options)
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def search(self, query: str, tbs: str | None = None) -> SearchOutcome:
+        """Return the results for one query, from the cache when it holds a fresh answer."""
+
+        if self.cache is not None:
+            cached = self.cache.get(query, tbs)
+            if cached is not None:
+                self._count("cached")
+                return SearchOutcome(query, tbs, cached, cached=True)
+
+        self.bucket.acquire()
+        try:
+            results = google_search(
+                query, tbs=tbs, pause=None, session=self.session, base_url=self.base_url, timeout=self.timeout
+            )
+        except requests.RequestException as exc:
+            self._count("failed")
+            return SearchOutcome(query, tbs, error=str(exc))
+
+        self._count("fetched")
+        if self.cache is not None:
+            self.cache.put(query, tbs, results)
+        return SearchOutcome(query, tbs, results)
+
+    def run(self, queries: Iterable[tuple[str, str | None]]) -> Iterator[SearchOutcome]:
+        """Yield an outcome per ``(query, tbs)`` in input order.
+
+        At most a few batches of work are in flight, so ``queries`` may be a
+        long generator.
+        """
+
+        pending: deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="search") as executor:
+            for query, tbs in queries:
+                pending.append(executor.submit(self.search, query, tbs))
+                if len(pending) >= self.workers * 4:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def summary(self) -> str:
+        return ", ".join(f"{name}={count}" for name, count in sorted(self.stats.items())) or "empty"
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "SearchRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+__all__ = ["DEFAULT_CACHE_DIR", "SearchCache", "SearchOutcome", "SearchRunner", "TokenBucket"]
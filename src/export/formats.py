@@ -0,0 +1,254 @@
+"""Format-aware readers and writers for pipeline artifacts.
+
+CSV stays the default and the export format for the final report. Parquet
+and Feather (both via the optional ``pyarrow`` package) store the same frames
+compressed, with explicit dtypes so they can be re-loaded quickly and by
+column.
+
+The path helpers (:func:`infer_format`, :func:`with_format`, :func:`locate`)
+are used while the CLI parses its arguments, so pandas is only imported by
+the functions that read or write frames.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Sequence
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+ARTIFACT_SUFFIXES: dict[str, str] = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "feather": ".feather",
+}
+CATEGORICAL_COLUMNS: tuple[str, ...] = ("platform", "sentiment")
+COMPRESSION = "zstd"
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError(
+            "Parquet/Feather artifacts need the optional 'pyarrow' package: pip install pyarrow"
+        ) from exc
+    return pq
+
+
+def _check_format(fmt: str) -> str:
+    if fmt not in ARTIFACT_SUFFIXES:
+        raise ValueError(f"Unknown artifact format '{fmt}'. Choose one of: {', '.join(ARTIFACT_SUFFIXES)}")
+    return fmt
+
+
+def infer_format(path: Path | str) -> str:
+    """Return the artifact format implied by ``path``'s suffix (``csv`` if unknown)."""
+
+    suffix = Path(path).suffix.lower()
+    for fmt, known in ARTIFACT_SUFFIXES.items():
+        if suffix == known:
+            return fmt
+    return "csv"
+
+
+def with_format(path: Path | str, fmt: str | None) -> Path:
+    """Return ``path`` with the suffix for ``fmt``; unchanged when ``fmt`` is ``None``."""
+
+    path = Path(path)
+    if fmt is None:
+        return path
+    return path.with_suffix(ARTIFACT_SUFFIXES[_check_format(fmt)])
+
+
+def locate(path: Path | str, fmt: str | None = None) -> Path:
+    """Return the artifact for ``path``, preferring the ``fmt`` variant if it exists."""
+
+    preferred = with_format(path, fmt)
+    return preferred if preferred.exists() else Path(path)
+
+
+def typed_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a copy of ``df`` with the explicit dtypes used by columnar artifacts.
+
+    ``platform`` and ``sentiment`` become categoricals and
+    ``confidence_cmumesa`` becomes a float. ``date_utc`` keeps the export's
+    own text ("3 days ago" included), so a report exported from a columnar
+    artifact matches one exported from CSV byte for byte. Other in-memory
+    categoricals are stored as plain strings: their categories differ per
+    batch, and Parquet dictionary-encodes repeated strings anyway.
+    """
+
+    import pandas as pd
+
+    from src.utils.dtypes import text_dtype
+
+    typed = df.copy()
+    if "confidence_cmumesa" in typed.columns:
+        typed["confidence_cmumesa"] = pd.to_numeric(typed["confidence_cmumesa"], errors="coerce")
+    for column in typed.columns:
+        if column in CATEGORICAL_COLUMNS:
+            typed[column] = typed[column].astype("category")
+        elif isinstance(typed[column].dtype, pd.CategoricalDtype):
+            typed[column] = typed[column].astype(text_dtype())
+    return typed
+
+
+class FrameWriter:
+    """Append frames to one artifact, opening it lazily on the first write.
+
+    CSV and Parquet are written batch by batch; Feather has no append mode, so
+    its batches are collected and written on :meth:`close`.
+    """
+
+    def __init__(self, path: Path | str, fmt: str | None = None) -> None:
+        self.path = Path(path)
+        self.fmt = _check_format(fmt or infer_format(self.path))
+        self.batches = 0
+        self._parquet = None
+        self._schema = None
+        self._pending: list[pd.DataFrame] = []
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if not self.batches:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.fmt == "csv":
+            frame.to_csv(self.path, index=False, mode="a" if self.batches else "w", header=not self.batches)
+        elif self.fmt == "parquet":
+            self._write_parquet(frame)
+        else:
+            self._pending.append(frame)
+        self.batches += 1
+
+    def _write_parquet(self, frame: pd.DataFrame) -> None:
+        pq = _require_pyarrow()
+        import pyarrow as pa
+
+        typed = typed_frame(frame)
+        if self._parquet is None:
+            schema = pa.Schema.from_pandas(typed, preserve_index=False)
+            fields = [
+                field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+                for field in schema
+            ]
+            self._schema = pa.schema(fields, metadata=schema.metadata)
+            self._parquet = pq.ParquetWriter(self.path, self._schema, compression=COMPRESSION)
+        table = pa.Table.from_pandas(typed, schema=self._schema, preserve_index=False)
+        self._parquet.write_table(table)
+
+    def close(self) -> None:
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+        if self._pending:
+            import pandas as pd
+
+            _require_pyarrow()
+            combined = typed_frame(pd.concat(self._pending, ignore_index=True))
+            combined.to_feather(self.path, compression=COMPRESSION)
+            self._pending = []
+
+    def __enter__(self) -> "FrameWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def save_frame(df: pd.DataFrame, path: Path | str, fmt: str | None = None) -> Path:
+    """Write ``df`` to ``path`` in ``fmt`` (inferred from the suffix by default)."""
+
+    with FrameWriter(path, fmt) as writer:
+        writer.write(df)
+    return writer.path
+
+
+def iter_frames(
+    path: Path | str,
+    *,
+    chunksize: int | None = None,
+    columns: Sequence[str] | None = None,
+    compact: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """Yield an artifact whole, or in batches of ``chunksize`` rows.
+
+    ``columns`` limits the load to those columns, which columnar formats can
+    skip reading entirely. With ``compact`` the comment columns are loaded
+    as the compact dtypes of :func:`~src.utils.dtypes.compact_frame`.
+    """
+
+    import pandas as pd
+
+    from src.utils.dtypes import compact_frame, compact_read_options
+    from src.utils.io_utils import CSV_READ_OPTIONS
+
+    path = Path(path)
+    fmt = infer_format(path)
+    usecols = list(columns) if columns is not None else None
+
+    if fmt == "csv":
+        options = compact_read_options() if compact else CSV_READ_OPTIONS
+        if chunksize:
+            yield from pd.read_csv(path, chunksize=chunksize, usecols=usecols, **options)
+        else:
+            yield pd.read_csv(path, usecols=usecols, **options)
+        return
+
+    for frame in _iter_columnar(path, fmt, chunksize, usecols):
+        yield compact_frame(frame) if compact else frame
+
+
+def _iter_columnar(
+    path: Path, fmt: str, chunksize: int | None, usecols: list[str] | None
+) -> Iterator[pd.DataFrame]:
+    import pandas as pd
+
+    if fmt == "parquet":
+        pq = _require_pyarrow()
+        if chunksize:
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=usecols):
+                yield batch.to_pandas()
+        else:
+            yield pd.read_parquet(path, columns=usecols)
+    else:
+        _require_pyarrow()
+        yield pd.read_feather(path, columns=usecols)
+
+
+def load_frame(
+    path: Path | str,
+    *,
+    columns: Sequence[str] | None = None,
+    nrows: int | None = None,
+) -> pd.DataFrame:
+    """Load an artifact, optionally only ``columns`` and the first ``nrows`` rows."""
+
+    import pandas as pd
+
+    from src.utils.io_utils import CSV_READ_OPTIONS
+
+    if nrows is not None and infer_format(path) == "csv":
+        usecols = list(columns) if columns is not None else None
+        return pd.read_csv(path, nrows=nrows, usecols=usecols, **CSV_READ_OPTIONS)
+    if nrows is not None and infer_format(path) == "parquet":
+        first = next(iter_frames(path, chunksize=nrows, columns=columns), None)
+        return first if first is not None else pd.DataFrame(columns=columns)
+
+    frame = next(iter_frames(path, columns=columns))
+    return frame.head(nrows) if nrows is not None else frame
+
+
+__all__ = [
+    "ARTIFACT_SUFFIXES",
+    "FrameWriter",
+    "infer_format",
+    "iter_frames",
+    "load_frame",
+    "locate",
+    "save_frame",
+    "typed_frame",
+    "with_format",
+]
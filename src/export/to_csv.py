@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import pandas as pd
 
+from src.export.formats import save_frame
+
 
 def save_csv(df: pd.DataFrame, path: str) -> None:
-    df.to_csv(path, index=False)
+    save_frame(df, path, "csv")
 
 
 __all__ = ["save_csv"]
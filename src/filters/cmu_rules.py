@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterable, List
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping
+
+RULE_BUCKETS: tuple[str, ...] = ("positive_terms", "negative_terms", "neutral_terms")
 
 
 @dataclass
@@ -25,28 +28,42 @@ def _contains_any(text: str, terms: Iterable[str]) -> List[str]:
     return hits
 
 
-def score_text(text: str, rules: Dict[str, Iterable[str]]) -> ScoredItem:
-    """Apply CMU relevance rules and return a :class:`ScoredItem`."""
+@dataclass(frozen=True)
+class ScoreBand:
+    """The label, sentiment and confidence of scores from ``minimum`` to ``maximum``."""
 
-    content = text or ""
-    positives = _contains_any(content, rules.get("positive_terms", []))
-    negatives = _contains_any(content, rules.get("negative_terms", []))
-    neutrals = _contains_any(content, rules.get("neutral_terms", []))
+    label: str
+    sentiment: str
+    confidence: float
+    minimum: float | None = None
+    maximum: float | None = None
 
-    score = len(positives) * 2 - len(negatives) * 2
+    def contains(self, score):
+        """Return whether ``score`` (a number or a numpy array) falls in the band."""
+
+        above = score >= self.minimum if self.minimum is not None else True
+        below = score <= self.maximum if self.maximum is not None else True
+        return above & below
+
+
+# Tried in order; scores in none of them are UNCERTAIN.
+SCORE_BANDS: tuple[ScoreBand, ...] = (
+    ScoreBand("Colorado Mesa verified", "positive", 1.0, minimum=2),
+    ScoreBand("Likely Colorado Mesa", "neutral", 0.5, minimum=1),
+    ScoreBand("Not Colorado Mesa", "negative", 1.0, maximum=-2),
+)
+UNCERTAIN = ScoreBand("Uncertain", "neutral", 0.3)
 
-    if score >= 2:
-        label = "Colorado Mesa verified"
-        confidence = 1.0
-    elif score == 1:
-        label = "Likely Colorado Mesa"
-        confidence = 0.5
-    elif score <= -2:
-        label = "Not Colorado Mesa"
-        confidence = 1.0
-    else:
-        label = "Uncertain"
-        confidence = 0.3
+
+def score_band(score: float) -> ScoreBand:
+    """Return the first of :data:`SCORE_BANDS` containing ``score``."""
+
+    return next((band for band in SCORE_BANDS if band.contains(score)), UNCERTAIN)
+
+
+def _build_item(content: str, positives: List[str], negatives: List[str], neutrals: List[str]) -> ScoredItem:
+    score = len(positives) * 2 - len(negatives) * 2
+    band = score_band(score)
 
     notes = [f"+{term}" for term in positives]
     notes.extend(f"-{term}" for term in negatives)
@@ -55,10 +72,115 @@ def score_text(text: str, rules: Dict[str, Iterable[str]]) -> ScoredItem:
     return ScoredItem(
         text=content,
         score=score,
-        label=label,
-        confidence=confidence,
+        label=band.label,
+        confidence=band.confidence,
         notes=";".join(notes),
     )
 
 
-__all__ = ["ScoredItem", "score_text"]
+@dataclass
+class TermMatcher:
+    """A set of lowercased terms compiled into one single-pass matcher.
+
+    Every term is folded into one alternation wrapped in a lookahead, ordered
+    longest first, so a single ``finditer`` pass reports the longest term
+    starting at every offset. Shorter terms contained in a matched term are
+    implied by it, which keeps the result identical to testing each term with
+    ``in`` while only walking the text once.
+    """
+
+    keys: tuple[str, ...]
+    pattern: re.Pattern[str] | None
+    implied: Dict[str, frozenset[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, keys: Iterable[str]) -> "TermMatcher":
+        ordered = tuple(sorted({key for key in keys if key}, key=lambda key: (-len(key), key)))
+        if not ordered:
+            return cls(keys=ordered, pattern=None)
+        pattern = re.compile("(?=(" + "|".join(re.escape(key) for key in ordered) + "))")
+        implied = {key: frozenset(other for other in ordered if other in key) for key in ordered}
+        return cls(keys=ordered, pattern=pattern, implied=implied)
+
+    def present(self, lowered: str) -> set[str]:
+        """Return the terms that occur in the already lowercased ``lowered``."""
+
+        found: set[str] = set()
+        if self.pattern is None or not lowered:
+            return found
+        for match in self.pattern.finditer(lowered):
+            found |= self.implied[match.group(1)]
+        return found
+
+
+@dataclass
+class CompiledRules:
+    """Rule buckets paired with a :class:`TermMatcher` over all of their terms."""
+
+    buckets: Dict[str, List[tuple[str, str]]]
+    matcher: TermMatcher
+
+    def hits(self, text: str) -> Dict[str, List[str]]:
+        """Return the original rule terms found in ``text`` per bucket."""
+
+        present = self.matcher.present(text.lower())
+        return {
+            bucket: [term for term, key in entries if key in present]
+            for bucket, entries in self.buckets.items()
+        }
+
+    def score(self, text: str) -> ScoredItem:
+        content = text or ""
+        hits = self.hits(content)
+        return _build_item(
+            content,
+            hits["positive_terms"],
+            hits["negative_terms"],
+            hits["neutral_terms"],
+        )
+
+
+def compile_rules(rules: Mapping[str, Iterable[str]]) -> CompiledRules:
+    """Compile the ``rules`` config block into a :class:`CompiledRules`."""
+
+    buckets: Dict[str, List[tuple[str, str]]] = {}
+    for bucket in RULE_BUCKETS:
+        entries = []
+        for term in rules.get(bucket, []) or []:
+            key = term.lower().strip()
+            if key:
+                entries.append((term, key))
+        buckets[bucket] = entries
+
+    matcher = TermMatcher.build(key for entries in buckets.values() for _, key in entries)
+    return CompiledRules(buckets=buckets, matcher=matcher)
+
+
+def score_text(text: str, rules: Dict[str, Iterable[str]] | CompiledRules) -> ScoredItem:
+    """Apply CMU relevance rules and return a :class:`ScoredItem`.
+
+    ``rules`` may be the raw config mapping or a :class:`CompiledRules` built
+    once with :func:`compile_rules`; the latter is what batch callers use.
+    """
+
+    if isinstance(rules, CompiledRules):
+        return rules.score(text)
+
+    content = text or ""
+    positives = _contains_any(content, rules.get("positive_terms", []))
+    negatives = _contains_any(content, rules.get("negative_terms", []))
+    neutrals = _contains_any(content, rules.get("neutral_terms", []))
+    return _build_item(content, positives, negatives, neutrals)
+
+
+__all__ = [
+    "CompiledRules",
+    "SCORE_BANDS",
+    "ScoreBand",
+    "ScoredItem",
+    "TermMatcher",
+    "UNCERTAIN",
+    "compile_rules",
+    "score_band",
+    "score_text",
+]
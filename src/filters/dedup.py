@@ -0,0 +1,130 @@
+"""Drop comments that appear in more than one (overlapping) export."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.utils.cache import subset_frame
+from src.utils.dtypes import text_values
+
+# Fixed 16-byte siphash key so keys stay comparable across runs and processes.
+HASH_KEY = "mavstampede-dup1"
+
+
+@dataclass
+class DedupStats:
+    rows_in: int = 0
+    duplicates: int = 0
+    seen_before: int = 0
+    carried: int = 0
+
+    @property
+    def rows_out(self) -> int:
+        return self.rows_in - self.duplicates - self.seen_before
+
+    def summary(self) -> str:
+        return (
+            f"rows_in={self.rows_in}, duplicates={self.duplicates}, "
+            f"seen_before={self.seen_before}, kept={self.rows_out}, carried={self.carried}"
+        )
+
+
+def _text(df: pd.DataFrame, column: str) -> pd.Series:
+    if column not in df.columns:
+        return pd.Series([""] * len(df), index=df.index, dtype=object)
+    return text_values(df[column]).str.strip()
+
+
+def comment_keys(df: pd.DataFrame) -> np.ndarray:
+    """Return a 64-bit key per row.
+
+    Rows with a ``comment_id`` are keyed on ``(platform, comment_id)``; the rest
+    fall back to a fingerprint of the commenter, whitespace-normalized text
+    and ``date_utc``.
+    """
+
+    comment_id = _text(df, "comment_id")
+    by_id = "id|" + _text(df, "platform").str.lower() + "|" + comment_id
+    by_content = (
+        "fp|"
+        + _text(df, "commenter_handle").str.lower()
+        + "|"
+        + _text(df, "comment_text").str.lower().str.split().str.join(" ")
+        + "|"
+        + _text(df, "date_utc")
+    )
+    identity = by_id.where(comment_id != "", by_content)
+    return pd.util.hash_pandas_object(identity, index=False, hash_key=HASH_KEY).to_numpy(np.uint64)
+
+
+class DedupIndex:
+    """Seen-set of comment keys, optionally persisted as a sorted ``.npy`` array.
+
+    Keys from earlier runs are loaded from ``path`` (8 bytes per comment);
+    keys seen in this run are tracked separately so the two kinds of
+    duplicate can be reported apart. ``loaded`` tells whether ``path`` held
+    an index; only then does the CLI carry an earlier run's output over (see
+    :meth:`carry`), since the comments it lists are not emitted again.
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path = Path(path) if path else None
+        self.stats = DedupStats()
+        self._previous = np.empty(0, dtype=np.uint64)
+        self._current: set[int] = set()
+        self.loaded = self.path is not None and self.path.exists()
+        if self.loaded:
+            self._previous = np.load(self.path)
+
+    def _in_current(self, keys: np.ndarray) -> np.ndarray:
+        if not self._current:
+            return np.zeros(len(keys), dtype=bool)
+        return np.fromiter((int(key) in self._current for key in keys), bool, len(keys))
+
+    def carry(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return rows of an earlier output to keep, recording their keys for this run.
+
+        They are kept although the index knows them; repeats among them are
+        dropped, and so are later rows of this run with the same key.
+        """
+
+        keys = comment_keys(df)
+        keep = ~(pd.Series(keys).duplicated().to_numpy() | self._in_current(keys))
+        self._current.update(int(key) for key in keys[keep])
+        self.stats.carried += int(keep.sum())
+        return subset_frame(df, keep)
+
+    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return ``df`` without rows already seen in this or an earlier run."""
+
+        keys = comment_keys(df)
+        seen_before = np.isin(keys, self._previous, assume_unique=False)
+        duplicate = pd.Series(keys).duplicated().to_numpy() | self._in_current(keys)
+        duplicate &= ~seen_before
+
+        keep = ~(seen_before | duplicate)
+        self._current.update(int(key) for key in keys[keep])
+        self.stats.rows_in += len(df)
+        self.stats.seen_before += int(seen_before.sum())
+        self.stats.duplicates += int(duplicate.sum())
+
+        return subset_frame(df, keep)
+
+    def save(self) -> None:
+        """Merge this run's keys into the on-disk index (no-op without a path)."""
+
+        if self.path is None:
+            return
+        merged = np.union1d(self._previous, np.fromiter(self._current, np.uint64, len(self._current)))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("wb") as handle:
+            np.save(handle, merged)
+        tmp_path.replace(self.path)
+
+
+__all__ = ["DedupIndex", "DedupStats", "comment_keys"]
@@ -0,0 +1,71 @@
+"""Drop comments that fall outside the ``--window`` lookback."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pandas as pd
+
+from src.utils.cache import subset_frame
+from src.utils.time_utils import Window, parse_dates, parse_window
+
+
+@dataclass
+class WindowStats:
+    rows_in: int = 0
+    outside: int = 0
+    undated: int = 0
+
+    @property
+    def rows_out(self) -> int:
+        return self.rows_in - self.outside
+
+    def summary(self) -> str:
+        return (
+            f"rows_in={self.rows_in}, outside={self.outside}, "
+            f"undated={self.undated}, kept={self.rows_out}"
+        )
+
+
+class WindowFilter:
+    """Keep comments whose ``date_utc`` lies inside a lookback window.
+
+    Comments whose date cannot be parsed are kept (and counted as undated)
+    rather than silently discarded.
+    """
+
+    def __init__(self, window: Window) -> None:
+        self.start, self.end = (pd.Timestamp(bound).tz_convert("UTC") for bound in window)
+        self.stats = WindowStats()
+
+    @classmethod
+    def from_spec(cls, spec: str | None) -> "WindowFilter | None":
+        """Build a filter from ``"21d"``-style text; ``None``, ``""`` or ``"all"`` disable it."""
+
+        if not spec or spec.strip().lower() == "all":
+            return None
+        return cls(parse_window(spec))
+
+    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return ``df`` without rows dated outside the window."""
+
+        if "date_utc" not in df.columns or df.empty:
+            self.stats.rows_in += len(df)
+            self.stats.undated += len(df)
+            return df
+
+        dates = parse_dates(df["date_utc"])
+        undated = dates.isna().to_numpy()
+        inside = ((dates >= self.start) & (dates <= self.end)).to_numpy()
+        keep = inside | undated
+
+        self.stats.rows_in += len(df)
+        self.stats.undated += int(undated.sum())
+        self.stats.outside += int((~keep).sum())
+        return subset_frame(df, keep)
+
+    def describe(self) -> str:
+        return f"{self.start.isoformat(timespec='seconds')} .. {self.end.isoformat(timespec='seconds')}"
+
+
+__all__ = ["WindowFilter", "WindowStats"]
@@ -2,55 +2,210 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+from typing import Iterable, Mapping
+
 import pandas as pd
 
+from src.utils.dtypes import compact_frame
+
+NORMALIZED_COLUMNS: list[str] = [
+    "date_utc",
+    "platform",
+    "post_url",
+    "post_owner_handle",
+    "post_caption_excerpt",
+    "comment_id",
+    "commenter_handle",
+    "comment_text",
+]
+
+# Canonical field -> (aliases tried in order, default when none match). The
+# canonical names come first so normalized files can be read back in.
+DEFAULT_ALIASES: dict[str, tuple[tuple[str, ...], str]] = {
+    "date_utc": (("date_utc", "date", "timestamp", "created_at"), ""),
+    "platform": (("platform",), "facebook"),
+    "post_url": (("post_url", "url", "link"), ""),
+    "post_owner_handle": (("post_owner_handle", "post_owner", "page", "owner"), ""),
+    "post_caption_excerpt": (("post_caption_excerpt", "post_caption", "caption", "message"), ""),
+    "comment_id": (("comment_id", "cid", "commentid"), ""),
+    "commenter_handle": (("commenter_handle", "commenter", "user", "username", "profile_name"), ""),
+    "comment_text": (("comment_text", "text", "message", "body"), ""),
+}
+
+Resolution = dict[str, "str | None"]
+
+
+def _resolve(columns: tuple[str, ...], aliases: Mapping[str, tuple[tuple[str, ...], str]]) -> Resolution:
+    # First column per lowercased name, matching the old case-insensitive scan.
+    exact = set(columns)
+    lowered: dict[str, str] = {}
+    for column in columns:
+        lowered.setdefault(str(column).lower(), column)
+
+    resolved: Resolution = {}
+    for field, (names, _default) in aliases.items():
+        resolved[field] = None
+        for name in names:
+            if name in exact:
+                resolved[field] = name
+                break
+            if name.lower() in lowered:
+                resolved[field] = lowered[name.lower()]
+                break
+    return resolved
+
+
+class SchemaMapper:
+    """Resolve export headers to the canonical comment fields.
+
+    Each header is indexed by its lowercased name once and every field is
+    resolved in a single pass; the result is memoized per header signature
+    (and profile), so repeated exports with the same layout skip resolution.
+    Platform profiles add aliases that are tried before the base ones and set
+    the default ``platform`` for exports that have no platform column. An
+    export's profile follows its platform column, and only falls back to the
+    file name when that column is missing, empty or mixed.
+    """
+
+    def __init__(
+        self,
+        extra_aliases: Mapping[str, Iterable[str]] | None = None,
+        profiles: Mapping[str, Mapping[str, Iterable[str]]] | None = None,
+    ) -> None:
+        self.aliases = {
+            field: (names + tuple((extra_aliases or {}).get(field, ())), default)
+            for field, (names, default) in DEFAULT_ALIASES.items()
+        }
+        self.profiles = {
+            platform.lower(): {
+                field: (
+                    tuple(overrides.get(field, ())) + names,
+                    platform.lower() if field == "platform" else default,
+                )
+                for field, (names, default) in self.aliases.items()
+            }
+            for platform, overrides in (profiles or {}).items()
+        }
+        # Every name a profile or the base accepts for the platform column.
+        platform_names = [
+            name for aliases in (*self.profiles.values(), self.aliases) for name in aliases["platform"][0]
+        ]
+        self._platform_aliases = {"platform": (tuple(dict.fromkeys(platform_names)), "")}
+        self._resolved: dict[tuple, Resolution] = {}
+        payload = json.dumps({"aliases": self.aliases, "profiles": self.profiles}, sort_keys=True)
+        self.version = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+    @classmethod
+    def from_config(cls, config: Mapping | None) -> "SchemaMapper":
+        """Build a mapper from the ``schema_aliases``/``schema_profiles`` config blocks."""
+
+        config = config or {}
+        return cls(config.get("schema_aliases"), config.get("schema_profiles"))
+
+    def profile_for(self, df: pd.DataFrame, source_name: str | None = None) -> str | None:
+        """Return the profile for the raw export ``df``, or ``None`` for the base aliases.
+
+        When the export's platform column names a single platform, that
+        platform's profile is used (``None`` if it has none). Otherwise the
+        profile whose platform name appears in ``source_name`` applies.
+        """
+
+        if not self.profiles:
+            return None
+        column = _resolve(tuple(df.columns), self._platform_aliases)["platform"]
+        if column is not None:
+            named = {str(value).strip().lower() for value in pd.unique(df[column].dropna())} - {""}
+            if len(named) == 1:
+                (platform,) = named
+                return platform if platform in self.profiles else None
+        if not source_name:
+            return None
+        lowered = source_name.lower()
+        return next((platform for platform in self.profiles if platform in lowered), None)
+
+    def resolve(self, columns: Iterable[str], profile: str | None = None) -> Resolution:
+        """Return ``{field: source column or None}`` for a header."""
 
-def _column(df: pd.DataFrame, names: list[str] | tuple[str, ...], default: str = "") -> pd.Series:
-    for name in names:
-        if name in df.columns:
-            return df[name]
-        lowered = name.lower()
-        for column in df.columns:
-            if column.lower() == lowered:
-                return df[column]
-    return pd.Series([default] * len(df))
+        signature = (tuple(columns), profile)
+        if signature not in self._resolved:
+            aliases = self.profiles.get(profile, self.aliases) if profile else self.aliases
+            self._resolved[signature] = _resolve(signature[0], aliases)
+        return self._resolved[signature]
 
+    def default_for(self, field: str, profile: str | None = None) -> str:
+        aliases = self.profiles.get(profile, self.aliases) if profile else self.aliases
+        return aliases[field][1]
 
-def normalize_df(df: pd.DataFrame) -> pd.DataFrame:
-    """Return a normalized dataframe with consistent column names."""
+
+DEFAULT_MAPPER = SchemaMapper()
+
+
+def _source_name(df: pd.DataFrame) -> str | None:
+    if "__source_file" in df.columns and len(df):
+        return str(df["__source_file"].iloc[0])
+    return None
+
+
+CAPTION_LENGTH = 200
+
+
+def _truncate_captions(captions: pd.Series) -> pd.Series:
+    """Cut captions to :data:`CAPTION_LENGTH` characters, once per distinct caption."""
+
+    codes, uniques = pd.factorize(captions.fillna("").astype(str))
+    truncated = pd.Series(uniques, dtype=object).str.slice(0, CAPTION_LENGTH)
+    truncated_codes, categories = pd.factorize(truncated)
+    return pd.Series(
+        pd.Categorical.from_codes(truncated_codes[codes], categories), index=captions.index
+    )
+
+
+def normalize_df(df: pd.DataFrame, mapper: SchemaMapper | None = None) -> pd.DataFrame:
+    """Return a normalized dataframe with consistent column names.
+
+    The mapping used is recorded in ``attrs["column_sources"]`` (field ->
+    source column, ``None`` where the default was used) together with
+    ``attrs["source_file"]`` when the frame came from :func:`read_csvs`.
+    Columns use the compact dtypes of :func:`~src.utils.dtypes.compact_frame`.
+    """
 
     if df.empty:
-        return pd.DataFrame(
-            columns=[
-                "date_utc",
-                "platform",
-                "post_url",
-                "post_owner_handle",
-                "post_caption_excerpt",
-                "comment_id",
-                "commenter_handle",
-                "comment_text",
-            ]
-        )
+        return pd.DataFrame(columns=NORMALIZED_COLUMNS)
+
+    mapper = mapper or DEFAULT_MAPPER
+    source_name = _source_name(df)
+    profile = mapper.profile_for(df, source_name)
+    sources = mapper.resolve(df.columns, profile)
 
     normalized = pd.DataFrame(
         {
-            "date_utc": _column(df, ["date", "timestamp", "created_at"]),
-            "platform": _column(df, ["platform"], default="facebook"),
-            "post_url": _column(df, ["post_url", "url", "link"]),
-            "post_owner_handle": _column(df, ["post_owner", "page", "owner"]),
-            "post_caption_excerpt": _column(df, ["post_caption", "caption", "message"]),
-            "comment_id": _column(df, ["comment_id", "cid", "commentid"]),
-            "commenter_handle": _column(df, ["commenter", "user", "username", "profile_name"]),
-            "comment_text": _column(df, ["comment_text", "text", "message", "body"]),
+            field: df[column]
+            if column is not None
+            else pd.Series([mapper.default_for(field, profile)] * len(df), index=df.index)
+            for field, column in sources.items()
         }
     )
 
-    normalized["post_caption_excerpt"] = (
-        normalized["post_caption_excerpt"].astype(str).str.slice(0, 200)
-    )
-
+    # Thousands of comments share a post's caption, so each one is cut once.
+    normalized["post_caption_excerpt"] = _truncate_captions(normalized["post_caption_excerpt"])
+    normalized = compact_frame(normalized)
+    normalized.attrs["column_sources"] = dict(sources)
+    normalized.attrs["source_file"] = source_name
     return normalized
 
 
-__all__ = ["normalize_df"]
+def describe_sources(sources: Mapping[str, str | None]) -> str:
+    """Format a ``column_sources`` mapping as ``field<-column`` pairs."""
+
+    return ", ".join(f"{field}<-{column or '(default)'}" for field, column in sources.items())
+
+
+__all__ = [
+    "DEFAULT_ALIASES",
+    "NORMALIZED_COLUMNS",
+    "SchemaMapper",
+    "describe_sources",
+    "normalize_df",
+]
@@ -0,0 +1,145 @@
+"""Split normalized comments into a posts table and a comments table.
+
+Every comment row repeats its post's URL, owner and caption. The two-table
+model stores each post once, keyed by ``post_key``, and the comments refer
+to it, so post-level work runs once per post and a split artifact stores the
+post fields once. :func:`join_posts` restores the flat layout the report
+uses.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.parsers.business_suite_csv_parser import NORMALIZED_COLUMNS
+from src.utils.dtypes import text_values
+
+POST_FIELDS: tuple[str, ...] = ("platform", "post_url", "post_owner_handle", "post_caption_excerpt")
+POST_COLUMNS: list[str] = ["post_key", *POST_FIELDS]
+COMMENT_COLUMNS: list[str] = ["post_key"] + [column for column in NORMALIZED_COLUMNS if column not in POST_FIELDS]
+
+# Fixed 16-byte siphash key so post keys match across exports and runs.
+HASH_KEY = "mavstampede-post"
+
+
+def _field(df: pd.DataFrame, column: str) -> pd.Series:
+    if column in df.columns:
+        return df[column]
+    return pd.Series("", index=df.index, dtype=object)
+
+
+def _hash(columns: dict[str, pd.Series]) -> np.ndarray:
+    frame = pd.DataFrame(columns)
+    return pd.util.hash_pandas_object(frame, index=False, hash_key=HASH_KEY).to_numpy(np.uint64)
+
+
+def post_row_keys(df: pd.DataFrame) -> np.ndarray:
+    """Return a 64-bit post key per comment row.
+
+    Posts are identified by ``(platform, post_url)``; comments without a URL
+    fall back to the owner and caption. Categorical columns are hashed per
+    category, so this stays cheap on compact frames.
+    """
+
+    platform = _field(df, "platform").map(lambda value: str(value).strip().lower())
+    url = _field(df, "post_url")
+    by_url = _hash({"platform": platform, "url": url})
+    has_url = (url.notna() & (url != "")).to_numpy()
+    if has_url.all():
+        return by_url
+
+    by_content = _hash(
+        {
+            "platform": platform,
+            "owner": _field(df, "post_owner_handle"),
+            "caption": _field(df, "post_caption_excerpt"),
+        }
+    )
+    return np.where(has_url, by_url, by_content)
+
+
+def split_posts(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Return ``(posts, comments)`` for a flat comment frame.
+
+    ``posts`` has one row per post (:data:`POST_COLUMNS`, first occurrence
+    wins); ``comments`` keeps every other column behind a categorical
+    ``post_key``.
+    """
+
+    codes, uniques = pd.factorize(post_row_keys(df))
+    keys = pd.Index([f"{key:016x}" for key in uniques], dtype=object)
+    _, first_rows = np.unique(codes, return_index=True)
+
+    posts = pd.DataFrame({"post_key": keys})
+    for field in POST_FIELDS:
+        posts[field] = _field(df, field).iloc[first_rows].reset_index(drop=True)
+
+    comments = df.drop(columns=[field for field in POST_FIELDS if field in df.columns])
+    comments.insert(0, "post_key", pd.Categorical.from_codes(codes, keys))
+    comments.attrs = dict(df.attrs)
+    return posts, comments
+
+
+def _post_positions(posts: pd.DataFrame, keys: pd.Series) -> np.ndarray:
+    # Row of ``posts`` for every comment's key, -1 when the post is unknown.
+    index = pd.Index(text_values(posts["post_key"]))
+    if isinstance(keys.dtype, pd.CategoricalDtype):
+        lookup = index.get_indexer(keys.cat.categories.astype(str))
+        codes = keys.cat.codes.to_numpy()
+        return np.where(codes >= 0, lookup[codes], -1)
+    return index.get_indexer(text_values(keys))
+
+
+def _spread(values: pd.Series, positions: np.ndarray) -> pd.Categorical:
+    """Return the post-level ``values`` at ``positions`` as a categorical; ``""`` where unknown."""
+
+    codes, uniques = pd.factorize(text_values(values))
+    categories = pd.Index(uniques, dtype=object)
+    found = positions >= 0
+    row_codes = np.full(len(positions), -1, dtype=np.int64)
+    row_codes[found] = codes[positions[found]]
+    if not found.all():
+        if "" not in categories:
+            categories = categories.append(pd.Index([""], dtype=object))
+        row_codes[~found] = categories.get_loc("")
+    return pd.Categorical.from_codes(row_codes, categories)
+
+
+def join_posts(posts: pd.DataFrame, comments: pd.DataFrame) -> pd.DataFrame:
+    """Return the flat frame for ``comments``, with post fields taken from ``posts``.
+
+    Columns follow :data:`NORMALIZED_COLUMNS` and then the remaining comment
+    columns; comments whose post is unknown get empty post fields.
+    """
+
+    posts = posts.drop_duplicates("post_key").reset_index(drop=True)
+    positions = _post_positions(posts, comments["post_key"])
+
+    flat = comments.drop(columns="post_key").reset_index(drop=True)
+    for field in POST_FIELDS:
+        flat[field] = _spread(_field(posts, field), positions)
+    leading = [column for column in NORMALIZED_COLUMNS if column in flat.columns]
+    flat = flat[leading + [column for column in flat.columns if column not in leading]]
+    flat.attrs = dict(comments.attrs)
+    return flat
+
+
+def posts_path(path: Path | str) -> Path:
+    """Return the posts artifact stored next to the comments artifact ``path``."""
+
+    path = Path(path)
+    return path.with_name(f"{path.stem}_posts{path.suffix}")
+
+
+__all__ = [
+    "COMMENT_COLUMNS",
+    "POST_COLUMNS",
+    "POST_FIELDS",
+    "join_posts",
+    "post_row_keys",
+    "posts_path",
+    "split_posts",
+]
@@ -0,0 +1,219 @@
+"""SQLite-backed history of normalized and classified comments."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+from src.filters.dedup import comment_keys
+from src.parsers.business_suite_csv_parser import NORMALIZED_COLUMNS
+from src.utils.dtypes import text_values
+
+CLASSIFIED_COLUMNS: list[str] = ["sentiment", "themes", "confidence_cmumesa", "notes"]
+STORE_COLUMNS: list[str] = NORMALIZED_COLUMNS + CLASSIFIED_COLUMNS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS comments (
+    platform TEXT NOT NULL,
+    comment_key TEXT NOT NULL,
+    date_ts INTEGER,
+    date_utc TEXT,
+    post_url TEXT,
+    post_owner_handle TEXT,
+    post_caption_excerpt TEXT,
+    comment_id TEXT,
+    commenter_handle TEXT,
+    comment_text TEXT,
+    sentiment TEXT,
+    themes TEXT,
+    confidence_cmumesa REAL,
+    notes TEXT,
+    UNIQUE (platform, comment_key)
+);
+CREATE INDEX IF NOT EXISTS comments_date ON comments (date_ts);
+CREATE INDEX IF NOT EXISTS comments_platform ON comments (platform, date_ts);
+CREATE INDEX IF NOT EXISTS comments_sentiment ON comments (sentiment, date_ts);
+CREATE TABLE IF NOT EXISTS comment_themes (
+    platform TEXT NOT NULL,
+    comment_key TEXT NOT NULL,
+    theme TEXT NOT NULL,
+    PRIMARY KEY (platform, comment_key, theme)
+);
+CREATE INDEX IF NOT EXISTS comment_themes_theme ON comment_themes (theme);
+"""
+
+
+def _text(df: pd.DataFrame, column: str) -> pd.Series:
+    return text_values(df[column]) if column in df.columns else pd.Series("", index=df.index)
+
+
+def _parse_moment(value: str | None, end_of_day: bool = False) -> int | None:
+    if not value:
+        return None
+    moment = pd.Timestamp(value)
+    moment = moment.tz_localize("UTC") if moment.tzinfo is None else moment.tz_convert("UTC")
+    if end_of_day and len(value) <= 10:
+        moment += pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+    return int(moment.timestamp())
+
+
+def check_moment(value: str) -> str:
+    """Return ``value`` if ``--since``/``--until`` can use it, else raise ``ValueError``."""
+
+    try:
+        _parse_moment(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid date '{value}': use YYYY-MM-DD or an ISO 8601 date and time") from None
+    return value
+
+
+class CommentStore:
+    """Upsert comments into SQLite and query them back as frames.
+
+    Rows are unique on ``(platform, comment_key)``; ``comment_key`` is the
+    export's ``comment_id`` or, for comments without one, the same content
+    fingerprint :mod:`src.filters.dedup` uses. Loading a normalized artifact
+    never clears the sentiment of a comment that was classified earlier, and
+    themes are kept in a side table so theme filters can use an index.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "CommentStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def upsert(self, df: pd.DataFrame) -> int:
+        """Insert or update the rows of ``df``; returns the number of rows written."""
+
+        if df.empty:
+            return 0
+
+        comment_id = _text(df, "comment_id").str.strip()
+        fingerprint = pd.Series(comment_keys(df), index=df.index).map("fp:{:016x}".format)
+        rows = pd.DataFrame(
+            {
+                "platform": _text(df, "platform").str.lower(),
+                "comment_key": comment_id.where(comment_id != "", fingerprint),
+            }
+        )
+        dates = pd.to_datetime(_text(df, "date_utc"), utc=True, errors="coerce", format="mixed")
+        rows["date_ts"] = (dates.astype("int64") // 10**9).astype(object).where(dates.notna(), None)
+        for column in NORMALIZED_COLUMNS:
+            if column != "platform":
+                rows[column] = _text(df, column)
+
+        classified = "sentiment" in df.columns
+        for column in CLASSIFIED_COLUMNS:
+            rows[column] = _text(df, column) if classified else None
+        if classified:
+            confidence = pd.to_numeric(df["confidence_cmumesa"], errors="coerce")
+            rows["confidence_cmumesa"] = confidence.astype(object).where(confidence.notna(), None)
+
+        columns = list(rows.columns)
+        updates = ", ".join(
+            f"{column} = COALESCE(excluded.{column}, comments.{column})"
+            if column in CLASSIFIED_COLUMNS
+            else f"{column} = excluded.{column}"
+            for column in columns[2:]
+        )
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO comments ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+                f"ON CONFLICT (platform, comment_key) DO UPDATE SET {updates}",
+                rows.itertuples(index=False, name=None),
+            )
+            if classified:
+                keys = list(zip(rows["platform"], rows["comment_key"]))
+                self.conn.executemany(
+                    "DELETE FROM comment_themes WHERE platform = ? AND comment_key = ?", keys
+                )
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO comment_themes VALUES (?, ?, ?)",
+                    (
+                        (platform, key, theme)
+                        for (platform, key), themes in zip(keys, rows["themes"])
+                        for theme in themes.split("|")
+                        if theme
+                    ),
+                )
+        return len(rows)
+
+    def _where(
+        self,
+        *,
+        days: int | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        platform: str | None = None,
+        sentiment: str | None = None,
+        theme: str | None = None,
+        min_confidence: float | None = None,
+    ) -> tuple[str, list]:
+        clauses: list[str] = []
+        params: list = []
+        if days is not None:
+            clauses.append("date_ts >= ?")
+            params.append(int((datetime.now(timezone.utc) - timedelta(days=days)).timestamp()))
+        if since:
+            clauses.append("date_ts >= ?")
+            params.append(_parse_moment(since))
+        if until:
+            clauses.append("date_ts <= ?")
+            params.append(_parse_moment(until, end_of_day=True))
+        if platform:
+            clauses.append("platform = ?")
+            params.append(platform.lower())
+        if sentiment:
+            clauses.append("sentiment = ?")
+            params.append(sentiment.lower())
+        if theme:
+            clauses.append(
+                "(platform, comment_key) IN "
+                "(SELECT platform, comment_key FROM comment_themes WHERE theme = ?)"
+            )
+            params.append(theme.lower())
+        if min_confidence is not None:
+            clauses.append("confidence_cmumesa >= ?")
+            params.append(min_confidence)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def iter_query(self, *, chunksize: int = 50_000, limit: int | None = None, **filters) -> Iterator[pd.DataFrame]:
+        """Yield matching comments in date order, ``chunksize`` rows at a time.
+
+        ``filters`` are ``days``, ``since``, ``until`` (ISO dates, inclusive),
+        ``platform``, ``sentiment``, ``theme`` and ``min_confidence``.
+        """
+
+        where, params = self._where(**filters)
+        sql = f"SELECT {', '.join(STORE_COLUMNS)} FROM comments{where} ORDER BY date_ts, rowid"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        for frame in pd.read_sql_query(sql, self.conn, params=params, chunksize=chunksize):
+            yield frame.fillna({column: "" for column in STORE_COLUMNS if column != "confidence_cmumesa"})
+
+    def query(self, **filters) -> pd.DataFrame:
+        frames = list(self.iter_query(**filters))
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=STORE_COLUMNS)
+
+    def count(self, **filters) -> int:
+        where, params = self._where(**filters)
+        return self.conn.execute(f"SELECT COUNT(*) FROM comments{where}", params).fetchone()[0]
+
+
+__all__ = ["CommentStore", "STORE_COLUMNS", "check_moment"]
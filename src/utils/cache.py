@@ -0,0 +1,134 @@
+"""Per-export cache so unchanged raw files are not re-parsed or re-classified."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from src.utils.dtypes import compact_read_options
+
+MANIFEST_NAME = "manifest.json"
+
+
+def file_sha256(path: Path, block_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExportCache:
+    """Content-addressed store of per-file pipeline results.
+
+    ``manifest.json`` records the size, mtime and SHA-256 of every raw export
+    seen so far; a file is only re-hashed when its size or mtime changes.
+    Results are stored per layer under ``<cache_dir>/<layer>/<key>.csv`` where
+    the key is the file hash, optionally suffixed with a version (for example
+    the rules version for the classification layer), so editing the rules
+    only invalidates that layer. :meth:`save` deletes the layer files of
+    exports that are gone or changed, and those stored under a version other
+    than the one this run used for their layer.
+    """
+
+    def __init__(self, cache_dir: Path | str) -> None:
+        self.root = Path(cache_dir)
+        self.manifest_path = self.root / MANIFEST_NAME
+        self.manifest: dict[str, dict] = {}
+        self.stats: Counter[str] = Counter()
+        self._seen: set[str] = set()
+        self._versions: dict[str, set[str]] = {}
+        if self.manifest_path.exists():
+            self.manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+
+    def fingerprint(self, csv_path: Path) -> str:
+        """Return the content hash of ``csv_path``, reusing the manifest entry when unchanged."""
+
+        stat = csv_path.stat()
+        self._seen.add(csv_path.name)
+        entry = self.manifest.get(csv_path.name)
+        if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+            return entry["sha256"]
+
+        sha = file_sha256(csv_path)
+        self.manifest[csv_path.name] = {"size": stat.st_size, "mtime": stat.st_mtime, "sha256": sha}
+        return sha
+
+    def load_or_build(
+        self, layer: str, key: str, build: Callable[[], pd.DataFrame | None], version: str = ""
+    ) -> pd.DataFrame | None:
+        """Return the cached frame for ``key`` in ``layer``, building and storing it on a miss.
+
+        A non-empty ``version`` is appended to the key and recorded, so
+        :meth:`prune` can drop the layer's files stored under other versions.
+        A ``build`` that returns ``None`` (for example an unreadable export) is
+        not cached, so the file is retried on the next run.
+        """
+
+        if version:
+            key = f"{key}-{version}"
+            self._versions.setdefault(layer, set()).add(version)
+        path = self.root / layer / f"{key}.csv"
+        if path.exists():
+            self.stats[f"{layer}_reused"] += 1
+            return pd.read_csv(path, **compact_read_options())
+
+        frame = build()
+        if frame is None:
+            return None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        frame.to_csv(tmp_path, index=False)
+        tmp_path.replace(path)
+        self.stats[f"{layer}_built"] += 1
+        return frame
+
+    def save(self) -> None:
+        """Persist the manifest, dropping entries for files that no longer exist."""
+
+        self.manifest = {name: entry for name, entry in self.manifest.items() if name in self._seen}
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.manifest, indent=2, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(self.manifest_path)
+        self.prune()
+
+    def prune(self) -> None:
+        """Delete layer files of unreferenced exports or of versions this run did not use."""
+
+        hashes = {entry["sha256"] for entry in self.manifest.values()}
+        for path in self.root.glob("*/*.csv"):
+            versions = self._versions.get(path.parent.name)
+            stale = versions is not None and path.stem.rsplit("-", 1)[-1] not in versions
+            if stale or path.stem.split("-", 1)[0] not in hashes:
+                path.unlink(missing_ok=True)
+                self.stats[f"{path.parent.name}_pruned"] += 1
+
+    def summary(self) -> str:
+        return ", ".join(f"{name}={count}" for name, count in sorted(self.stats.items())) or "empty"
+
+
+def subset_frame(df: pd.DataFrame, keep: np.ndarray) -> pd.DataFrame:
+    """Return the rows of ``df`` where ``keep`` is set, re-keying its cache entry.
+
+    A filtered export must not reuse results cached for the whole file, so
+    ``attrs["cache_key"]`` is extended with a digest of which rows survived.
+    """
+
+    if keep.all():
+        return df
+    kept = df[keep].reset_index(drop=True)
+    cache_key = kept.attrs.get("cache_key")
+    if cache_key:
+        digest = hashlib.sha256(np.packbits(keep).tobytes()).hexdigest()[:12]
+        kept.attrs["cache_key"] = f"{cache_key}-{digest}"
+    return kept
+
+
+__all__ = ["ExportCache", "MANIFEST_NAME", "file_sha256", "subset_frame"]
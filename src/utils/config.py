@@ -0,0 +1,46 @@
+"""Loading ``config.yaml``, parsed once per change to the file."""
+
+from __future__ import annotations
+
+import copy
+import threading
+from pathlib import Path
+
+CONFIG_PATH = Path("config.yaml")
+
+# Resolved path -> ((mtime_ns, size), parsed config).
+_CACHE: dict[Path, tuple[tuple[int, int], object]] = {}
+_LOCK = threading.Lock()
+
+
+def load_config(path: Path = CONFIG_PATH) -> dict:
+    """Return the parsed config at ``path``.
+
+    The YAML is only re-parsed when the file's mtime or size changes, so the
+    web console can call this on every request. Each call returns its own
+    copy, which callers may modify.
+    """
+
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Config file '{path}' is missing. Copy config.example.yaml to {path}"
+        ) from None
+
+    key = path.resolve()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _LOCK:
+        cached = _CACHE.get(key)
+    if cached is None or cached[0] != stamp:
+        import yaml
+
+        with path.open("r", encoding="utf-8") as handle:
+            cached = (stamp, yaml.safe_load(handle))
+        with _LOCK:
+            _CACHE[key] = cached
+    return copy.deepcopy(cached[1])
+
+
+__all__ = ["CONFIG_PATH", "load_config"]
@@ -0,0 +1,148 @@
+"""Compact in-memory dtypes for comment frames.
+
+Exports are read as object columns of Python strings, which costs roughly
+50 bytes of object header per cell on top of the text. Comment frames are
+far more repetitive than that suggests: ``platform`` has a handful of
+values and the post-level fields repeat for every comment on a post. Those
+columns become categoricals (one small integer code per row), the
+free-text columns become Arrow-backed strings (one contiguous buffer) when
+``pyarrow`` is installed, and ``confidence_cmumesa`` becomes a float.
+Written artifacts are unchanged.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable
+
+import pandas as pd
+
+from src.utils.io_utils import CSV_READ_OPTIONS
+
+# Few distinct values, or one value shared by every comment on a post.
+CATEGORY_COLUMNS: tuple[str, ...] = (
+    "post_key",
+    "platform",
+    "post_url",
+    "post_owner_handle",
+    "post_caption_excerpt",
+    "sentiment",
+    "themes",
+    "notes",
+)
+# Mostly distinct per comment.
+TEXT_COLUMNS: tuple[str, ...] = ("date_utc", "comment_id", "commenter_handle", "comment_text")
+NUMERIC_COLUMNS: tuple[str, ...] = ("confidence_cmumesa",)
+
+
+def text_dtype() -> str:
+    """Return ``"string[pyarrow]"``, or ``"object"`` when pyarrow is not installed."""
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:  # pragma: no cover - depends on the environment
+        return "object"
+    return "string[pyarrow]"
+
+
+def compact_read_options() -> dict:
+    """``read_csv`` options that load the known columns straight into compact dtypes."""
+
+    dtypes: defaultdict = defaultdict(lambda: str)
+    dtypes.update({column: "category" for column in CATEGORY_COLUMNS})
+    dtypes.update({column: text_dtype() for column in TEXT_COLUMNS})
+    return {**CSV_READ_OPTIONS, "dtype": dtypes}
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return ``df`` with its known columns converted to compact dtypes.
+
+    Columns that are already compact, or that hold parsed values (e.g.
+    timestamps from a columnar artifact), are left alone, so the call is
+    cheap to repeat.
+    """
+
+    text = text_dtype()
+    converted = {}
+    for column in df.columns:
+        values = df[column]
+        if values.dtype != object:
+            continue
+        if column in CATEGORY_COLUMNS:
+            converted[column] = values.astype("category")
+        elif column in TEXT_COLUMNS and text != "object":
+            converted[column] = values.astype(text)
+        elif column in NUMERIC_COLUMNS:
+            converted[column] = pd.to_numeric(values, errors="coerce")
+    if not converted:
+        return df
+    compact = df.assign(**converted)
+    compact.attrs = dict(df.attrs)
+    return compact
+
+
+def concat_frames(frames: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate compact frames without falling back to object columns.
+
+    ``pd.concat`` turns categoricals with different categories into
+    objects, so the categories are unified first.
+    """
+
+    frames = list(frames)
+    for column in CATEGORY_COLUMNS:
+        parts = [frame[column] for frame in frames if column in frame.columns]
+        if len(parts) < 2 or not all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            continue
+        categories = pd.api.types.union_categoricals(parts).categories
+        for frame in frames:
+            frame[column] = frame[column].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def text_values(values: pd.Series) -> pd.Series:
+    """Return ``values`` as plain ``str`` objects with missing values as ``""``."""
+
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(object)
+    return values.fillna("").astype(str)
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """Return the bytes held by ``df``, including the strings it references."""
+
+    return int(df.memory_usage(deep=True).sum())
+
+
+@dataclass
+class MemoryReport:
+    """Memory of the compact frames against the object frames they replace."""
+
+    object_bytes: int = 0
+    compact_bytes: int = 0
+
+    def add(self, df: pd.DataFrame) -> None:
+        # Measuring the object equivalent walks every string, so this is opt-in.
+        self.compact_bytes += frame_memory(df)
+        self.object_bytes += frame_memory(df.astype(object))
+
+    def summary(self) -> str:
+        ratio = self.object_bytes / self.compact_bytes if self.compact_bytes else 0.0
+        return (
+            f"object {self.object_bytes / 2**20:.1f} MiB -> "
+            f"compact {self.compact_bytes / 2**20:.1f} MiB ({ratio:.1f}x smaller)"
+        )
+
+
+__all__ = [
+    "CATEGORY_COLUMNS",
+    "MemoryReport",
+    "NUMERIC_COLUMNS",
+    "TEXT_COLUMNS",
+    "compact_frame",
+    "compact_read_options",
+    "concat_frames",
+    "frame_memory",
+    "text_dtype",
+    "text_values",
+]
@@ -2,12 +2,147 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Callable, Iterator
 
 import pandas as pd
 
+# Every column is read as text, with empty cells kept as "" rather than NaN, so
+# values round-trip unchanged between stages and a frame's dtypes do not depend
+# on which rows (or chunk) pandas happened to sniff.
+CSV_READ_OPTIONS: dict = {"dtype": str, "keep_default_na": False}
 
-def read_csvs(in_dir: Path | str, pattern: str = "*.csv") -> pd.DataFrame:
+
+def list_csvs(in_dir: Path | str, pattern: str = "*.csv") -> list[Path]:
+    """Return the files in ``in_dir`` matching ``pattern`` in sorted order."""
+
+    base_path = Path(in_dir)
+    if not base_path.exists():
+        return []
+    return [path for path in sorted(base_path.glob(pattern)) if path.is_file()]
+
+
+def _load_export(
+    csv_path: Path, transform: Callable[[pd.DataFrame], pd.DataFrame] | None = None
+) -> tuple[pd.DataFrame | None, str | None]:
+    # Runs in worker processes too, so failures are returned rather than
+    # printed to keep the report ordered and in the parent's output.
+    try:
+        df = pd.read_csv(csv_path, **CSV_READ_OPTIONS)
+    except Exception as exc:  # pragma: no cover - defensive logging
+        return None, f"Failed to read {csv_path}: {exc}"
+
+    df["__source_file"] = csv_path.name
+    if transform is not None:
+        df = transform(df)
+    return df, None
+
+
+def _read_chunks(csv_path: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Yield ``csv_path`` in chunks, reporting a parse failure and stopping at it.
+
+    Only reading is guarded: errors raised while a chunk is transformed or
+    consumed propagate to the caller.
+    """
+
+    try:
+        reader = pd.read_csv(csv_path, chunksize=chunksize, **CSV_READ_OPTIONS)
+    except Exception as exc:  # pragma: no cover - defensive logging
+        print(f"Failed to read {csv_path}: {exc}")
+        return
+    with reader:
+        while True:
+            try:
+                df = next(reader)
+            except StopIteration:
+                return
+            except Exception as exc:  # pragma: no cover - defensive logging
+                print(f"Failed to read {csv_path}: {exc}")
+                return
+            yield df
+
+
+def read_export(csv_path: Path) -> pd.DataFrame | None:
+    """Read one export tagged with ``__source_file``; report and return ``None`` on failure."""
+
+    df, error = _load_export(csv_path)
+    if error:
+        print(error)
+    return df
+
+
+def iter_csvs(
+    in_dir: Path | str,
+    pattern: str = "*.csv",
+    *,
+    chunksize: int | None = None,
+    workers: int | None = None,
+    transform: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield frames for the CSV files in ``in_dir`` one file (or chunk) at a time.
+
+    Parameters
+    ----------
+    in_dir:
+        Directory containing the CSV files.
+    pattern:
+        Glob pattern to match files. Defaults to ``"*.csv"``.
+    chunksize:
+        When set, each file is streamed in frames of at most ``chunksize``
+        rows instead of being loaded whole, so memory stays bounded.
+    workers:
+        When greater than one (and ``chunksize`` is not set), files are read
+        in a pool of this many processes. Frames are still yielded in sorted
+        file order.
+    transform:
+        Optional picklable callable applied to each file's frame, inside the
+        worker when ``workers`` is set (for example ``normalize_df``).
+
+    Yields
+    ------
+    pandas.DataFrame
+        Frames tagged with a ``__source_file`` column (before ``transform``)
+        and a fresh ``RangeIndex``. Files that fail to parse are reported and
+        skipped.
+    """
+
+    paths = list_csvs(in_dir, pattern)
+
+    if chunksize:
+        for csv_path in paths:
+            for df in _read_chunks(csv_path, chunksize):
+                df = df.reset_index(drop=True)
+                df["__source_file"] = csv_path.name
+                yield transform(df) if transform is not None else df
+        return
+
+    load = partial(_load_export, transform=transform)
+    if workers and workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            results = pool.map(load, paths)
+            for df, error in results:
+                if error:
+                    print(error)
+                else:
+                    yield df
+        return
+
+    for df, error in map(load, paths):
+        if error:
+            print(error)
+        else:
+            yield df
+
+
+def read_csvs(
+    in_dir: Path | str,
+    pattern: str = "*.csv",
+    *,
+    workers: int | None = None,
+    transform: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+) -> pd.DataFrame:
     """Load and concatenate CSV files from ``in_dir``.
 
     Parameters
@@ -16,6 +151,12 @@ def read_csvs(in_dir: Path | str, pattern: str = "*.csv") -> pd.DataFrame:
         Directory containing the CSV files.
     pattern:
         Glob pattern to match files. Defaults to ``"*.csv"``.
+    workers:
+        Read (and ``transform``) files in a pool of this many processes.
+        Defaults to reading them one at a time.
+    transform:
+        Optional picklable callable applied to each file's frame before
+        concatenation.
 
     Returns
     -------
@@ -25,29 +166,11 @@ def read_csvs(in_dir: Path | str, pattern: str = "*.csv") -> pd.DataFrame:
         empty DataFrame is returned.
     """
 
-    base_path = Path(in_dir)
-    frames: list[pd.DataFrame] = []
-
-    if not base_path.exists():
-        return pd.DataFrame()
-
-    for csv_path in sorted(base_path.glob(pattern)):
-        if not csv_path.is_file():
-            continue
-
-        try:
-            df = pd.read_csv(csv_path)
-        except Exception as exc:  # pragma: no cover - defensive logging
-            print(f"Failed to read {csv_path}: {exc}")
-            continue
-
-        df["__source_file"] = csv_path.name
-        frames.append(df)
-
+    frames = list(iter_csvs(in_dir, pattern, workers=workers, transform=transform))
     if not frames:
         return pd.DataFrame()
 
     return pd.concat(frames, ignore_index=True)
 
 
-__all__ = ["read_csvs"]
+__all__ = ["CSV_READ_OPTIONS", "iter_csvs", "list_csvs", "read_csvs", "read_export"]
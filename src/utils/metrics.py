@@ -0,0 +1,255 @@
+"""Per-stage timing, memory and row/byte accounting for pipeline runs.
+
+A :class:`Run` wraps one CLI command or web job and is itself the top-level
+stage; :class:`StageMeter` records a named stage inside it, either around a
+block (``with meter:``) or around a lazily consumed frame generator
+(``meter.wrap(frames)``). Stages of the fused pipeline overlap in time, so a
+meter given an ``upstream`` meter subtracts the time spent producing its input
+and reports only its own work.
+
+Finished stages are added to :data:`REGISTRY` (rendered for ``/metrics`` in
+Prometheus text format) and, when the run has a log path, appended to that
+JSON-lines run log.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:  # pragma: no cover - resource is POSIX-only
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process (and finished children) in MiB."""
+
+    if resource is None:
+        return 0.0
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return round(max(own, children) / 1024, 1)  # ru_maxrss is KiB on Linux
+
+
+@dataclass
+class StageMetrics:
+    stage: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_mb: float = 0.0
+    rows_in: int = 0
+    rows_out: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    status: str = "ok"
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+_CURRENT: ContextVar["StageMetrics | None"] = ContextVar("current_stage", default=None)
+_RUN: ContextVar["Run | None"] = ContextVar("current_run", default=None)
+
+
+def record(**counts: int) -> None:
+    """Add ``rows_in``/``rows_out``/``bytes_read``/``bytes_written`` to the current stage."""
+
+    current = _CURRENT.get()
+    if current is None:
+        return
+    for name, value in counts.items():
+        setattr(current, name, getattr(current, name) + int(value))
+
+
+def record_files_read(paths: Iterable[Path]) -> None:
+    record(bytes_read=sum(Path(path).stat().st_size for path in paths if Path(path).exists()))
+
+
+def count_rows(frames: Iterable[pd.DataFrame], field_name: str = "rows_in") -> Iterator[pd.DataFrame]:
+    """Pass ``frames`` through, adding their row counts to the current stage."""
+
+    for frame in frames:
+        record(**{field_name: len(frame)})
+        yield frame
+
+
+class StageMeter:
+    """Measure one named stage of the current run."""
+
+    def __init__(self, name: str, upstream: "StageMeter | None" = None) -> None:
+        self.metrics = StageMetrics(name)
+        self.upstream = upstream
+        # Inclusive time, before subtracting the upstream stage's share.
+        self.inclusive_wall = 0.0
+        self.inclusive_cpu = 0.0
+        self._finished = False
+        self._started: tuple[float, float] | None = None
+        self._token = None
+
+    def __enter__(self) -> "StageMeter":
+        self._token = _CURRENT.set(self.metrics)
+        self._started = (time.perf_counter(), time.process_time())
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        wall, cpu = self._started
+        self.inclusive_wall += time.perf_counter() - wall
+        self.inclusive_cpu += time.process_time() - cpu
+        _CURRENT.reset(self._token)
+        if exc_type is not None:
+            self.metrics.status = "failed"
+        self.finish()
+
+    def wrap(self, frames: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Yield ``frames``, charging the time spent producing each to this stage."""
+
+        iterator = iter(frames)
+        try:
+            while True:
+                token = _CURRENT.set(self.metrics)
+                wall, cpu = time.perf_counter(), time.process_time()
+                try:
+                    frame = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    self.inclusive_wall += time.perf_counter() - wall
+                    self.inclusive_cpu += time.process_time() - cpu
+                    _CURRENT.reset(token)
+                self.metrics.rows_out += len(frame)
+                yield frame
+        finally:
+            self.finish()
+
+    def finish(self) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        upstream_wall = self.upstream.inclusive_wall if self.upstream else 0.0
+        upstream_cpu = self.upstream.inclusive_cpu if self.upstream else 0.0
+        if self.upstream is not None and not self.metrics.rows_in:
+            self.metrics.rows_in = self.upstream.metrics.rows_out
+        self.metrics.wall_seconds = round(max(0.0, self.inclusive_wall - upstream_wall), 4)
+        self.metrics.cpu_seconds = round(max(0.0, self.inclusive_cpu - upstream_cpu), 4)
+        self.metrics.peak_rss_mb = peak_rss_mb()
+
+        REGISTRY.observe(self.metrics)
+        run = _RUN.get()
+        if run is not None and self.metrics is not run.metrics:
+            run.stages.append(self.metrics)
+
+
+class Run(StageMeter):
+    """One CLI command or web job; also the stage that covers all of it."""
+
+    def __init__(self, command: str, log_path: Path | str | None = None) -> None:
+        super().__init__(command)
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.log_path = Path(log_path) if log_path else None
+        self.stages: list[StageMetrics] = []
+        self._run_token = None
+
+    def __enter__(self) -> "Run":
+        self._run_token = _RUN.set(self)
+        return super().__enter__()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            super().__exit__(exc_type, exc, tb)
+        finally:
+            _RUN.reset(self._run_token)
+            if self.log_path is not None:
+                self.write(self.log_path)
+
+    def to_dict(self) -> dict:
+        return {
+            "run_id": self.run_id,
+            "command": self.metrics.stage,
+            "started_at": self.started_at,
+            **{key: value for key, value in self.metrics.to_dict().items() if key != "stage"},
+            "stages": [stage.to_dict() for stage in self.stages],
+        }
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(self.to_dict()) + "\n")
+
+
+_COUNTERS: dict[str, tuple[str, str]] = {
+    "runs": ("mavstampede_stage_runs_total", "Finished stage executions"),
+    "failures": ("mavstampede_stage_failures_total", "Stage executions that raised"),
+    "wall_seconds": ("mavstampede_stage_wall_seconds_total", "Wall-clock seconds spent in the stage"),
+    "cpu_seconds": ("mavstampede_stage_cpu_seconds_total", "Process CPU seconds spent in the stage"),
+    "rows_in": ("mavstampede_stage_rows_in_total", "Rows read by the stage"),
+    "rows_out": ("mavstampede_stage_rows_out_total", "Rows produced by the stage"),
+    "bytes_read": ("mavstampede_stage_bytes_read_total", "Bytes of input files read by the stage"),
+    "bytes_written": ("mavstampede_stage_bytes_written_total", "Bytes of artifacts written by the stage"),
+}
+
+
+@dataclass
+class _StageTotals:
+    values: dict[str, float] = field(default_factory=lambda: dict.fromkeys(_COUNTERS, 0.0))
+    last_wall_seconds: float = 0.0
+
+
+class MetricsRegistry:
+    """Process-wide totals per stage, rendered in Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stages: dict[str, _StageTotals] = {}
+
+    def observe(self, metrics: StageMetrics) -> None:
+        with self._lock:
+            totals = self._stages.setdefault(metrics.stage, _StageTotals())
+            totals.values["runs"] += 1
+            totals.values["failures"] += metrics.status != "ok"
+            for name in ("wall_seconds", "cpu_seconds", "rows_in", "rows_out", "bytes_read", "bytes_written"):
+                totals.values[name] += getattr(metrics, name)
+            totals.last_wall_seconds = metrics.wall_seconds
+
+    def render(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            stages = sorted(self._stages.items())
+            for key, (name, help_text) in _COUNTERS.items():
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                lines += [f'{name}{{stage="{stage}"}} {totals.values[key]:g}' for stage, totals in stages]
+            name = "mavstampede_stage_last_wall_seconds"
+            lines += [f"# HELP {name} Wall-clock seconds of the latest execution", f"# TYPE {name} gauge"]
+            lines += [f'{name}{{stage="{stage}"}} {totals.last_wall_seconds:g}' for stage, totals in stages]
+        name = "mavstampede_process_peak_rss_bytes"
+        lines += [f"# HELP {name} Peak resident set size of the process", f"# TYPE {name} gauge"]
+        lines.append(f"{name} {int(peak_rss_mb() * 2**20)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+__all__ = [
+    "REGISTRY",
+    "MetricsRegistry",
+    "Run",
+    "StageMeter",
+    "StageMetrics",
+    "count_rows",
+    "peak_rss_mb",
+    "record",
+    "record_files_read",
+]
@@ -1,13 +1,28 @@
-"""Time-related helpers."""
+"""Time-related helpers.
+
+pandas is imported inside :func:`parse_dates` so ``find`` can use
+:func:`parse_window` without loading it.
+"""
 
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 import re
-from typing import Tuple
+import warnings
+from typing import TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 Window = Tuple[datetime, datetime]
 
+# Date "shape" (digits masked) -> strptime format guessed for it, or None.
+_FORMAT_CACHE: dict[str, str | None] = {}
+_MASK_DIGITS = str.maketrans("0123456789", "0000000000")
+# Shapes such as 00/00/0000 read as day/month or month/day depending on the
+# sample, so they are never cached; see _day_month_formats.
+_AMBIGUOUS_SHAPE = re.compile(r"0{1,2}([/.-])0{1,2}\1(?:0{4}|0{2})(?!0)")
+
 
 def parse_window(window_str: str, *, now: datetime | None = None) -> Window:
     """Parse ``<number><unit>`` windows such as ``"21d"``.
@@ -16,6 +31,8 @@ def parse_window(window_str: str, *, now: datetime | None = None) -> Window:
     - ``d`` – days
     - ``w`` – weeks
     - ``h`` – hours
+
+    Anything else raises ``ValueError``.
     """
 
     if now is None:
@@ -23,7 +40,9 @@ def parse_window(window_str: str, *, now: datetime | None = None) -> Window:
 
     match = re.fullmatch(r"(\d+)([dwh])", window_str.strip())
     if not match:
-        return now - timedelta(days=21), now
+        raise ValueError(
+            f"Invalid window '{window_str}': use a number followed by d, w or h (e.g. 21d, 6w, 48h), or all"
+        )
 
     value = int(match.group(1))
     unit = match.group(2)
@@ -37,4 +56,98 @@ def parse_window(window_str: str, *, now: datetime | None = None) -> Window:
     return now - delta_map[unit], now
 
 
-__all__ = ["parse_window", "Window"]
+def check_window(spec: str) -> str:
+    """Return ``spec`` if it is ``all`` or a window :func:`parse_window` accepts, else raise ``ValueError``."""
+
+    if spec.strip().lower() != "all":
+        parse_window(spec)
+    return spec
+
+
+def _format_for(shape: str, sample: str) -> str | None:
+    if _AMBIGUOUS_SHAPE.match(shape):
+        return None
+    if shape not in _FORMAT_CACHE:
+        from pandas.tseries.api import guess_datetime_format
+
+        _FORMAT_CACHE[shape] = guess_datetime_format(sample)
+    return _FORMAT_CACHE[shape]
+
+
+def _day_month_formats(sample: str) -> tuple[str, ...]:
+    """Return the month-first and day-first formats for an ambiguous ``sample``.
+
+    Each value is read month-first when it can be (as pandas reads a lone
+    ``10/11/2025``) and day-first otherwise, whatever the other values are.
+    """
+
+    from pandas.tseries.api import guess_datetime_format
+
+    with warnings.catch_warnings():
+        # pandas warns when it guesses day-first; both orders are tried anyway.
+        warnings.simplefilter("ignore", UserWarning)
+        fmt = guess_datetime_format(sample)
+    if fmt is None or "%d" not in fmt or "%m" not in fmt:
+        return ()
+    swapped = fmt.replace("%d", "\0").replace("%m", "%d").replace("\0", "%m")
+    return (fmt, swapped) if fmt.index("%m") < fmt.index("%d") else (swapped, fmt)
+
+
+def _parse_group(group: pd.Series, shape: str) -> pd.Series:
+    import pandas as pd
+
+    if _AMBIGUOUS_SHAPE.match(shape):
+        formats = _day_month_formats(group.iloc[0])
+    else:
+        fmt = _format_for(shape, group.iloc[0])
+        formats = (fmt,) if fmt is not None else ()
+    parsed = pd.Series(pd.NaT, index=group.index, dtype="datetime64[ns, UTC]")
+    missing = group
+    for fmt in formats:
+        attempt = pd.to_datetime(missing, format=fmt, utc=True, errors="coerce")
+        parsed[attempt.index] = attempt
+        missing = missing[attempt.isna()]
+        if missing.empty:
+            return parsed
+    parsed[missing.index] = pd.to_datetime(missing, format="mixed", utc=True, errors="coerce")
+    return parsed
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """Parse mixed-format date strings to UTC timestamps (``NaT`` if unparseable).
+
+    Each distinct string is parsed once, in vectorized passes with an
+    explicit format guessed per shape (digits masked out, e.g.
+    ``0000-00-00T00:00:00Z``) and cached. The first string's format is tried
+    on everything; strings it does not fit are grouped by shape, one group per
+    source format, and only strings no guessed format fits fall back to
+    per-value inference. Day/month shapes such as ``10/11/2025`` are never
+    cached and are read month-first where possible, so a date parses the same
+    whatever came before it.
+    """
+
+    import pandas as pd
+
+    codes, uniques = pd.factorize(values.fillna("").astype(str))
+    uniques = pd.Series(uniques, dtype=object).str.strip()
+    uniques = uniques[uniques != ""]
+    parsed = pd.Series(pd.NaT, index=range(codes.max() + 1 if len(codes) else 0), dtype="datetime64[ns, UTC]")
+    if uniques.empty:
+        return pd.Series(parsed.array.take(codes, allow_fill=True), index=values.index)
+
+    first = uniques.iloc[0]
+    fmt = _format_for(first.translate(_MASK_DIGITS), first)
+    if fmt is not None:
+        attempt = pd.to_datetime(uniques, format=fmt, utc=True, errors="coerce")
+        parsed[attempt.index] = attempt
+        uniques = uniques[attempt.isna()]
+
+    if not uniques.empty:
+        shapes = uniques.str.translate(_MASK_DIGITS)
+        for shape, group in uniques.groupby(shapes, sort=False):
+            parsed[group.index] = _parse_group(group, shape)
+
+    return pd.Series(parsed.array.take(codes, allow_fill=True), index=values.index)
+
+
+__all__ = ["check_window", "parse_dates", "parse_window", "Window"]
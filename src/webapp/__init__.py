@@ -5,10 +5,15 @@ import os
 from datetime import datetime
 from pathlib import Path
 import pandas as pd
-from flask import Flask, flash, redirect, render_template, request, url_for
+from flask import Flask, Response, flash, jsonify, redirect, render_template, request, url_for
 
-from src.cli import CONFIG_PATH, load_config
+from src.export.formats import load_frame, with_format
+from src.utils.config import CONFIG_PATH, load_config
+from src.utils.metrics import REGISTRY
+from src.utils.time_utils import check_window
 from . import pipeline
+from .jobs import JobFunction, JobRunner
+from .report import SORTABLE_COLUMNS, ReportQuery, ReportStore
 
 DEFAULT_WINDOW = "21d"
 
@@ -16,14 +21,18 @@ DEFAULT_WINDOW = "21d"
 class WebConfig:
     """Simple container for filesystem paths used by the web UI."""
 
-    def __init__(self, root: Path) -> None:
+    def __init__(self, root: Path, artifact_format: str | None = None, classify_workers: int = 1) -> None:
         self.root = root
+        self.artifact_format = artifact_format
+        self.classify_workers = classify_workers
         self.raw_dir = root / "raw"
         self.output_dir = root
         self.work_dir = root / "webapp"
+        self.cache_dir = self.work_dir / "cache"
+        self.run_log = self.work_dir / "run_log.jsonl"
         self.candidates_csv = root / "candidates.csv"
-        self.normalized_csv = root / "comments_raw.csv"
-        self.classified_csv = root / "comments_classified.csv"
+        self.normalized_csv = with_format(root / "comments_raw.csv", artifact_format)
+        self.classified_csv = with_format(root / "comments_classified.csv", artifact_format)
         self.final_csv = root / "mavstampede_monitor.csv"
 
         self.root.mkdir(parents=True, exist_ok=True)
@@ -36,7 +45,20 @@ def create_app() -> Flask:
     app.secret_key = os.environ.get("BOX_FIVE_SECRET_KEY", "development-secret")
 
     data_root = Path(os.environ.get("BOX_FIVE_DATA_DIR", "data")).resolve()
-    app.config["WEB_CONFIG"] = WebConfig(data_root)
+    try:
+        artifact_format = (load_config() or {}).get("artifact_format") if CONFIG_PATH.exists() else None
+    except Exception:  # pragma: no cover - surfaced on the index page instead
+        artifact_format = None
+    app.config["WEB_CONFIG"] = WebConfig(
+        data_root, artifact_format, classify_workers=int(os.environ.get("BOX_FIVE_CLASSIFY_WORKERS", "1"))
+    )
+    runner = JobRunner(
+        max_workers=int(os.environ.get("BOX_FIVE_JOB_WORKERS", "2")),
+        run_log=app.config["WEB_CONFIG"].run_log,
+    )
+    app.config["JOB_RUNNER"] = runner
+    reports = ReportStore()
+    app.config["REPORT_STORE"] = reports
 
     @app.context_processor
     def inject_globals() -> dict:
@@ -50,45 +72,21 @@ def create_app() -> Flask:
         web_config: WebConfig = app.config["WEB_CONFIG"]
         window = request.form.get("window", DEFAULT_WINDOW)
         if request.method == "POST":
-            action = request.form.get("action")
+            action = request.form.get("action", "")
             try:
-                if action == "run_pipeline":
-                    final_path = pipeline.run_full_pipeline(
-                        raw_dir=web_config.raw_dir,
-                        working_dir=web_config.work_dir,
-                        output_dir=web_config.output_dir,
-                        window=window,
-                        on_step=lambda name, path: flash(
-                            f"{name} ready → {path}", "info"
-                        ),
-                    )
-                    flash(f"Pipeline complete → {final_path}", "success")
-                elif action == "generate":
-                    csv_path = pipeline.generate_candidates(web_config.candidates_csv, window)
-                    flash(f"Generated search queries → {csv_path}", "success")
-                elif action == "normalize":
-                    csv_path = pipeline.normalize_exports(
-                        web_config.raw_dir, web_config.normalized_csv
-                    )
-                    flash(f"Normalized exports → {csv_path}", "success")
-                elif action == "classify":
-                    csv_path = pipeline.classify_comments(
-                        web_config.normalized_csv, web_config.classified_csv
-                    )
-                    flash(f"Classified comments → {csv_path}", "success")
-                elif action == "export":
-                    csv_path = pipeline.export_report(
-                        web_config.classified_csv, web_config.final_csv
-                    )
-                    flash(f"Copied final report → {csv_path}", "success")
-                else:
-                    flash("Unknown action", "error")
-            except FileNotFoundError as exc:
+                check_window(window)
+            except ValueError as exc:
                 flash(str(exc), "error")
-            except SystemExit as exc:
-                flash(f"Pipeline aborted: {exc}", "error")
-            except Exception as exc:  # pylint: disable=broad-except
-                flash(f"Unexpected error: {exc}", "error")
+                return redirect(url_for("index"))
+            job_function = _job_function(web_config, action, window)
+            if job_function is None:
+                flash("Unknown action", "error")
+            else:
+                job, created = runner.submit(web_config.root, action, job_function)
+                if created:
+                    flash(f"Started {action} job {job.id}", "info")
+                else:
+                    flash(f"{action} is already running as job {job.id}; joined it", "info")
 
             return redirect(url_for("index"))
 
@@ -107,17 +105,101 @@ def create_app() -> Flask:
             status_cards=status_cards,
             final_preview=final_preview,
             rules=rules,
+            jobs=runner.recent(),
+        )
+
+    @app.route("/api/jobs", methods=["GET", "POST"])
+    def jobs_api():
+        web_config: WebConfig = app.config["WEB_CONFIG"]
+        if request.method == "GET":
+            return jsonify([job.to_dict() for job in runner.recent()])
+
+        payload = request.get_json(silent=True) or request.form
+        action = payload.get("action", "run_pipeline")
+        window = payload.get("window", DEFAULT_WINDOW)
+        try:
+            check_window(window)
+        except ValueError as exc:
+            return jsonify({"error": str(exc)}), 400
+        job_function = _job_function(web_config, action, window)
+        if job_function is None:
+            return jsonify({"error": f"Unknown action '{action}'"}), 400
+
+        job, created = runner.submit(web_config.root, action, job_function)
+        body = job.to_dict()
+        body["merged"] = not created
+        return jsonify(body), 202
+
+    @app.route("/api/jobs/<job_id>")
+    def job_status(job_id: str):
+        job = runner.get(job_id)
+        if job is None:
+            return jsonify({"error": f"Unknown job '{job_id}'"}), 404
+        return jsonify(job.to_dict())
+
+    @app.route("/metrics")
+    def metrics():
+        return Response(REGISTRY.render(), mimetype="text/plain; version=0.0.4")
+
+    @app.route("/report")
+    def report():
+        web_config: WebConfig = app.config["WEB_CONFIG"]
+        query = ReportQuery.from_args(request.args)
+        page = reports.query(web_config.final_csv, query)
+        return render_template(
+            "report.html",
+            page=page,
+            query=query,
+            facets=reports.facets(web_config.final_csv),
+            sortable=SORTABLE_COLUMNS,
+            final_path=web_config.final_csv,
         )
 
+    @app.route("/api/report")
+    def report_api():
+        web_config: WebConfig = app.config["WEB_CONFIG"]
+        page = reports.query(web_config.final_csv, ReportQuery.from_args(request.args))
+        if page is None:
+            return jsonify({"error": f"No report at {web_config.final_csv}"}), 404
+        return jsonify(page.to_dict())
+
     return app
 
 
+def _job_function(web_config: WebConfig, action: str, window: str) -> JobFunction | None:
+    """Return the callable that runs ``action`` in a background job."""
+
+    if action == "run_pipeline":
+        return lambda on_step: pipeline.run_full_pipeline(
+            raw_dir=web_config.raw_dir,
+            working_dir=web_config.work_dir,
+            output_dir=web_config.output_dir,
+            window=window,
+            cache_dir=web_config.cache_dir,
+            artifact_format=web_config.artifact_format,
+            workers=web_config.classify_workers,
+            on_step=on_step,
+        )
+    if action == "generate":
+        return lambda on_step: pipeline.generate_candidates(web_config.candidates_csv, window)
+    if action == "normalize":
+        return lambda on_step: pipeline.normalize_exports(
+            web_config.raw_dir, web_config.normalized_csv, window
+        )
+    if action == "classify":
+        return lambda on_step: pipeline.classify_comments(
+            web_config.normalized_csv, web_config.classified_csv, window, web_config.classify_workers
+        )
+    if action == "export":
+        return lambda on_step: pipeline.export_report(web_config.classified_csv, web_config.final_csv)
+    return None
+
+
 def _load_preview(path: Path, limit: int = 25) -> pd.DataFrame | None:
     if not path.exists():
         return None
     try:
-        df = pd.read_csv(path).head(limit)
-        return df
+        return load_frame(path, nrows=limit)
     except Exception:
         return None
 
@@ -0,0 +1,131 @@
+"""In-process background jobs so pipeline runs do not block request threads."""
+from __future__ import annotations
+
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from src.utils.metrics import Run
+
+StepCallback = Callable[[str, Path], None]
+JobFunction = Callable[[StepCallback], Path]
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass
+class Job:
+    """State of one background run, as reported by the status endpoint."""
+
+    id: str
+    data_dir: str
+    action: str
+    status: str = "queued"
+    steps: list[dict] = field(default_factory=list)
+    result: str | None = None
+    error: str | None = None
+    created_at: str = field(default_factory=_now)
+    finished_at: str | None = None
+    metrics: dict | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in {"succeeded", "failed"}
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "data_dir": self.data_dir,
+            "action": self.action,
+            "status": self.status,
+            "steps": list(self.steps),
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "metrics": self.metrics,
+        }
+
+
+class JobRunner:
+    """Run pipeline actions on a thread pool, one at a time per data directory.
+
+    Submitting an action that is already queued or running for the same data
+    directory returns the existing job instead of starting a second one, so
+    repeated clicks merge into a single run. Different actions on the same
+    directory are serialized so they never write the same files concurrently.
+    Each job is an instrumented :class:`~src.utils.metrics.Run`, appended to
+    ``run_log`` when given.
+    """
+
+    def __init__(self, max_workers: int = 2, history: int = 50, run_log: Path | None = None) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pipeline-job")
+        self._lock = threading.Lock()
+        self._jobs: dict[str, Job] = {}
+        self._active: dict[tuple[str, str], str] = {}
+        self._dir_locks: dict[str, threading.Lock] = {}
+        self._history = history
+        self._run_log = run_log
+
+    def submit(self, data_dir: Path | str, action: str, func: JobFunction) -> tuple[Job, bool]:
+        """Queue ``func`` and return ``(job, created)``; ``created`` is False when merged."""
+
+        key = (str(data_dir), action)
+        with self._lock:
+            active_id = self._active.get(key)
+            if active_id is not None:
+                return self._jobs[active_id], False
+
+            job = Job(id=uuid.uuid4().hex[:12], data_dir=key[0], action=action)
+            self._jobs[job.id] = job
+            self._active[key] = job.id
+            self._dir_locks.setdefault(key[0], threading.Lock())
+            self._trim()
+
+        self._executor.submit(self._run, job, func)
+        return job, True
+
+    def _run(self, job: Job, func: JobFunction) -> None:
+        def on_step(name: str, path: Path) -> None:
+            job.steps.append({"name": name, "path": str(path), "at": _now()})
+
+        with self._dir_locks[job.data_dir]:
+            job.status = "running"
+            run = Run(job.action, self._run_log)
+            try:
+                with run:
+                    job.result = str(func(on_step))
+                job.status = "succeeded"
+            except SystemExit as exc:
+                job.error = f"Pipeline aborted: {exc}"
+                job.status = "failed"
+            except Exception as exc:  # pylint: disable=broad-except
+                job.error = str(exc)
+                job.status = "failed"
+            finally:
+                job.metrics = run.to_dict()
+                job.finished_at = _now()
+                with self._lock:
+                    self._active.pop((job.data_dir, job.action), None)
+
+    def _trim(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[: max(0, len(self._jobs) - self._history)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def recent(self, limit: int = 10) -> list[Job]:
+        with self._lock:
+            return list(self._jobs.values())[-limit:][::-1]
+
+
+__all__ = ["Job", "JobFunction", "JobRunner", "StepCallback"]
@@ -20,17 +20,19 @@ def generate_candidates(out_path: Path, window: str = "21d") -> Path:
     return out_path
 
 
-def normalize_exports(in_dir: Path, out_path: Path) -> Path:
+def normalize_exports(in_dir: Path, out_path: Path, window: str | None = None) -> Path:
     """Normalize CSV exports from the provided directory."""
     out_path = _ensure_parent(out_path)
-    cli.cmd_parse_exports(Namespace(in_dir=str(in_dir), out=str(out_path)))
+    cli.cmd_parse_exports(Namespace(in_dir=str(in_dir), out=str(out_path), window=window))
     return out_path
 
 
-def classify_comments(in_path: Path, out_path: Path) -> Path:
-    """Classify normalized comments using the configured rules."""
+def classify_comments(
+    in_path: Path, out_path: Path, window: str | None = None, workers: int | None = None
+) -> Path:
+    """Classify normalized comments using the configured rules, in ``workers`` processes."""
     out_path = _ensure_parent(out_path)
-    cli.cmd_classify(Namespace(in_=str(in_path), out=str(out_path)))
+    cli.cmd_classify(Namespace(in_=str(in_path), out=str(out_path), window=window, workers=workers))
     return out_path
 
 
@@ -47,22 +49,47 @@ def run_full_pipeline(
     output_dir: Path,
     window: str = "21d",
     on_step: Callable[[str, Path], None] | None = None,
+    keep_intermediates: bool = False,
+    cache_dir: Path | None = None,
+    artifact_format: str | None = None,
+    dedup: bool = True,
+    workers: int | None = None,
 ) -> Path:
-    """Execute every stage of the pipeline and return the final CSV path."""
+    """Execute every stage of the pipeline and return the final CSV path.
+
+    Normalized and classified frames are handed between stages in memory;
+    pass ``keep_intermediates=True`` to also write them under ``working_dir``
+    in ``artifact_format``.
+    With ``cache_dir`` only new or changed exports are re-processed, and with
+    ``dedup`` comments repeated across overlapping exports are reported once.
+    Comments dated outside ``window`` (``"all"`` keeps everything) are dropped
+    before classification. ``workers`` processes read the exports and
+    classify large frames. Comment texts classified in earlier runs come
+    from the ``text_cache`` in ``config.yaml``, when one is configured.
+    """
+    from src.classify.text_cache import TextCache
+    from src.filters.dedup import DedupIndex
+    from src.filters.window import WindowFilter
+    from src.utils.cache import ExportCache
+
     candidates = generate_candidates(working_dir / "candidates.csv", window=window)
     if on_step:
         on_step("Candidates", candidates)
 
-    normalized = normalize_exports(raw_dir, working_dir / "comments_raw.csv")
-    if on_step:
-        on_step("Normalized", normalized)
-
-    classified = classify_comments(normalized, working_dir / "comments_classified.csv")
-    if on_step:
-        on_step("Classified", classified)
-
-    final = export_report(classified, output_dir / "mavstampede_monitor.csv")
-    if on_step:
-        on_step("Exported", final)
-
-    return final
+    text_cache = TextCache.from_config(cli.load_config())
+    try:
+        return cli.run_pipeline(
+            raw_dir,
+            _ensure_parent(output_dir / "mavstampede_monitor.csv"),
+            work_dir=working_dir if keep_intermediates else None,
+            cache=ExportCache(cache_dir) if cache_dir else None,
+            fmt=artifact_format,
+            dedup=DedupIndex() if dedup else None,
+            window=WindowFilter.from_spec(window),
+            workers=workers,
+            text_cache=text_cache,
+            on_step=on_step,
+        )
+    finally:
+        if text_cache is not None:
+            text_cache.close()
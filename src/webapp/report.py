@@ -0,0 +1,226 @@
+"""Cached, filterable and paginated access to the final report."""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+from src.export.formats import load_frame
+
+SORTABLE_COLUMNS: tuple[str, ...] = (
+    "date_utc",
+    "platform",
+    "sentiment",
+    "confidence_cmumesa",
+    "commenter_handle",
+)
+MAX_PER_PAGE = 500
+
+
+def _utc_timestamp(value: str) -> pd.Timestamp | None:
+    """Parse a ``date_from``/``date_to`` value as UTC (naive means UTC); ``None`` if unreadable."""
+
+    try:
+        stamp = pd.Timestamp(value)
+    except ValueError:
+        return None
+    if pd.isna(stamp):
+        return None
+    return stamp.tz_localize("UTC") if stamp.tzinfo is None else stamp.tz_convert("UTC")
+
+
+@dataclass(frozen=True)
+class ReportQuery:
+    """Filters, sort order and page requested by the report views.
+
+    Unreadable numbers and dates in the request are ignored, as if not given.
+    """
+
+    platform: str = ""
+    sentiment: str = ""
+    theme: str = ""
+    date_from: str = ""
+    date_to: str = ""
+    min_confidence: float | None = None
+    sort: str = ""
+    descending: bool = False
+    page: int = 1
+    per_page: int = 50
+
+    @classmethod
+    def from_args(cls, args: Mapping[str, str]) -> "ReportQuery":
+        def number(name: str, default, cast):
+            try:
+                return cast(args.get(name)) if args.get(name) not in (None, "") else default
+            except ValueError:
+                return default
+
+        def date(name: str) -> str:
+            value = args.get(name, "").strip()
+            return value if value and _utc_timestamp(value) is not None else ""
+
+        sort = args.get("sort", "")
+        return cls(
+            platform=args.get("platform", "").strip().lower(),
+            sentiment=args.get("sentiment", "").strip().lower(),
+            theme=args.get("theme", "").strip().lower(),
+            date_from=date("date_from"),
+            date_to=date("date_to"),
+            min_confidence=number("min_confidence", None, float),
+            sort=sort if sort in SORTABLE_COLUMNS else "",
+            descending=args.get("order", "asc") == "desc",
+            page=max(1, number("page", 1, int)),
+            per_page=min(MAX_PER_PAGE, max(1, number("per_page", 50, int))),
+        )
+
+    def filter_key(self) -> tuple:
+        return (
+            self.platform,
+            self.sentiment,
+            self.theme,
+            self.date_from,
+            self.date_to,
+            self.min_confidence,
+            self.sort,
+            self.descending,
+        )
+
+
+@dataclass
+class ReportPage:
+    rows: pd.DataFrame
+    total: int
+    page: int
+    pages: int
+    query: ReportQuery
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "page": self.page,
+            "pages": self.pages,
+            "per_page": self.query.per_page,
+            "query": asdict(self.query),
+            "rows": self.rows.to_dict(orient="records"),
+        }
+
+
+class _LoadedReport:
+    """One parsed report plus the derived columns used for filtering."""
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self.frame = frame.reset_index(drop=True)
+        size = len(self.frame)
+
+        def text(column: str) -> pd.Series:
+            if column not in self.frame.columns:
+                return pd.Series([""] * size, dtype=object)
+            return self.frame[column].fillna("").astype(str)
+
+        self.platform = text("platform").str.lower().to_numpy()
+        self.sentiment = text("sentiment").str.lower().to_numpy()
+        self.themes = ("|" + text("themes").str.lower() + "|").to_numpy()
+        dates = self.frame["date_utc"] if "date_utc" in self.frame.columns else pd.Series([None] * size)
+        self.dates = pd.to_datetime(dates, utc=True, errors="coerce", format="mixed")
+        self.confidence = pd.to_numeric(
+            self.frame.get("confidence_cmumesa", pd.Series([np.nan] * size)), errors="coerce"
+        ).to_numpy()
+        self.results: OrderedDict[tuple, np.ndarray] = OrderedDict()
+
+    def positions(self, query: ReportQuery, cache_size: int = 32) -> np.ndarray:
+        """Row positions matching ``query`` in sort order, memoized per filter set."""
+
+        key = query.filter_key()
+        if key in self.results:
+            self.results.move_to_end(key)
+            return self.results[key]
+
+        mask = np.ones(len(self.frame), dtype=bool)
+        if query.platform:
+            mask &= self.platform == query.platform
+        if query.sentiment:
+            mask &= self.sentiment == query.sentiment
+        if query.theme:
+            mask &= pd.Series(self.themes).str.contains(f"|{query.theme}|", regex=False).to_numpy()
+        if query.date_from:
+            mask &= (self.dates >= _utc_timestamp(query.date_from)).to_numpy()
+        if query.date_to:
+            mask &= (self.dates <= _utc_timestamp(query.date_to)).to_numpy()
+        if query.min_confidence is not None:
+            mask &= self.confidence >= query.min_confidence
+
+        positions = np.flatnonzero(mask)
+        if query.sort in self.frame.columns:  # reports without the column keep file order
+            if query.sort == "date_utc":
+                keys = self.dates.iloc[positions]
+            elif query.sort == "confidence_cmumesa":
+                keys = pd.Series(self.confidence[positions])
+            else:
+                keys = self.frame[query.sort].iloc[positions].fillna("").astype(str)
+            order = np.argsort(keys.to_numpy(), kind="stable")
+            positions = positions[order[::-1] if query.descending else order]
+
+        self.results[key] = positions
+        if len(self.results) > cache_size:
+            self.results.popitem(last=False)
+        return positions
+
+
+class ReportStore:
+    """Keep the final report parsed in memory until its file changes.
+
+    The report is re-read only when its mtime or size changes, and the row
+    positions for each filter/sort combination are memoized, so paging
+    through a result costs a slice instead of a full parse.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loaded: dict[Path, tuple[tuple[int, int], _LoadedReport]] = {}
+
+    def _report(self, path: Path) -> _LoadedReport | None:
+        if not path.exists():
+            return None
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._loaded.get(path)
+            if cached is None or cached[0] != signature:
+                cached = (signature, _LoadedReport(load_frame(path)))
+                self._loaded[path] = cached
+            return cached[1]
+
+    def query(self, path: Path, query: ReportQuery) -> ReportPage | None:
+        report = self._report(path)
+        if report is None:
+            return None
+
+        with self._lock:
+            positions = report.positions(query)
+        total = len(positions)
+        pages = max(1, -(-total // query.per_page))
+        page = min(query.page, pages)
+        start = (page - 1) * query.per_page
+        rows = report.frame.iloc[positions[start : start + query.per_page]]
+        return ReportPage(rows=rows, total=total, page=page, pages=pages, query=query)
+
+    def facets(self, path: Path) -> dict[str, list[str]]:
+        """Distinct platforms, sentiments and themes for the filter dropdowns."""
+
+        report = self._report(path)
+        if report is None:
+            return {"platform": [], "sentiment": [], "theme": []}
+        themes = {theme for value in set(report.themes) for theme in value.strip("|").split("|") if theme}
+        return {
+            "platform": sorted(set(report.platform) - {""}),
+            "sentiment": sorted(set(report.sentiment) - {""}),
+            "theme": sorted(themes),
+        }
+
+
+__all__ = ["ReportPage", "ReportQuery", "ReportStore", "SORTABLE_COLUMNS"]
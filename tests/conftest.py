@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """A scratch working directory with the example config and an empty ``raw/``."""
+
+    shutil.copy(ROOT / "config.example.yaml", tmp_path / "config.yaml")
+    (tmp_path / "data" / "samples").mkdir(parents=True)
+    shutil.copy(ROOT / "data" / "samples" / "search_terms.txt", tmp_path / "data" / "samples")
+    (tmp_path / "raw").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,45 @@
+"""BrowserRunner against the local fixture pages of ``benchmarks.browser_pool`` (needs Chromium)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from benchmarks.browser_pool import fixture_server, read_comments  # noqa: E402
+from src.collectors.browser_pool import BrowserPool, BrowserRunner, state_path  # noqa: E402
+from src.collectors.facebook_playwright import open_session  # noqa: E402
+
+
+@pytest.fixture
+def runner(tmp_path):
+    runner = BrowserRunner(BrowserPool(state_dir=tmp_path, max_pages=2))
+    try:
+        runner.run(runner.pool.start())
+    except Exception as exc:  # no Chromium in this environment
+        runner.close()
+        pytest.skip(f"Chromium is not available: {str(exc).splitlines()[0]}")
+    with runner:
+        yield runner
+
+
+def _comments(platform: str, post: str) -> list[str]:
+    return [f"{platform} fan {index}: Go Mavs! ({post})" for index in range(3)]
+
+
+def test_runner_reuses_one_browser(runner):
+    with fixture_server(3) as base:
+        facebook = runner.collect("facebook", [f"{base}/facebook/post-{index}" for index in range(3)], read_comments)
+        browser = runner.pool.browser
+        instagram = runner.collect("instagram", [f"{base}/instagram/post-0"], read_comments)
+
+        state_path("tiktok", runner.pool.state_dir).write_text(json.dumps({"cookies": [], "origins": []}))
+        with open_session(f"{base}/tiktok/post-1", "tiktok", runner=runner) as (_, _, page):
+            tiktok = page.locator("li.comment").all_inner_texts()
+
+    assert facebook == [_comments("facebook", f"post-{index}") for index in range(3)]
+    assert instagram == [_comments("instagram", "post-0")]
+    assert tiktok == _comments("tiktok", "post-1")
+    assert runner.pool.browser is browser and browser.is_connected()
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from src.utils.cache import ExportCache
+
+
+def _run(cache_dir, raw_dir, version="v1") -> ExportCache:
+    cache = ExportCache(cache_dir)
+    for path in sorted(raw_dir.glob("*.csv")):
+        key = cache.fingerprint(path)
+        cache.load_or_build("normalized", key, lambda: pd.DataFrame({"a": [1]}))
+        cache.load_or_build("classified", key, lambda: pd.DataFrame({"a": [1]}), version=version)
+    cache.save()
+    return cache
+
+
+def test_layers_of_removed_or_changed_exports_are_pruned(tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "a.csv").write_text("x\n1\n", encoding="utf-8")
+    (raw / "b.csv").write_text("x\n2\n", encoding="utf-8")
+    _run(tmp_path / "cache", raw)
+    assert len(list((tmp_path / "cache").glob("*/*.csv"))) == 4
+
+    (raw / "a.csv").unlink()
+    (raw / "b.csv").write_text("x\n3\n", encoding="utf-8")
+    cache = _run(tmp_path / "cache", raw)
+
+    assert cache.stats["normalized_pruned"] == cache.stats["classified_pruned"] == 2
+    (entry,) = cache.manifest.values()
+    names = sorted(path.name for path in (tmp_path / "cache").glob("*/*.csv"))
+    assert names == [f"{entry['sha256']}-v1.csv", f"{entry['sha256']}.csv"]
+
+
+def test_classified_files_of_other_versions_are_pruned(tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "a.csv").write_text("x\n1\n", encoding="utf-8")
+    _run(tmp_path / "cache", raw)
+
+    cache = _run(tmp_path / "cache", raw, version="v2")
+
+    assert cache.stats["classified_pruned"] == 1
+    assert "normalized_pruned" not in cache.stats
+    (entry,) = cache.manifest.values()
+    names = sorted(path.name for path in (tmp_path / "cache" / "classified").glob("*.csv"))
+    assert names == [f"{entry['sha256']}-v2.csv"]
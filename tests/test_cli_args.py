@@ -0,0 +1,47 @@
+"""Bad option values end in a usage error, not a traceback."""
+
+from __future__ import annotations
+
+import pytest
+
+from src import cli
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["store-query", "--db", "store.sqlite", "--since", "last tuesday"],
+        ["store-query", "--db", "store.sqlite", "--until", "2025-13-40"],
+        ["export", "--db", "store.sqlite", "--out", "out.csv", "--since", "NaT"],
+    ],
+)
+def test_invalid_store_dates_are_usage_errors(tmp_path, monkeypatch, capsys, argv):
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main(argv)
+
+    assert exc.value.code == 2
+    assert "Invalid date" in capsys.readouterr().err
+    assert not (tmp_path / "store.sqlite").exists()
+
+
+@pytest.mark.parametrize("value", ["2025-10-01", "2025-10-01T18:00:00Z", "2025-10-01 18:00"])
+def test_valid_store_dates_are_accepted(value):
+    assert cli.moment_arg(value) == value
+
+
+@pytest.mark.parametrize("time_window", ["30days", "21D", "2m"])
+def test_invalid_config_time_window_exits_with_a_message(workdir, time_window):
+    config = workdir / "config.yaml"
+    config.write_text(
+        config.read_text(encoding="utf-8").replace('time_window: "21d"', f'time_window: "{time_window}"'),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["find", "--out", "candidates.csv"])
+
+    assert f"Invalid window '{time_window}'" in str(exc.value.code)
+    assert "time_window in config.yaml" in str(exc.value.code)
+    assert not (workdir / "candidates.csv").exists()
@@ -0,0 +1,69 @@
+"""The compiled matcher must score exactly like the reference ``in`` checks."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import yaml
+
+from src.classify.batch import classify_frame
+from src.classify.sentiment_rules import sentiment_from_score
+from src.filters.cmu_rules import compile_rules, score_band, score_text
+
+ROOT = Path(__file__).resolve().parents[1]
+
+CONFIG_RULES = yaml.safe_load((ROOT / "config.example.yaml").read_text(encoding="utf-8"))["rules"]
+# Terms nested in, overlapping with and repeating each other, in mixed case and padding.
+OVERLAPPING_RULES = {
+    "positive_terms": ["Mesa", "Colorado Mesa", "mavs", "Mavs", "  Maverick ", "band"],
+    "negative_terms": ["Mesa State", "CMU", "ado me", ""],
+    "neutral_terms": ["CMU band", "and", "a"],
+}
+
+SAMPLES = [
+    "",
+    "Go Mavs!",
+    "GO MAVERICKS from Grand Junction",
+    "Colorado Mesa halftime with the CMU band",
+    "colorado mesa state? no, Carnegie Mellon in Pittsburgh",
+    "mavsmavs mesamesa",
+    "Mesa State was the old name of Colorado Mesa",
+    "the cmubands page (@cmubands)",
+    "Central Michigan Chippewas",
+    "ÇOLORADO MESA — İstanbul fans 🎺",
+]
+
+
+def _assert_same(text: str, rules: dict) -> None:
+    assert score_text(text, compile_rules(rules)) == score_text(text, rules)
+
+
+@pytest.mark.parametrize("rules", [CONFIG_RULES, OVERLAPPING_RULES], ids=["config", "overlapping"])
+@pytest.mark.parametrize("text", SAMPLES)
+def test_compiled_matches_reference_on_samples(text, rules):
+    _assert_same(text, rules)
+
+
+@pytest.mark.parametrize("rules", [CONFIG_RULES, OVERLAPPING_RULES], ids=["config", "overlapping"])
+def test_compiled_matches_reference_on_random_texts(rules):
+    rng = random.Random(20251018)
+    pieces = [term for terms in rules.values() for term in terms if term] + [
+        " ", "  ", "!", "#", "s", "x", "mes", "olo", "MAV", "band", "\n", "É",
+    ]
+    for _ in range(2000):
+        words = rng.choices(pieces, k=rng.randint(0, 8))
+        text = "".join(word.upper() if rng.random() < 0.3 else word for word in words)
+        _assert_same(text, rules)
+
+
+def test_batch_classification_uses_the_score_bands():
+    frame = pd.DataFrame({"post_url": "p", "post_caption_excerpt": "", "comment_text": SAMPLES})
+    classified = classify_frame(frame, CONFIG_RULES)
+
+    for text, sentiment, confidence in zip(SAMPLES, classified["sentiment"], classified["confidence_cmumesa"]):
+        item = score_text(text, CONFIG_RULES)
+        assert (sentiment, confidence) == (sentiment_from_score(item.score), item.confidence)
+        assert score_band(item.score).label == item.label
@@ -0,0 +1,78 @@
+"""Re-runs with a persistent ``--dedup_index`` keep the earlier output."""
+
+from __future__ import annotations
+
+
+import pandas as pd
+import pytest
+
+from src import cli
+
+HEADER = "date,platform,post_url,post_owner,post_caption,comment_id,commenter,comment_text\n"
+FIRST = """2025-09-26T18:47:00Z,Instagram,https://instagram.com/p/1,cmubands,Colorado Mesa halftime,1,@amy,Go Mavs!
+2025-09-27T10:00:00Z,Facebook,https://facebook.com/p/2,mesaband,Friday drill,2,@ben,"Loud, clean drill"
+"""
+SECOND = """2025-09-27T10:00:00Z,Facebook,https://facebook.com/p/2,mesaband,Friday drill,2,@ben,"Loud, clean drill"
+2025-09-28T12:00:00Z,TikTok,https://tiktok.com/@x/3,x,Carnegie Mellon show,3,@cat,so proud
+"""
+
+
+@pytest.fixture
+def workdir(workdir):
+    (workdir / "raw" / "first.csv").write_text(HEADER + FIRST, encoding="utf-8")
+    return workdir
+
+
+def _ids(path: str) -> list[str]:
+    return pd.read_csv(path, dtype=str)["comment_id"].tolist()
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        ["pipeline", "--in_dir", "raw", "--out", "out.csv"],
+        ["parse-exports", "--in_dir", "raw", "--out", "out.csv"],
+        ["parse-exports", "--in_dir", "raw", "--out", "out.csv", "--split_posts"],
+    ],
+)
+def test_rerun_keeps_output_and_adds_new_comments(workdir, command):
+    command = command + ["--dedup_index", "seen.npy"]
+    cli.main(command)
+    assert _ids("out.csv") == ["1", "2"]
+
+    cli.main(command)
+    assert _ids("out.csv") == ["1", "2"]
+
+    (workdir / "raw" / "second.csv").write_text(HEADER + SECOND, encoding="utf-8")
+    cli.main(command)
+    assert _ids("out.csv") == ["1", "2", "3"]
+
+
+def test_output_is_only_carried_over_from_a_loaded_index(workdir):
+    cli.main(["parse-exports", "--in_dir", "raw", "--out", "out.csv"])
+    for _ in range(2):
+        cli.main(["parse-exports", "--in_dir", "raw", "--out", "out.csv", "--dedup_index", "seen.npy"])
+        assert _ids("out.csv") == ["1", "2"]
+
+    (workdir / "seen.npy").unlink()
+    cli.main(["parse-exports", "--in_dir", "raw", "--out", "out.csv", "--dedup_index", "seen.npy"])
+    assert _ids("out.csv") == ["1", "2"]
+
+
+def test_carried_rows_are_windowed(workdir):
+    command = ["parse-exports", "--in_dir", "raw", "--out", "out.csv", "--dedup_index", "seen.npy"]
+    cli.main(command)
+    cli.main(command + ["--window", "21d"])
+
+    assert _ids("out.csv") == []
+
+
+def test_pipeline_reclassifies_carried_rows(workdir):
+    command = ["pipeline", "--in_dir", "raw", "--out", "out.csv", "--dedup_index", "seen.npy"]
+    cli.main(command)
+    assert "+Mavs" in pd.read_csv("out.csv", dtype=str)["notes"].iloc[0]
+
+    config = workdir / "config.yaml"
+    config.write_text(config.read_text(encoding="utf-8").replace('- "Mavs"', '- "Mavericks"'), encoding="utf-8")
+    cli.main(command)
+    assert "+Mavs" not in pd.read_csv("out.csv", dtype=str, keep_default_na=False)["notes"].iloc[0]
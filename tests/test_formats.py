@@ -0,0 +1,40 @@
+"""CSV and columnar intermediates must lead to the same exported report."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src import cli
+
+pytest.importorskip("pyarrow")
+
+RAW = """date,platform,post_url,post_owner,post_caption,comment_id,commenter,comment_text
+2025-09-26T18:47:00Z,Instagram,https://instagram.com/p/1,cmubands,Colorado Mesa halftime,1,@amy,Go Mavs!
+3 days ago,Facebook,https://facebook.com/p/2,mesaband,Friday drill,2,@ben,"Loud, clean drill"
+10/11/2025,TikTok,https://tiktok.com/@x/3,x,Carnegie Mellon show,3,@cat,so proud
+,Facebook,https://facebook.com/p/2,mesaband,Friday drill,4,@dan,
+"""
+
+
+@pytest.fixture
+def workdir(workdir):
+    (workdir / "raw" / "export.csv").write_text(RAW, encoding="utf-8")
+    return workdir
+
+
+def _report(fmt: str) -> bytes:
+    cli.main(["parse-exports", "--in_dir", "raw", "--out", f"{fmt}/raw.csv", "--format", fmt])
+    cli.main(["classify", "--in", f"{fmt}/raw.csv", "--out", f"{fmt}/classified.csv", "--format", fmt])
+    cli.main(["export", "--in", f"{fmt}/classified.csv", "--out", f"{fmt}/report.csv", "--format", fmt])
+    return Path(f"{fmt}/report.csv").read_bytes()
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "feather"])
+def test_columnar_intermediates_export_the_csv_report(workdir, fmt):
+    expected = _report("csv")
+
+    assert _report(fmt) == expected
+    assert b"2025-09-26T18:47:00Z" in expected
+    assert b"3 days ago" in expected
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pytest
+
+from src.utils.io_utils import iter_csvs
+
+
+@pytest.fixture
+def exports(tmp_path):
+    (tmp_path / "a_broken.csv").write_text("x,y\n1,2\n3,4\n\"5,6\n", encoding="utf-8")
+    (tmp_path / "b_good.csv").write_text("x,y\n8,9\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_chunked_read_reports_a_broken_file_and_continues(exports, capsys):
+    frames = list(iter_csvs(exports, chunksize=2))
+
+    assert [frame["x"].tolist() for frame in frames] == [["1", "3"], ["8"]]
+    assert "Failed to read" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_transform_errors_propagate(exports, chunksize):
+    def transform(frame):
+        raise KeyError("missing column")
+
+    with pytest.raises(KeyError):
+        list(iter_csvs(exports, "b_*.csv", chunksize=chunksize, transform=transform))
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import VARIANTS, generate_export
+from src.parsers.business_suite_csv_parser import NORMALIZED_COLUMNS, SchemaMapper, normalize_df
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.mark.parametrize("variant", sorted(VARIANTS))
+def test_synthetic_layouts_resolve_every_field(variant):
+    sources = SchemaMapper().resolve(generate_export(5, variant).columns)
+
+    missing = [field for field, column in sources.items() if column is None]
+    assert missing == ([] if "platform" in VARIANTS[variant] else ["platform"])
+
+
+def test_normalized_columns_are_read_back():
+    header = pd.read_csv(ROOT / "data" / "samples" / "comments_sample.csv", nrows=0).columns
+    assert list(header) == NORMALIZED_COLUMNS
+
+    sources = SchemaMapper().resolve(header)
+    assert sources == {field: field for field in NORMALIZED_COLUMNS}
+
+
+def test_normalize_keeps_normalized_values():
+    frame = normalize_df(generate_export(20, "business_suite"))
+    again = normalize_df(frame.astype(str))
+
+    pd.testing.assert_frame_equal(again.astype(str), frame.astype(str))
+
+
+PROFILES = {"tiktok": {"comment_text": ["comment"]}, "instagram": {"comment_text": ["caption_reply"]}}
+
+
+@pytest.mark.parametrize(
+    ("platforms", "source", "profile"),
+    [
+        (["TikTok", "tiktok "], "instagram_export.csv", "tiktok"),
+        (["Facebook", "Facebook"], "tiktok_export.csv", None),
+        (["TikTok", "Instagram"], "tiktok_export.csv", "tiktok"),
+        (["", ""], "instagram_export.csv", "instagram"),
+        (None, "instagram_export.csv", "instagram"),
+        (None, None, None),
+    ],
+)
+def test_profile_follows_the_platform_column(platforms, source, profile):
+    frame = pd.DataFrame({"comment": ["a", "b"]})
+    if platforms is not None:
+        frame["Platform"] = platforms
+
+    assert SchemaMapper(profiles=PROFILES).profile_for(frame, source) == profile
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from src.webapp.report import ReportQuery, ReportStore
+
+
+@pytest.fixture
+def report_csv(tmp_path):
+    path = tmp_path / "report.csv"
+    pd.DataFrame(
+        {
+            "date_utc": ["2025-10-01T10:00:00Z", "2025-10-03T10:00:00Z", "3 days ago"],
+            "platform": ["instagram", "facebook", "tiktok"],
+            "sentiment": ["positive", "neutral", "neutral"],
+            "themes": ["sound", "drill", "shout-outs"],
+            "confidence_cmumesa": [1.0, 0.3, 0.3],
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize("name", ["date_from", "date_to"])
+def test_unreadable_dates_are_ignored(report_csv, name):
+    query = ReportQuery.from_args({name: "garbage"})
+
+    assert getattr(query, name) == ""
+    assert ReportStore().query(report_csv, query).total == 3
+
+
+def test_date_range(report_csv):
+    query = ReportQuery.from_args({"date_from": "2025-10-02", "date_to": "2025-10-04T00:00+02:00"})
+
+    page = ReportStore().query(report_csv, query)
+    assert page.total == 1
+    assert page.rows["platform"].tolist() == ["facebook"]
+
+
+@pytest.mark.parametrize("sort", ["commenter_handle", "confidence_cmumesa"])
+def test_sort_by_a_missing_column_keeps_file_order(tmp_path, sort):
+    path = tmp_path / "report.csv"
+    pd.DataFrame({"platform": ["tiktok", "facebook", "instagram"]}).to_csv(path, index=False)
+    query = ReportQuery.from_args({"sort": sort, "order": "desc"})
+
+    assert query.sort == sort
+    assert ReportStore().query(path, query).rows["platform"].tolist() == ["tiktok", "facebook", "instagram"]
@@ -0,0 +1,121 @@
+"""SearchRunner, SearchCache and TokenBucket against the local stub of ``benchmarks.search_runner``."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmarks.search_runner import StubSearchHandler, reset_counts, stub_server
+from src.collectors.search_runner import SearchCache, SearchRunner, TokenBucket
+
+QUERIES = [(f"colorado mesa band {index}", "qdr:d" if index % 2 else None) for index in range(6)]
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    monkeypatch.setattr(StubSearchHandler, "latency_for", {})
+    monkeypatch.setattr(StubSearchHandler, "status_for", {})
+    reset_counts()
+    with stub_server(0) as url:
+        yield url
+
+
+def _run(url: str, cache: SearchCache | None, queries=QUERIES) -> list:
+    with SearchRunner(workers=4, rate=0, cache=cache, base_url=url) as runner:
+        return list(runner.run(queries))
+
+
+def test_results_come_back_in_query_order(stub):
+    StubSearchHandler.latency_for[QUERIES[0][0]] = 0.2
+
+    outcomes = _run(stub, None)
+
+    assert [(outcome.query, outcome.tbs) for outcome in outcomes] == QUERIES
+    assert [outcome.results[0]["title"] for outcome in outcomes] == [f"{query} #1" for query, _ in QUERIES]
+
+
+def test_rerun_within_the_ttl_sends_no_requests(stub, tmp_path):
+    cache = SearchCache(tmp_path, ttl=3600)
+    first = _run(stub, cache)
+    assert StubSearchHandler.requests == len(QUERIES)
+
+    second = _run(stub, cache)
+    assert StubSearchHandler.requests == len(QUERIES)
+    assert all(outcome.cached for outcome in second)
+    assert [outcome.results for outcome in second] == [outcome.results for outcome in first]
+
+
+def test_expired_entries_are_fetched_again(stub, tmp_path):
+    cache = SearchCache(tmp_path, ttl=3600)
+    _run(stub, cache)
+    for path in tmp_path.glob("*.json"):
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        entry["fetched_at"] -= 7200
+        path.write_text(json.dumps(entry), encoding="utf-8")
+
+    outcomes = _run(stub, cache)
+
+    assert not any(outcome.cached for outcome in outcomes)
+    assert StubSearchHandler.requests == 2 * len(QUERIES)
+
+
+def test_zero_ttl_disables_the_cache(stub, tmp_path):
+    config = {
+        "search": {"cache_ttl_hours": 0, "cache_dir": str(tmp_path), "requests_per_minute": 0, "base_url": stub}
+    }
+    for _ in range(2):
+        with SearchRunner.from_config(config) as runner:
+            assert runner.cache is None
+            list(runner.run(QUERIES))
+
+    assert StubSearchHandler.requests == 2 * len(QUERIES)
+    assert not list(tmp_path.iterdir())
+
+
+def test_failing_query_is_reported_and_skipped(stub, tmp_path):
+    failing = QUERIES[2][0]
+    StubSearchHandler.status_for[failing] = 500
+
+    with SearchRunner(workers=4, rate=0, cache=SearchCache(tmp_path), base_url=stub) as runner:
+        outcomes = list(runner.run(QUERIES))
+
+    assert [outcome.query for outcome in outcomes] == [query for query, _ in QUERIES]
+    assert "500" in outcomes[2].error and outcomes[2].results == []
+    assert all(outcome.results and not outcome.error for index, outcome in enumerate(outcomes) if index != 2)
+    assert runner.stats == {"fetched": len(QUERIES) - 1, "failed": 1}
+    assert len(list(tmp_path.glob("*.json"))) == len(QUERIES) - 1
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_spaces_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(5)]
+
+    assert waits == [0.0, 0.0, 0.0, 0.5, 0.5]
+    assert clock.now == 1.0
+
+    clock.now += 10
+    assert [bucket.acquire() for _ in range(4)] == [0.0, 0.0, 0.0, 0.5]
+
+
+def test_token_bucket_without_a_rate_never_waits():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=0, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert clock.sleeps == []
@@ -0,0 +1,23 @@
+"""Light CLI commands must start without importing the data stack."""
+
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.startup import COMMANDS, import_times
+
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "yaml", "flask")
+# find reads config.yaml, so it may load yaml but nothing heavier.
+FORBIDDEN = {
+    "--help": HEAVY_MODULES,
+    "pipeline --help": HEAVY_MODULES,
+    "find": ("pandas", "numpy", "pyarrow", "flask"),
+}
+
+
+@pytest.mark.parametrize(("label", "cli_args"), COMMANDS, ids=[label for label, _ in COMMANDS])
+def test_light_commands_skip_heavy_imports(workdir, label, cli_args):
+    modules = import_times(cli_args, workdir)
+
+    assert "src" in modules
+    assert [name for name in FORBIDDEN[label] if name in modules] == []
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from src.classify.batch import classify_frame
+from src.classify.text_cache import TextCache
+from src.filters.cmu_rules import compile_rules
+
+RULES = compile_rules(
+    {
+        "positive_terms": ["Mavs", "Colorado Mesa"],
+        "negative_terms": ["Carnegie Mellon"],
+        "neutral_terms": ["CMU band"],
+    }
+)
+FRAME = pd.DataFrame(
+    {
+        "post_url": ["p1", "p1", "p2", "p2", "p3"],
+        "post_caption_excerpt": ["Colorado Mesa halftime", "", "", "", "Carnegie Mellon"],
+        "comment_text": ["Go Mavs!", "go mavs!", "loud drumline", "CMU band rocks", "so proud"],
+    }
+)
+
+
+def test_cached_results_match_uncached(tmp_path):
+    expected = classify_frame(FRAME, RULES)
+
+    for _ in range(2):
+        cache = TextCache("v1", tmp_path / "texts.sqlite")
+        actual = classify_frame(FRAME, RULES, text_cache=cache)
+        cache.close()
+        pd.testing.assert_frame_equal(actual, expected)
+
+    assert cache.stats.rows_hit == cache.stats.rows == len(FRAME)
+
+
+def test_versions_sharing_a_file_keep_their_entries(tmp_path):
+    path = tmp_path / "texts.sqlite"
+    for version in ("v1", "v2"):
+        cache = TextCache(version, path)
+        classify_frame(FRAME, RULES, text_cache=cache)
+        cache.close()
+
+    cache = TextCache("v1", path)
+    classify_frame(FRAME, RULES, text_cache=cache)
+    cache.close()
+    assert cache.stats.hit_rate == 1.0
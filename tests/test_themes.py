@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from benchmarks.theme_tagger import LABELLED
+from src.classify.themes import DEFAULT_TAGGER, ThemeTagger, guess_themes
+
+CASES = LABELLED + [
+    ("he hates us", {"shout-outs"}),
+    ("great hats tonight", {"uniforms"}),
+    ("I'm upset about that", {"shout-outs"}),
+    ("the mixes were clean", {"sound"}),
+    ("more sets please", {"drill"}),
+]
+
+
+@pytest.mark.parametrize(("text", "expected"), CASES)
+def test_guess_themes(text, expected):
+    assert set(guess_themes(text)) == expected
+
+
+def test_batch_column_matches_tag():
+    texts = [text for text, _ in CASES]
+    column = DEFAULT_TAGGER.column(pd.Series([text.lower() for text in texts]))
+
+    assert [labels.split("|") for labels in column] == [DEFAULT_TAGGER.tag(text) for text in texts]
+
+
+def test_only_real_plurals_are_indexed():
+    index = ThemeTagger({"a": ["hat", "mix", "props", "glass"]}).index
+
+    assert set(index) == {"hat", "hats", "mix", "mixes", "props", "glass", "glasses"}
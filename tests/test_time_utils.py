@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from src.utils.time_utils import check_window, parse_dates, parse_window
+
+
+def _parsed(*values: str) -> list[pd.Timestamp]:
+    return parse_dates(pd.Series(values)).tolist()
+
+
+def test_day_month_dates_do_not_depend_on_earlier_values():
+    alone = _parsed("10/11/2025")
+    after_day_first = _parsed("13/11/2025", "10/11/2025")
+
+    assert after_day_first[1] == alone[0] == pd.Timestamp("2025-10-11", tz="UTC")
+    assert after_day_first[0] == pd.Timestamp("2025-11-13", tz="UTC")
+    assert _parsed("10/11/2025") == alone
+
+
+def test_mixed_formats_and_unreadable_dates():
+    parsed = _parsed("2025-09-26T18:47:00Z", "3 days ago", "", "Oct 10, 2025", "31-12-2025 10:00")
+
+    assert parsed[0] == pd.Timestamp("2025-09-26 18:47", tz="UTC")
+    assert pd.isna(parsed[1]) and pd.isna(parsed[2])
+    assert parsed[3] == pd.Timestamp("2025-10-10", tz="UTC")
+    assert parsed[4] == pd.Timestamp("2025-12-31 10:00", tz="UTC")
+
+
+def test_window_specs():
+    now = datetime(2025, 10, 1, tzinfo=timezone.utc)
+
+    assert parse_window("21d", now=now) == (now - timedelta(days=21), now)
+    assert parse_window("6w", now=now)[0] == now - timedelta(weeks=6)
+    assert parse_window("48h", now=now)[0] == now - timedelta(hours=48)
+    assert check_window("all") == "all"
+
+
+@pytest.mark.parametrize("spec", ["30days", "2m", "1y", "21D", "", "d"])
+def test_invalid_window_specs_raise(spec):
+    with pytest.raises(ValueError):
+        check_window(spec)